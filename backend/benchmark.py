@@ -0,0 +1,248 @@
+import sys
+import json
+import time
+import platform
+import argparse
+import itertools
+import tracemalloc
+from datetime import datetime
+import numpy as np
+from backend.models.population import Population
+from backend.services.ga_service import (
+    calculate_chromosome_length, create_fitness_function, create_bit_population, build_batch_operators,
+    create_real_population, build_real_operators, evolution_parameters
+)
+from backend.services.operators import TournamentSelection, OnePointCrossover, OnePointMutation, SimpleInversion
+
+# Benchmark etapów algorytmu dla silników obiektowego i macierzowego NumPy (oraz opcjonalnie
+# kodowania rzeczywistego – silnik "real").
+# Każdy etap mierzony jest osobno na tej samej populacji, w siatce rozmiarów populacji,
+# liczby zmiennych i precyzji (czyli długości chromosomu). Wynik zapisywany jest do pliku JSON,
+# który można porównać z poprzednim przebiegiem (--compare), by wychwycić regresje.
+
+STAGES = ("selection", "crossover", "mutation", "inversion", "decode", "evaluate", "evolve")
+
+def object_stages(config: dict, rng: np.random.Generator) -> dict:
+    """
+    Przygotowuje populację obiektową i zwraca słownik etap -> funkcja bez argumentów.
+    Mutacja i inwersja mierzone są z prawdopodobieństwem 1, żeby zawsze wykonywały pracę.
+    """
+    fitness_function = create_fitness_function(config)
+    num_vars = config["variables"]
+    chromosome_length = calculate_chromosome_length(fitness_function.search_range, config["precision"]) * num_vars
+    population = Population(config["population_size"], fitness_function.search_range, num_vars=num_vars, rng=rng)
+    population.initialize(chromosome_length)
+    population.evaluate(fitness_function)
+    selection, crossover = TournamentSelection(3), OnePointCrossover()
+    mutation, inversion = OnePointMutation(), SimpleInversion()
+    individuals = population.individuals
+    genes = [ind.chromosome.value for ind in individuals]
+    X = population.decoder.decode_values(genes)
+
+    def evolve():
+        population.evolve(fitness_function, selection, crossover, mutation, inversion,
+                          **evolution_parameters(config))
+
+    return {
+        "selection": lambda: selection.select(population, rng=rng),
+        "crossover": lambda: [crossover.crossover(p1, p2, rng) for p1, p2 in zip(individuals[::2], individuals[1::2])],
+        "mutation": lambda: [mutation.mutate(ind, 1.0, rng) for ind in individuals],
+        "inversion": lambda: [inversion.invert(ind, 1.0, rng) for ind in individuals],
+        "decode": lambda: population.decoder.decode_values(genes),
+        "evaluate": lambda: fitness_function.evaluate_batch(X),
+        "evolve": evolve
+    }, chromosome_length
+
+def numpy_stages(config: dict, rng: np.random.Generator) -> dict:
+    """
+    Przygotowuje populację bitową i zwraca słownik etap -> funkcja bez argumentów.
+    """
+    fitness_function = create_fitness_function(config)
+    population = create_bit_population(config, fitness_function, rng=rng)
+    population.evaluate(fitness_function)
+    selection, crossover, mutation, inversion = build_batch_operators(config)
+    length = population.chromosome_length
+    parents1, parents2 = population.genes[0::2], population.genes[1::2]
+    rows = min(len(parents1), len(parents2))
+    parents1, parents2 = parents1[:rows], parents2[:rows]
+    work = population.genes.copy()
+    bits = population.unpack()
+    X = population.phenotypes.copy()
+
+    def evolve():
+        population.evolve(fitness_function, selection, crossover, mutation, inversion, **evolution_parameters(config))
+
+    return {
+        "selection": lambda: selection.select(population.fitness, rng),
+        "crossover": lambda: crossover.crossover(parents1.copy(), parents2.copy(), length, rng),
+        "mutation": lambda: mutation.mutate(work, length, 1.0, rng),
+        "inversion": lambda: inversion.invert(work, length, 1.0, rng),
+        "decode": lambda: population.decoder.decode(bits),
+        "evaluate": lambda: fitness_function.evaluate_batch(X),
+        "evolve": evolve
+    }, length
+
+def real_stages(config: dict, rng: np.random.Generator) -> dict:
+    """
+    Przygotowuje populację o kodowaniu rzeczywistym i zwraca słownik etap -> funkcja bez argumentów.
+    Kodowanie rzeczywiste nie ma inwersji ani dekodowania – te etapy mierzą pustą funkcję.
+    Długość chromosomu to liczba zmiennych (geny float64).
+    """
+    fitness_function = create_fitness_function(config)
+    population = create_real_population(config, fitness_function, rng=rng)
+    population.evaluate(fitness_function)
+    selection, crossover, mutation, inversion = build_real_operators(config)
+    parents1, parents2 = population.genes[0::2], population.genes[1::2]
+    rows = min(len(parents1), len(parents2))
+    parents1, parents2 = parents1[:rows], parents2[:rows]
+    work = population.genes.copy()
+    X = population.phenotypes.copy()
+
+    def evolve():
+        population.evolve(fitness_function, selection, crossover, mutation, inversion, **evolution_parameters(config))
+
+    return {
+        "selection": lambda: selection.select(population.fitness, rng),
+        "crossover": lambda: crossover.crossover(parents1, parents2, rng),
+        "mutation": lambda: mutation.mutate(work, population.search_range, 1.0, rng),
+        "inversion": lambda: None,
+        "decode": lambda: None,
+        "evaluate": lambda: fitness_function.evaluate_batch(X),
+        "evolve": evolve
+    }, population.num_vars
+
+ENGINES = {"object": object_stages, "numpy": numpy_stages, "real": real_stages}
+
+def best_time(function, repeat: int) -> float:
+    """
+    Najkrótszy z repeat pomiarów czasu wykonania (w sekundach).
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def memory_usage(function):
+    """
+    Pamięć zaalokowana przez jedno wykonanie funkcji (tracemalloc).
+    :return: para (szczytowa liczba bajtów, liczba bloków pamięci utworzonych przez wywołanie
+             i wciąż żywych przy jego wyniku – np. nowych osobników zwróconych przez operator)
+    """
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        del result
+        return peak, blocks
+    finally:
+        tracemalloc.stop()
+
+def run_benchmark(engines=("object", "numpy"), population_sizes=(100, 1000), variables=(10,), precisions=(6,),
+                  stages=STAGES, repeat: int = 3, seed: int = 0) -> dict:
+    """
+    Mierzy wszystkie etapy dla każdej kombinacji parametrów.
+    :return: słownik z metadanymi środowiska i listą wyników (jeden wpis na etap i kombinację)
+    """
+    results = []
+    for engine, population_size, num_vars, precision in itertools.product(engines, population_sizes, variables, precisions):
+        config = {"population_size": population_size, "variables": num_vars, "precision": precision, "seed": seed}
+        rng = np.random.default_rng(seed)
+        functions, chromosome_length = ENGINES[engine](config, rng)
+        for stage in stages:
+            function = functions[stage]
+            function()  # rozgrzewka
+            seconds = best_time(function, repeat)
+            peak_bytes, allocated_blocks = memory_usage(function)
+            results.append({
+                "engine": engine,
+                "population_size": population_size,
+                "variables": num_vars,
+                "precision": precision,
+                "chromosome_length": chromosome_length,
+                "stage": stage,
+                "seconds": seconds,
+                "ns_per_individual": seconds / population_size * 1e9,
+                "individuals_per_sec": population_size / seconds if seconds > 0 else None,
+                "peak_memory_bytes": peak_bytes,
+                "allocated_blocks": allocated_blocks,
+                "blocks_per_individual": allocated_blocks / population_size
+            })
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed
+        },
+        "results": results
+    }
+
+def result_key(entry: dict) -> tuple:
+    return entry["engine"], entry["population_size"], entry["variables"], entry["precision"], entry["stage"]
+
+def compare(baseline: dict, current: dict, threshold: float = 1.2) -> list:
+    """
+    Porównuje czasy etapów z poprzednim wynikiem.
+    :param threshold: iloraz czasu (bieżący / poprzedni), powyżej którego etap uznawany jest za regresję
+    :return: lista wpisów z ilorazem ratio i flagą regression dla etapów obecnych w obu wynikach
+    """
+    previous = {result_key(entry): entry for entry in baseline["results"]}
+    comparison = []
+    for entry in current["results"]:
+        old = previous.get(result_key(entry))
+        if old is None or old["seconds"] <= 0:
+            continue
+        ratio = entry["seconds"] / old["seconds"]
+        comparison.append({**dict(zip(("engine", "population_size", "variables", "precision", "stage"),
+                                      result_key(entry))),
+                           "ratio": ratio, "regression": ratio > threshold})
+    return comparison
+
+def format_table(report: dict) -> str:
+    lines = [f"{'silnik':<7} {'populacja':>9} {'zmienne':>7} {'bity':>6}  {'etap':<10} {'ns/osobnika':>12} "
+             f"{'osobniki/s':>12} {'pamięć [KiB]':>12} {'bloki/osobnika':>14}"]
+    for entry in report["results"]:
+        lines.append(f"{entry['engine']:<7} {entry['population_size']:>9} {entry['variables']:>7} "
+                     f"{entry['chromosome_length']:>6}  {entry['stage']:<10} {entry['ns_per_individual']:>12.0f} "
+                     f"{entry['individuals_per_sec'] or 0:>12.0f} {entry['peak_memory_bytes'] / 1024:>12.1f} "
+                     f"{entry['blocks_per_individual']:>14.2f}")
+    return "\n".join(lines)
+
+def parse_list(value: str, cast=int) -> list:
+    return [cast(item) for item in value.split(",") if item]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark etapów algorytmu genetycznego.")
+    parser.add_argument("--engines", default="object,numpy",
+                        help="silniki oddzielone przecinkami (object, numpy, real)")
+    parser.add_argument("--population-sizes", default="100,1000", help="rozmiary populacji")
+    parser.add_argument("--variables", default="10", help="liczby zmiennych")
+    parser.add_argument("--precisions", default="6", help="precyzje (wyznaczają długość chromosomu)")
+    parser.add_argument("--stages", default=",".join(STAGES), help="mierzone etapy")
+    parser.add_argument("--repeat", type=int, default=3, help="liczba powtórzeń pomiaru (liczy się najlepszy)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json", help="plik wynikowy JSON")
+    parser.add_argument("--compare", help="poprzedni plik wynikowy do porównania")
+    parser.add_argument("--threshold", type=float, default=1.2, help="iloraz czasów uznawany za regresję")
+    arguments = parser.parse_args()
+
+    report = run_benchmark(parse_list(arguments.engines, str), parse_list(arguments.population_sizes),
+                           parse_list(arguments.variables), parse_list(arguments.precisions),
+                           parse_list(arguments.stages, str), arguments.repeat, arguments.seed)
+    with open(arguments.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(format_table(report))
+
+    if arguments.compare:
+        with open(arguments.compare) as f:
+            comparison = compare(json.load(f), report, arguments.threshold)
+        regressions = [entry for entry in comparison if entry["regression"]]
+        for entry in regressions:
+            print(f"Regresja: {entry['engine']} {entry['stage']} (populacja {entry['population_size']}, "
+                  f"zmienne {entry['variables']}): {entry['ratio']:.2f}x")
+        sys.exit(1 if regressions else 0)
@@ -1,13 +1,149 @@
-from flask import Blueprint, request, jsonify
-from backend.services.ga_service import run_ga
-from backend.services.io_service import persist_result
+import os
+import json
+from flask import Blueprint, Response, request, jsonify, current_app, send_file
+from backend.services.job_service import JobManager, QueueFullError
+
+# Serwisy algorytmu (NumPy, operatory, zapis wyników) importowane są w obsłudze żądań,
+# a nie przy starcie – create_app() nie płaci za nie, dopóki nie są potrzebne.
 
 ga_blueprint = Blueprint("ga", __name__, url_prefix="/api/ga")
 
+def get_job_manager() -> JobManager:
+    """
+    Zwraca pulę zleceń aplikacji, tworząc ją przy pierwszym użyciu.
+    Limity pochodzą z konfiguracji aplikacji: GA_JOB_WORKERS, GA_JOB_QUEUE_SIZE, GA_JOB_TIMEOUT,
+    a zapis wyników – tak jak dla /run – z GA_RESULT_SINKS i GA_RESULTS_DIR.
+    """
+    manager = current_app.extensions.get("ga_jobs")
+    if manager is None:
+        manager = JobManager(
+            max_workers=current_app.config.get("GA_JOB_WORKERS", 2),
+            max_queue=current_app.config.get("GA_JOB_QUEUE_SIZE", 16),
+            timeout=current_app.config.get("GA_JOB_TIMEOUT"),
+            result_sinks=current_app.config.get("GA_RESULT_SINKS", ["npz"]),
+            results_dir=current_app.config.get("GA_RESULTS_DIR", "results")
+        )
+        current_app.extensions["ga_jobs"] = manager
+    return manager
+
+def get_metrics_registry():
+    """
+    Zwraca zbiór pomiarów przebiegów z włączonym "instrument", tworząc go przy pierwszym użyciu.
+    """
+    registry = current_app.extensions.get("ga_metrics")
+    if registry is None:
+        from backend.services.instrumentation import MetricsRegistry
+        registry = MetricsRegistry(current_app.config.get("GA_METRICS_RUNS", 50))
+        current_app.extensions["ga_metrics"] = registry
+    return registry
+
+def get_result_writer():
+    """
+    Zwraca wątek zapisujący wyniki w tle (ResultWriter), tworząc go przy pierwszym użyciu.
+    Rodzaje zapisu i katalog pochodzą z konfiguracji aplikacji: GA_RESULT_SINKS, GA_RESULTS_DIR.
+    """
+    writer = current_app.extensions.get("ga_results")
+    if writer is None:
+        from backend.services.io_service import ResultWriter, create_sinks
+        sinks = create_sinks(current_app.config.get("GA_RESULT_SINKS", ["npz"]),
+                             current_app.config.get("GA_RESULTS_DIR", "results"))
+        writer = ResultWriter(sinks)
+        current_app.extensions["ga_results"] = writer
+    return writer
+
 @ga_blueprint.route("/run", methods=["POST"])
 def run():
+    from backend.services.ga_service import run_ga
     config = request.get_json()
     result = run_ga(config)
-    persist_result(result)
+    get_metrics_registry().record(result)
+    # Zapis odbywa się w tle – odpowiedź nie czeka na dysk
+    run_id = get_result_writer().submit(result)
+
+    return jsonify({**result, "run_id": run_id})
+
+@ga_blueprint.route("/metrics", methods=["GET"])
+def metrics():
+    return jsonify(get_metrics_registry().summary())
+
+@ga_blueprint.route("/results/<run_id>/plot", methods=["GET"])
+def plot(run_id):
+    # Wykres renderowany jest na żądanie z historii zapisanej w .npz i zachowywany obok niej
+    directory = os.path.abspath(current_app.config.get("GA_RESULTS_DIR", "results"))
+    if os.path.basename(run_id) != run_id or run_id.startswith("."):
+        return jsonify({"error": "Nie znaleziono wyniku."}), 404
+    filename = os.path.join(directory, f"{run_id}.png")
+    if not os.path.exists(filename):
+        from backend.services.io_service import load_history, render_plot
+        history = load_history(directory, run_id)
+        if history is None:
+            return jsonify({"error": "Nie znaleziono wyniku."}), 404
+        render_plot(history[1], filename)
+
+    return send_file(filename, mimetype="image/png")
+
+@ga_blueprint.route("/sweep", methods=["POST"])
+def sweep():
+    from backend.services.sweep_service import run_sweep
+    try:
+        return jsonify(run_sweep(request.get_json()))
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+
+def stream_events(config: dict, registry=None):
+    """
+    Zamienia generator iter_ga na ciąg zdarzeń (nazwa, dane): "epoch" po każdej epoce
+    i "result" z podsumowaniem przebiegu na końcu.
+    :param registry: opcjonalny MetricsRegistry, do którego trafiają pomiary przebiegu
+    """
+    from backend.services.ga_service import iter_ga
+    stream = iter_ga(config)
+    try:
+        while True:
+            yield "epoch", next(stream)
+    except StopIteration as stop:
+        if registry is not None:
+            registry.record(stop.value)
+        yield "result", stop.value
+
+@ga_blueprint.route("/stream", methods=["POST"])
+def stream():
+    # Migawki epok wysyłane są na bieżąco jako Server-Sent Events lub, z ?format=ndjson, jako JSON Lines.
+    # Zerwanie połączenia zamyka generator, a wraz z nim przebieg algorytmu.
+    config = request.get_json()
+    # Generator działa poza kontekstem aplikacji, więc rejestr pomiarów pobierany jest wcześniej
+    events = stream_events(config, get_metrics_registry())
+    if request.args.get("format", "sse").lower() == "ndjson":
+        lines = (json.dumps({"event": event, **data}) + "\n" for event, data in events)
+        return Response(lines, mimetype="application/x-ndjson")
+
+    messages = (f"event: {event}\ndata: {json.dumps(data)}\n\n" for event, data in events)
+    return Response(messages, mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@ga_blueprint.route("/jobs", methods=["POST"])
+def submit_job():
+    config = request.get_json()
+    try:
+        job_id = get_job_manager().submit(config)
+    except QueueFullError as error:
+        return jsonify({"error": str(error)}), 429
+
+    return jsonify({"job_id": job_id, "status": "queued"}), 202
+
+@ga_blueprint.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "Nie znaleziono zlecenia."}), 404
+
+    return jsonify(job)
+
+@ga_blueprint.route("/jobs/<job_id>", methods=["DELETE"])
+def cancel_job(job_id):
+    manager = get_job_manager()
+    if not manager.cancel(job_id):
+        if manager.get(job_id) is None:
+            return jsonify({"error": "Nie znaleziono zlecenia."}), 404
+        return jsonify({"error": "Zlecenie już się zakończyło."}), 409
 
-    return jsonify(result)
+    return jsonify(manager.get(job_id)), 202
@@ -0,0 +1,345 @@
+import heapq
+import numpy as np
+from abc import ABC, abstractmethod
+from backend.services.replacement import GENERATIONAL, STEADY_STATE, offspring_plan, survivors
+from backend.services.batch_operators import BatchSelectionOperator, smallest_indices
+
+# Wspólna część populacji przechowywanych jako macierze NumPy (BitPopulation, RealPopulation):
+# selekcja i dobór par, elitaryzm, strategie zastępowania, ocena z pamięcią podręczną,
+# śledzenie najlepszego rozwiązania i punkt kontrolny. Podklasy dostarczają inicjalizację,
+# dekodowanie genów oraz wywołania operatorów właściwych dla swojego kodowania.
+#
+# Wiersze populacji to krotka równoległych tablic (genes, fitness, ...) – BitPopulation
+# przechowuje w niej dodatkowo zdekodowane fenotypy, by nie dekodować ich ponownie.
+
+class ArrayPopulation(ABC):
+    def __init__(self, population_size: int, search_range, num_vars: int,
+                 rng: np.random.Generator = None, fitness_cache=None):
+        """
+        :param population_size: liczba osobników w populacji
+        :param search_range: zakres poszukiwań [a, b]
+        :param num_vars: liczba zmiennych
+        :param rng: generator liczb losowych NumPy
+        :param fitness_cache: opcjonalna pamięć podręczna FitnessCache (bajty wiersza genów -> fitness)
+        """
+        self.population_size = population_size
+        self.search_range = search_range
+        self.num_vars = num_vars
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.fitness_cache = fitness_cache
+        self.evaluations = 0  # liczba faktycznych wywołań funkcji celu
+        self.timer = None  # opcjonalny EpochTimer mierzący czas etapów evolve
+        self.fitness = np.full(population_size, np.nan)
+        # Najlepszy osobnik bieżącej populacji i najlepsze rozwiązanie znalezione dotąd
+        self.best_index = None
+        self.incumbent_fitness = np.inf
+        self.incumbent_phenotype = None
+        self.incumbent_genes = None
+
+    @abstractmethod
+    def decode_rows(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Dekoduje wiersze macierzy genów.
+        :return: macierz fenotypów o kształcie (len(genes), num_vars)
+        """
+        pass
+
+    @abstractmethod
+    def _crossover(self, crossover_operator, children1: np.ndarray, children2: np.ndarray):
+        """
+        Krzyżuje parami wiersze dwóch macierzy genów potomków.
+        :return: para macierzy genów potomków po krzyżowaniu
+        """
+        pass
+
+    @abstractmethod
+    def _vary(self, offspring: np.ndarray, mutation_operator, inversion_operator,
+              mutation_probability: float, inversion_probability: float) -> None:
+        """
+        Zmienia w miejscu macierz genów potomstwa po krzyżowaniu (mutacja i etapy właściwe dla kodowania).
+        """
+        pass
+
+    def _rows(self) -> tuple:
+        # Równoległe tablice wierszy populacji – przestawiane i wycinane razem
+        return self.genes, self.fitness
+
+    def _set_rows(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        self.genes, self.fitness = genes, fitness
+
+    def _phenotype_rows(self, rows: tuple, pending: np.ndarray) -> np.ndarray:
+        # Fenotypy wierszy pending podawane funkcji celu
+        return self.decode_rows(rows[0][pending])
+
+    def evaluate(self, fitness_function) -> None:
+        """
+        Ocena funkcji celu (fitness) dla osobników, których wartość nie jest jeszcze znana (NaN).
+        Po ocenie aktualizowany jest najlepszy osobnik populacji i najlepsze rozwiązanie dotąd.
+        :param fitness_function: instancja klasy FitnessFunction z metodą evaluate_batch(X)
+        """
+        self._score(fitness_function, self._rows())
+        self._track_best()
+
+    def _score(self, fitness_function, rows: tuple) -> None:
+        # Uzupełnia w miejscu fitness (i pozostałe tablice) wierszy o nieznanej wartości (NaN)
+        genes, fitness = rows[0], rows[1]
+        pending = np.flatnonzero(np.isnan(fitness))
+        if len(pending) == 0:
+            return
+        phenotypes = self._phenotype_rows(rows, pending)
+
+        # Wiersze, których genotyp jest w pamięci podręcznej, nie są oceniane ponownie
+        if self.fitness_cache is not None:
+            cached = np.array([self.fitness_cache.get(row.tobytes()) for row in genes[pending]], dtype=float)
+            hit = ~np.isnan(cached)
+            fitness[pending[hit]] = cached[hit]
+            pending, phenotypes = pending[~hit], phenotypes[~hit]
+            if len(pending) == 0:
+                return
+
+        fitness[pending] = fitness_function.evaluate_batch(phenotypes)
+        self.evaluations += len(pending)
+        if self.fitness_cache is not None:
+            for row, value in zip(genes[pending], fitness[pending].tolist()):
+                self.fitness_cache.put(row.tobytes(), value)
+
+    def _track_best(self) -> None:
+        """
+        Jedno przejście O(n) po wektorze fitness – raport najlepszego osobnika jest potem O(1).
+        """
+        self.best_index = int(np.argmin(self.fitness))
+        if self.fitness[self.best_index] < self.incumbent_fitness:
+            self.incumbent_fitness = float(self.fitness[self.best_index])
+            self.incumbent_phenotype = self.phenotypes[self.best_index].tolist()
+            self.incumbent_genes = self.genes[self.best_index].copy()
+
+    def best_solution(self):
+        """
+        Zwraca parę (x, fitness) najlepszego osobnika bieżącej populacji.
+        """
+        return self.phenotypes[self.best_index].tolist(), float(self.fitness[self.best_index])
+
+    def incumbent_solution(self):
+        """
+        Zwraca parę (x, fitness) najlepszego rozwiązania znalezionego od początku przebiegu.
+        """
+        return self.incumbent_phenotype, self.incumbent_fitness
+
+    def export_arrays(self):
+        """
+        Zwraca stan populacji jako parę (macierz genów, wektor fitness) z najlepszym
+        rozwiązaniem dotąd dołączonym jako ostatni wiersz – do zapisu w punkcie kontrolnym.
+        """
+        genes = np.vstack((self.genes, self.incumbent_genes[None, :]))
+        return genes, np.append(self.fitness, self.incumbent_fitness)
+
+    def import_arrays(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Odtwarza stan populacji z macierzy zapisanej przez export_arrays.
+        """
+        if genes.shape != (self.population_size + 1, self.genes.shape[1]) or genes.dtype != self.genes.dtype:
+            raise ValueError("Punkt kontrolny nie pasuje do rozmiaru populacji lub długości chromosomu.")
+        self.genes = np.array(genes[:-1])
+        self.fitness = np.array(fitness[:-1], dtype=float)
+        self.incumbent_genes = np.array(genes[-1])
+        self.incumbent_fitness = float(fitness[-1])
+        self.incumbent_phenotype = self.decode_rows(self.incumbent_genes[None, :])[0].tolist()
+        self.best_index = int(np.argmin(self.fitness))
+
+    def get_best(self, n: int) -> np.ndarray:
+        """
+        Zwraca indeksy n najlepszych osobników (niższa wartość fitness oznacza lepsze rozwiązanie).
+        :param n: liczba najlepszych osobników do zwrócenia
+        :return: tablica indeksów n najlepszych osobników
+        """
+        return smallest_indices(self.fitness, n)
+
+    def select_parents(self, selection_operator: BatchSelectionOperator) -> tuple:
+        """
+        Wybiera rodziców operatorem selekcji.
+        :return: wiersze wybranych rodziców (macierz genów, fitness, ...) – kopie, niezależne
+                 od późniejszych zmian populacji
+        """
+        parents = selection_operator.select(self.fitness, self.rng)
+        if self.timer is not None:
+            self.timer.lap("select")
+        return tuple(rows[parents] for rows in self._rows())
+
+    def breed(self, offspring_count: int,
+              selection_operator: BatchSelectionOperator,
+              crossover_operator,
+              mutation_operator,
+              inversion_operator,
+              crossover_probability: float,
+              mutation_probability: float,
+              inversion_probability: float,
+              parents: tuple = None):
+        """
+        Tworzy potomstwo bieżącej populacji: selekcja, krzyżowanie, a następnie mutacja
+        i etapy właściwe dla kodowania (_vary).
+        :param offspring_count: liczba potomków
+        :param parents: wiersze rodziców wybranych wcześniej przez select_parents
+                        (domyślnie selekcja wykonywana jest dla tego wywołania)
+        :return: wiersze potomstwa (macierz genów, fitness, ...) – potomkowie identyczni z rodzicem
+                 dziedziczą jego wartości, nowi mają fitness NaN
+        """
+        timer = self.timer
+        if parents is None:
+            parents = self.select_parents(selection_operator)
+        parent_genes, parent_fitness = parents[0], parents[1]
+
+        # Losowanie wszystkich par rodziców naraz – dwa różne miejsca na liście rodziców, jak w random.sample
+        pair_count = (offspring_count + 1) // 2
+        first = self.rng.integers(0, len(parent_genes), size=pair_count)
+        second = (first + self.rng.integers(1, len(parent_genes), size=pair_count)) % len(parent_genes)
+
+        # Decyzja o krzyżowaniu podejmowana jednym wektorem logicznym
+        crossed = self.rng.random(pair_count) < crossover_probability
+        children1, children2 = parent_genes[first], parent_genes[second]
+        if crossed.any():
+            children1[crossed], children2[crossed] = self._crossover(
+                crossover_operator, children1[crossed], children2[crossed])
+
+        # Potomkowie w kolejności (potomek 1, potomek 2) dla kolejnych par
+        offspring = np.stack((children1, children2), axis=1).reshape(-1, self.genes.shape[1])[:offspring_count]
+        # Indeks rodzica, z którego potomek został przepisany bez krzyżowania (-1 po krzyżowaniu)
+        sources = np.where(np.repeat(crossed, 2), -1, np.stack((first, second), axis=1).reshape(-1))[:offspring_count]
+        if timer is not None:
+            timer.lap("crossover")
+
+        # Mutacja całego potomstwa naraz (w miejscu, wiersze są kopiami rodziców)
+        self._vary(offspring, mutation_operator, inversion_operator, mutation_probability, inversion_probability)
+
+        # Potomkowie identyczni z rodzicem dziedziczą znaną wartość fitness (i pozostałe tablice wierszy)
+        unchanged = sources >= 0
+        unchanged[unchanged] = np.all(offspring[unchanged] == parent_genes[sources[unchanged]], axis=1)
+        known = np.where(unchanged, sources, -1)
+        fitness = np.where(known >= 0, parent_fitness[known], np.nan)
+        return (offspring, fitness) + tuple(rows[known] for rows in parents[2:])
+
+    def evolve(self, fitness_function,
+           selection_operator: BatchSelectionOperator,
+           crossover_operator,
+           mutation_operator,
+           inversion_operator,
+           crossover_probability: float,
+           mutation_probability: float,
+           inversion_probability: float,
+           elitism_count: int,
+           replacement: str = GENERATIONAL,
+           offspring_count: int = None):
+        """
+        Jedna epoka algorytmu.
+        :param replacement: strategia zastępowania – "generational" (cała populacja poza elitami),
+                            "steady_state", "mu_plus_lambda" lub "mu_comma_lambda"
+        :param offspring_count: liczba potomków w kroku strategii innej niż pokoleniowa
+                                (k dla steady_state, lambda dla strategii (mu, lambda))
+        """
+        timer = self.timer
+        if timer is not None:
+            timer.start_epoch(self.evaluations)
+
+        # Ocena populacji
+        self.evaluate(fitness_function)
+        if timer is not None:
+            timer.lap("evaluate")
+
+        operators = (selection_operator, crossover_operator, mutation_operator, inversion_operator,
+                     crossover_probability, mutation_probability, inversion_probability)
+        if replacement != GENERATIONAL:
+            self._evolve_incremental(fitness_function, operators, elitism_count, replacement, offspring_count)
+            if timer is not None:
+                timer.end_epoch(self.evaluations)
+            return
+
+        offspring = self.breed(self.population_size - elitism_count, *operators)
+
+        # Zachowanie elitarnych osobników (najlepszych) – elity zachowują znaną wartość fitness
+        elite = self.get_best(elitism_count)
+        self._set_rows(*(np.concatenate((rows[elite], new)) for rows, new in zip(self._rows(), offspring)))
+        if timer is not None:
+            timer.lap("elitism")
+
+        # Ponowna ocena populacji – oceniani są tylko nowi osobnicy
+        self.evaluate(fitness_function)
+        if timer is not None:
+            timer.lap("evaluate")
+            timer.end_epoch(self.evaluations)
+
+    def _sort(self) -> None:
+        # Populacja uporządkowana rosnąco według fitness – sortowanie tylko, gdy porządek nie jest zachowany
+        if np.any(self.fitness[1:] < self.fitness[:-1]):
+            order = np.argsort(self.fitness, kind="stable")
+            self._set_rows(*(rows[order] for rows in self._rows()))
+
+    def _evolve_incremental(self, fitness_function, operators: tuple, elitism_count: int, replacement: str,
+                            offspring_count: int = None) -> None:
+        """
+        Strategie z oceną przyrostową: oceniani są tylko nowi potomkowie, a populacja pozostaje
+        uporządkowana według fitness – potomkowie wstawiani są w miejsca wyznaczone przez searchsorted.
+        """
+        timer = self.timer
+        step, steps = offspring_plan(replacement, self.population_size, elitism_count, offspring_count)
+        if replacement == STEADY_STATE:
+            self._evolve_steady_state(fitness_function, operators, step, steps)
+            return
+        self._sort()
+        keep = survivors(replacement, self.population_size, elitism_count, step)
+
+        for _ in range(steps):
+            offspring = self.breed(step, *operators)
+            self._score(fitness_function, offspring)
+            order = np.argsort(offspring[1], kind="stable")
+            offspring = [rows[order] for rows in offspring]
+            if timer is not None:
+                timer.lap("evaluate")
+
+            # Wstawienie uporządkowanych potomków między keep najlepszych osobników
+            positions = np.searchsorted(self.fitness[:keep], offspring[1], side="right")
+            self._set_rows(*(np.insert(rows[:keep], positions, new, axis=0)[:self.population_size]
+                             for rows, new in zip(self._rows(), offspring)))
+            self._track_best()
+            if timer is not None:
+                timer.lap("elitism")
+
+    def _evolve_steady_state(self, fitness_function, operators: tuple, step: int, steps: int) -> None:
+        """
+        Strategia steady_state: rodzice wybierani są raz na epokę, a potomkowie każdego kroku
+        zastępują w miejscu najgorsze wiersze wskazywane przez kopiec – krok kosztuje O(k log n)
+        zamiast selekcji i przebudowy całej populacji.
+        """
+        timer = self.timer
+        parents = self.select_parents(operators[0])
+        # Kopiec najgorszych osobników: (-fitness, indeks wiersza)
+        worst = [(-value, index) for index, value in enumerate(self.fitness.tolist())]
+        heapq.heapify(worst)
+
+        for _ in range(steps):
+            offspring = self.breed(step, *operators, parents=parents)
+            self._score(fitness_function, offspring)
+            if timer is not None:
+                timer.lap("evaluate")
+
+            replaced = [heapq.heappop(worst)[1] for _ in range(len(offspring[0]))]
+            for rows, new in zip(self._rows(), offspring):
+                rows[replaced] = new
+            for index, value in zip(replaced, offspring[1].tolist()):
+                heapq.heappush(worst, (-value, index))
+            self._track_replaced(replaced)
+            if timer is not None:
+                timer.lap("elitism")
+
+    def _track_replaced(self, replaced: list) -> None:
+        """
+        Aktualizacja najlepszego osobnika po zastąpieniu wierszy replaced – O(k) zamiast przejścia po populacji.
+        """
+        if self.best_index in replaced:
+            self._track_best()
+            return
+        candidate = replaced[int(np.argmin(self.fitness[replaced]))]
+        if self.fitness[candidate] < self.fitness[self.best_index]:
+            self.best_index = candidate
+            if self.fitness[candidate] < self.incumbent_fitness:
+                self.incumbent_fitness = float(self.fitness[candidate])
+                self.incumbent_phenotype = self.phenotypes[candidate].tolist()
+                self.incumbent_genes = self.genes[candidate].copy()
@@ -0,0 +1,105 @@
+import numpy as np
+from backend.models.decoder import BinaryDecoder
+from backend.models.array_population import ArrayPopulation
+from backend.services.batch_operators import BatchCrossoverOperator, BatchMutationOperator, BatchInversionOperator
+
+class BitPopulation(ArrayPopulation):
+    def __init__(self, population_size: int, search_range=(-65.536, 65.536), num_vars: int = 1,
+                 gray: bool = False, rng: np.random.Generator = None, fitness_cache=None):
+        """
+        Populacja przechowywana jako jedna spakowana macierz bitów (wiersz = osobnik)
+        wraz z wektorem wartości funkcji celu.
+        :param population_size: liczba osobników w populacji
+        :param search_range: zakres poszukiwań [a, b]
+        :param num_vars: liczba zmiennych (segmentów chromosomu)
+        :param gray: czy geny zapisane są w kodzie Graya
+        :param rng: generator liczb losowych NumPy
+        :param fitness_cache: opcjonalna pamięć podręczna FitnessCache (spakowany wiersz -> fitness)
+        """
+        super().__init__(population_size, search_range, num_vars, rng=rng, fitness_cache=fitness_cache)
+        self.gray = gray
+        self.decoder = None
+        self.chromosome_length = 0
+        self.genes = np.empty((population_size, 0), dtype=np.uint8)
+        self.phenotypes = np.full((population_size, num_vars), np.nan)
+
+    def initialize(self, chromosome_length: int) -> None:
+        """
+        Losowa inicjalizacja populacji. Chromosom składa się z num_vars następujących po sobie segmentów.
+        :param chromosome_length: długość całego chromosomu
+        """
+        self.chromosome_length = chromosome_length
+        self.decoder = BinaryDecoder(self.search_range, chromosome_length, num_vars=self.num_vars, gray=self.gray)
+        bits = self.rng.integers(0, 2, size=(self.population_size, chromosome_length), dtype=np.uint8)
+        self.genes = self.pack(bits)
+        self.fitness = np.full(self.population_size, np.nan)
+        self.phenotypes = np.full((self.population_size, self.num_vars), np.nan)
+
+    @staticmethod
+    def pack(bits: np.ndarray) -> np.ndarray:
+        """
+        Pakuje macierz bitów 0/1 do macierzy bajtów (8 genów na bajt).
+        """
+        return np.packbits(bits, axis=1)
+
+    def unpack(self) -> np.ndarray:
+        """
+        Rozpakowuje macierz genów do macierzy bitów 0/1 o kształcie (population_size, chromosome_length).
+        """
+        return np.unpackbits(self.genes, axis=1, count=self.chromosome_length)
+
+    def decode(self) -> np.ndarray:
+        """
+        Dekoduje wszystkie chromosomy naraz.
+        :return: macierz fenotypów o kształcie (population_size, num_vars)
+        """
+        return self.decoder.decode(self.unpack())
+
+    def decode_rows(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Dekoduje wiersze spakowanej macierzy genów.
+        :return: macierz fenotypów o kształcie (len(genes), num_vars)
+        """
+        return self.decoder.decode(np.unpackbits(genes, axis=1, count=self.chromosome_length))
+
+    def _rows(self) -> tuple:
+        return self.genes, self.fitness, self.phenotypes
+
+    def _set_rows(self, genes: np.ndarray, fitness: np.ndarray, phenotypes: np.ndarray) -> None:
+        self.genes, self.fitness, self.phenotypes = genes, fitness, phenotypes
+
+    def _phenotype_rows(self, rows: tuple, pending: np.ndarray) -> np.ndarray:
+        # Zdekodowane fenotypy zapamiętywane są w wierszach, by nie dekodować ich ponownie
+        phenotypes = rows[2]
+        phenotypes[pending] = self.decode_rows(rows[0][pending])
+        return phenotypes[pending]
+
+    def statistics(self):
+        """
+        Zwraca parę (średnia wartość fitness, różnorodność populacji).
+        Różnorodność liczona jest ze średnich kolumn macierzy bitów: średnia z 4p(1 - p)
+        po wszystkich pozycjach – 0 dla populacji jednorodnej, 1 dla maksymalnie zróżnicowanej.
+        """
+        p = self.unpack().mean(axis=0)
+        return float(np.mean(self.fitness)), float(np.mean(4 * p * (1 - p)))
+
+    def import_arrays(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Odtwarza stan populacji z macierzy zapisanej przez export_arrays.
+        """
+        super().import_arrays(genes, fitness)
+        self.phenotypes = self.decode()
+
+    def _crossover(self, crossover_operator: BatchCrossoverOperator, children1: np.ndarray, children2: np.ndarray):
+        return crossover_operator.crossover(children1, children2, self.chromosome_length, self.rng)
+
+    def _vary(self, offspring: np.ndarray, mutation_operator: BatchMutationOperator,
+              inversion_operator: BatchInversionOperator, mutation_probability: float,
+              inversion_probability: float) -> None:
+        # Mutacja i inwersja całego potomstwa naraz
+        mutation_operator.mutate(offspring, self.chromosome_length, mutation_probability, self.rng)
+        if self.timer is not None:
+            self.timer.lap("mutate")
+        inversion_operator.invert(offspring, self.chromosome_length, inversion_probability, self.rng)
+        if self.timer is not None:
+            self.timer.lap("invert")
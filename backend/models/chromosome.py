@@ -1,40 +1,85 @@
 import random
-import math
+import numpy as np
 
 class Chromosome:
+    # Geny przechowywane jako jedna liczba całkowita: pierwszy gen chromosomu to najstarszy
+    # z length bitów. Operatory działają na niej przesunięciami i maskami bitowymi.
+    __slots__ = ("value", "length")
+
     def __init__(self, gene: str):
         """
         Inicjalizacja chromosomu zadaną reprezentacją binarną.
         :param gene: ciąg znaków '0' i '1'
         """
-        self.gene = gene
+        self.value = int(gene, 2) if gene else 0
+        self.length = len(gene)
+
+    @classmethod
+    def from_value(cls, value: int, length: int) -> "Chromosome":
+        """
+        Tworzy chromosom bezpośrednio z liczby całkowitej, bez pośredniego łańcucha znaków.
+        :param value: geny jako liczba całkowita (pierwszy gen – najstarszy bit)
+        :param length: długość chromosomu
+        """
+        chromosome = cls.__new__(cls)
+        chromosome.value = value
+        chromosome.length = length
+        return chromosome
+
+    @property
+    def gene(self) -> str:
+        """
+        Reprezentacja binarna chromosomu jako ciąg znaków '0' i '1'.
+        """
+        return format(self.value, f"0{self.length}b") if self.length else ""
+
+    def mask(self, start: int, stop: int) -> int:
+        """
+        Maska bitowa pozycji genów [start, stop) chromosomu.
+        """
+        return (1 << (self.length - start)) - (1 << (self.length - stop))
+
+    def flip(self, index: int) -> None:
+        """
+        Odwraca w miejscu gen na pozycji index (0 = pierwszy gen).
+        """
+        self.value ^= 1 << (self.length - 1 - index)
 
     @staticmethod
-    def random(length: int) -> "Chromosome":
+    def random(length: int, rng: np.random.Generator = None) -> "Chromosome":
         """
         Generuje losowy chromosom o podanej długości.
         :param length: długość chromosomu
+        :param rng: generator liczb losowych NumPy (domyślnie inicjalizowany z modułu random)
         :return: instancja Chromosome
         """
-        gene = ''.join(random.choice('01') for _ in range(length))
-        return Chromosome(gene)
+        rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        bits = rng.integers(0, 2, size=length, dtype=np.uint8)
+        value = int.from_bytes(np.packbits(bits).tobytes(), "big") >> ((-length) % 8)
+        return Chromosome.from_value(value, length)
 
-    def decode(self, a: float, b: float) -> float:
+    def decode(self, a: float, b: float, num_vars: int = 1):
         """
         Dekoduje binarną reprezentację chromosomu na wartość dziesiętną.
         Wzór: x = a + decimal(gene) * (b - a) / (2^m - 1)
-        gdzie m to długość łańcucha binarnego.
-        
+        gdzie m to długość łańcucha binarnego (lub segmentu, gdy num_vars > 1).
+
         :param a: dolny zakres poszukiwań
         :param b: górny zakres poszukiwań
-        :return: wartość dziesiętna odpowiadająca reprezentacji binarnej
+        :param num_vars: liczba zmiennych zakodowanych w kolejnych segmentach chromosomu
+        :return: wartość dziesiętna lub lista wartości dla num_vars > 1
         """
-        m = len(self.gene)
-        # Konwersja łańcucha binarnego na wartość dziesiętną
-        decimal_value = int(self.gene, 2)
-        # Obliczenie x według wzoru
-        x = a + decimal_value * (b - a) / (2**m - 1)
+        if num_vars > 1:
+            m = self.length // num_vars
+            segment_mask = (1 << m) - 1
+            return [
+                a + ((self.value >> (self.length - (i + 1) * m)) & segment_mask) * (b - a) / (2**m - 1)
+                for i in range(num_vars)
+            ]
+        m = self.length
+        # Obliczenie x według wzoru – geny są już wartością dziesiętną
+        x = a + self.value * (b - a) / (2**m - 1)
         return x
 
     def __str__(self):
-        return f"Chromosome(gene='{self.gene}')"
\ No newline at end of file
+        return f"Chromosome(gene='{self.gene}')"
@@ -0,0 +1,96 @@
+import numpy as np
+
+def genes_to_bits(genes) -> np.ndarray:
+    """
+    Zamienia listę łańcuchów '0'/'1' jednakowej długości na macierz bitów uint8.
+    :param genes: lista łańcuchów binarnych
+    :return: macierz o kształcie (len(genes), len(genes[0]))
+    """
+    if not genes:
+        return np.empty((0, 0), dtype=np.uint8)
+    buffer = np.frombuffer(''.join(genes).encode('ascii'), dtype=np.uint8)
+    return buffer.reshape(len(genes), -1) - ord('0')
+
+def bits_to_genes(bits: np.ndarray) -> list:
+    """
+    Zamienia macierz bitów uint8 na listę łańcuchów '0'/'1' (odwrotność genes_to_bits).
+    """
+    if bits.shape[0] == 0:
+        return []
+    text = (bits + ord('0')).astype(np.uint8).tobytes().decode('ascii')
+    length = bits.shape[1]
+    return [text[i:i + length] for i in range(0, len(text), length)]
+
+def values_to_bits(values, length: int) -> np.ndarray:
+    """
+    Zamienia listę genów zapisanych jako liczby całkowite (pierwszy gen – najstarszy bit)
+    na macierz bitów uint8 o kształcie (len(values), length).
+    """
+    if not values:
+        return np.empty((0, length), dtype=np.uint8)
+    width = (length + 7) // 8
+    buffer = np.frombuffer(b"".join(value.to_bytes(width, "big") for value in values), dtype=np.uint8)
+    bits = np.unpackbits(buffer.reshape(len(values), width), axis=1)
+    return bits[:, bits.shape[1] - length:]
+
+def bits_to_values(bits: np.ndarray) -> list:
+    """
+    Zamienia macierz bitów uint8 na listę liczb całkowitych (odwrotność values_to_bits).
+    """
+    padding = (-bits.shape[1]) % 8
+    packed = np.packbits(bits, axis=1)
+    width = packed.shape[1]
+    data = packed.tobytes()
+    return [int.from_bytes(data[i:i + width], "big") >> padding for i in range(0, len(data), width)]
+
+def gray_to_binary(bits: np.ndarray) -> np.ndarray:
+    """
+    Zamienia kod Graya na naturalny kod binarny (b[0] = g[0], b[i] = b[i-1] xor g[i]).
+    Operacja wykonywana jest wzdłuż ostatniej osi.
+    """
+    return np.bitwise_xor.accumulate(bits, axis=-1)
+
+class BinaryDecoder:
+    def __init__(self, search_range, chromosome_length: int, num_vars: int = 1, gray: bool = False):
+        """
+        Dekoder całej populacji naraz. Chromosom składa się z num_vars segmentów
+        o jednakowej długości, każdy segment koduje jedną zmienną.
+        :param search_range: zakres poszukiwań [a, b]
+        :param chromosome_length: długość całego chromosomu
+        :param num_vars: liczba zmiennych
+        :param gray: czy geny zapisane są w kodzie Graya
+        """
+        if chromosome_length % num_vars != 0:
+            raise ValueError("Długość chromosomu musi być wielokrotnością liczby zmiennych.")
+        self.a, self.b = search_range
+        self.num_vars = num_vars
+        self.gray = gray
+        self.segment_length = chromosome_length // num_vars
+        # Wagi potęg dwójki i skala liczone raz dla danego zakresu i długości segmentu
+        self.weights = 2.0 ** np.arange(self.segment_length - 1, -1, -1)
+        self.scale = (self.b - self.a) / (2.0**self.segment_length - 1)
+
+    def decode(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Dekoduje macierz bitów według wzoru x = a + decimal(gene) * (b - a) / (2^m - 1).
+        :param bits: macierz bitów o kształcie (population_size, chromosome_length)
+        :return: macierz fenotypów o kształcie (population_size, num_vars)
+        """
+        segments = bits.reshape(bits.shape[0], self.num_vars, self.segment_length)
+        if self.gray:
+            segments = gray_to_binary(segments)
+        return self.a + (segments @ self.weights) * self.scale
+
+    def decode_genes(self, genes) -> np.ndarray:
+        """
+        Dekoduje listę łańcuchów '0'/'1'.
+        :return: macierz fenotypów o kształcie (len(genes), num_vars)
+        """
+        return self.decode(genes_to_bits(genes))
+
+    def decode_values(self, values) -> np.ndarray:
+        """
+        Dekoduje listę genów zapisanych jako liczby całkowite (Chromosome.value).
+        :return: macierz fenotypów o kształcie (len(values), num_vars)
+        """
+        return self.decode(values_to_bits(values, self.segment_length * self.num_vars))
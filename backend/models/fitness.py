@@ -1,18 +1,168 @@
-class HyperellipsoidFitness:
-    def __init__(self, num_vars, search_range):
+import math
+import numpy as np
+from abc import ABC, abstractmethod
+
+class FitnessFunction(ABC):
+    # Nazwa w rejestrze, domyślny zakres poszukiwań i znane optimum globalne
+    name = None
+    default_search_range = (-65.536, 65.536)
+    optimum_value = 0.0
+
+    def __init__(self, num_vars, search_range=None):
         self.num_vars = num_vars
-        self.search_range = search_range
+        self.search_range = search_range if search_range is not None else self.default_search_range
+
+    def optimum_position(self) -> list:
+        """
+        Zwraca punkt, w którym funkcja osiąga optimum globalne.
+        """
+        return [0.0] * self.num_vars
+
+    @abstractmethod
+    def evaluate(self, phenotype) -> float:
+        """
+        Oblicza wartość funkcji celu dla pojedynczego fenotypu.
+        Implementacja referencyjna – czysty Python, bez NumPy.
+        :param phenotype: wartość lub lista wartości zmiennych
+        :return: wartość funkcji celu
+        """
+        pass
+
+    def evaluate_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Oblicza wartości funkcji celu dla całej populacji naraz.
+        Domyślnie ocenia kolejne wiersze metodą evaluate – klasy pochodne
+        nadpisują tę metodę wersją wektorową.
+        :param X: macierz fenotypów o kształcie (population_size, num_vars)
+        :return: wektor wartości funkcji celu
+        """
+        return np.array([self.evaluate(x) for x in X.tolist()], dtype=float)
+
+def as_list(phenotype) -> list:
+    """
+    Zwraca fenotyp jako listę wartości (pojedyncza wartość traktowana jest jak jedna zmienna).
+    """
+    return phenotype if isinstance(phenotype, list) else [phenotype]
+
+class HyperellipsoidFitness(FitnessFunction):
+    name = "hyperellipsoid"
+    default_search_range = (-65.536, 65.536)
 
     def evaluate(self, phenotype):
-        # Przyjmujemy, że phenotype to pojedyncza wartość – w praktyce możesz rozszerzyć na wielowymiarowość
-        # Poniższa implementacja jest przykładowa
+        # f(x) = sum_{i=1..n} sum_{j=1..i} x_j^2 – sumę wewnętrzną przenosimy
+        # między kolejnymi i, dzięki czemu koszt jest liniowy względem n
         value = 0
-        # Jeśli phenotype jest pojedynczą wartością, używamy jej kwadratu
-        # Dla wielowymiarowego problemu phenotype może być listą wartości
-        if isinstance(phenotype, list):
-            for i in range(len(phenotype)):
-                for j in range(i+1):
-                    value += phenotype[j] ** 2
-        else:
-            value = phenotype ** 2
+        partial_sum = 0
+        for x in as_list(phenotype):
+            partial_sum += x ** 2
+            value += partial_sum
         return value
+
+    def evaluate_batch(self, X):
+        # Równoważnie f(x) = sum_j (n - j + 1) * x_j^2 – ważona suma kwadratów
+        n = X.shape[1]
+        weights = np.arange(n, 0, -1, dtype=float)
+        return (X * X) @ weights
+
+class SphereFitness(FitnessFunction):
+    name = "sphere"
+    default_search_range = (-5.12, 5.12)
+
+    def evaluate(self, phenotype):
+        return sum(x ** 2 for x in as_list(phenotype))
+
+    def evaluate_batch(self, X):
+        return np.einsum("ij,ij->i", X, X)
+
+class RastriginFitness(FitnessFunction):
+    name = "rastrigin"
+    default_search_range = (-5.12, 5.12)
+
+    def evaluate(self, phenotype):
+        x = as_list(phenotype)
+        return 10 * len(x) + sum(xi ** 2 - 10 * math.cos(2 * math.pi * xi) for xi in x)
+
+    def evaluate_batch(self, X):
+        return 10 * X.shape[1] + np.sum(X * X - 10 * np.cos(2 * np.pi * X), axis=1)
+
+class RosenbrockFitness(FitnessFunction):
+    name = "rosenbrock"
+    default_search_range = (-2.048, 2.048)
+
+    def optimum_position(self):
+        return [1.0] * self.num_vars
+
+    def evaluate(self, phenotype):
+        x = as_list(phenotype)
+        return sum(100 * (x[i + 1] - x[i] ** 2) ** 2 + (1 - x[i]) ** 2 for i in range(len(x) - 1))
+
+    def evaluate_batch(self, X):
+        head, tail = X[:, :-1], X[:, 1:]
+        return np.sum(100 * (tail - head * head) ** 2 + (1 - head) ** 2, axis=1)
+
+class AckleyFitness(FitnessFunction):
+    name = "ackley"
+    default_search_range = (-32.768, 32.768)
+
+    def evaluate(self, phenotype):
+        x = as_list(phenotype)
+        n = len(x)
+        square_mean = sum(xi ** 2 for xi in x) / n
+        cos_mean = sum(math.cos(2 * math.pi * xi) for xi in x) / n
+        return -20 * math.exp(-0.2 * math.sqrt(square_mean)) - math.exp(cos_mean) + 20 + math.e
+
+    def evaluate_batch(self, X):
+        square_mean = np.mean(X * X, axis=1)
+        cos_mean = np.mean(np.cos(2 * np.pi * X), axis=1)
+        return -20 * np.exp(-0.2 * np.sqrt(square_mean)) - np.exp(cos_mean) + 20 + np.e
+
+class SchwefelFitness(FitnessFunction):
+    name = "schwefel"
+    default_search_range = (-500.0, 500.0)
+    # Stała dobrana tak, aby wartość w optimum wynosiła (w przybliżeniu) zero
+    offset = 418.9828872724338
+
+    def optimum_position(self):
+        return [420.9687462275036] * self.num_vars
+
+    def evaluate(self, phenotype):
+        x = as_list(phenotype)
+        return self.offset * len(x) - sum(xi * math.sin(math.sqrt(abs(xi))) for xi in x)
+
+    def evaluate_batch(self, X):
+        return self.offset * X.shape[1] - np.sum(X * np.sin(np.sqrt(np.abs(X))), axis=1)
+
+class GriewankFitness(FitnessFunction):
+    name = "griewank"
+    default_search_range = (-600.0, 600.0)
+
+    def evaluate(self, phenotype):
+        x = as_list(phenotype)
+        total = sum(xi ** 2 for xi in x) / 4000
+        product = 1.0
+        for i, xi in enumerate(x, start=1):
+            product *= math.cos(xi / math.sqrt(i))
+        return 1 + total - product
+
+    def evaluate_batch(self, X):
+        scale = np.sqrt(np.arange(1, X.shape[1] + 1))
+        return 1 + np.sum(X * X, axis=1) / 4000 - np.prod(np.cos(X / scale), axis=1)
+
+# Rejestr funkcji celu wybieranych polem "function" konfiguracji
+FITNESS_FUNCTIONS = {
+    cls.name: cls for cls in (
+        HyperellipsoidFitness, SphereFitness, RastriginFitness, RosenbrockFitness,
+        AckleyFitness, SchwefelFitness, GriewankFitness
+    )
+}
+
+def get_fitness_function(name: str, num_vars: int, search_range=None) -> FitnessFunction:
+    """
+    Tworzy funkcję celu o podanej nazwie z rejestru FITNESS_FUNCTIONS.
+    Dla nieznanej nazwy zwracana jest funkcja Hyperellipsoid.
+    :param name: nazwa funkcji
+    :param num_vars: liczba zmiennych
+    :param search_range: zakres poszukiwań – domyślnie zakres właściwy dla funkcji
+    """
+    fitness_class = FITNESS_FUNCTIONS.get(name.lower(), HyperellipsoidFitness)
+    return fitness_class(num_vars=num_vars, search_range=search_range)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+class FitnessCache:
+    def __init__(self, maxsize: int):
+        """
+        Pamięć podręczna wartości funkcji celu indeksowana genotypem,
+        z ograniczonym rozmiarem i usuwaniem najdawniej używanych wpisów (LRU).
+        :param maxsize: maksymalna liczba przechowywanych wpisów
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, genotype):
+        """
+        Zwraca zapamiętaną wartość funkcji celu lub None, jeśli genotypu nie ma w pamięci.
+        :param genotype: klucz – łańcuch genów lub spakowany wiersz bitów (bytes)
+        """
+        value = self._entries.get(genotype)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(genotype)
+        self.hits += 1
+        return value
+
+    def put(self, genotype, fitness: float) -> None:
+        """
+        Zapamiętuje wartość funkcji celu, usuwając najdawniej używany wpis po przekroczeniu rozmiaru.
+        """
+        self._entries[genotype] = fitness
+        self._entries.move_to_end(genotype)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def export_state(self) -> dict:
+        """
+        Zwraca zawartość pamięci (w kolejności LRU) i liczniki w postaci gotowej do zapisu w JSON.
+        Klucze bytes zapisywane są szesnastkowo, liczby całkowite – bez zmian.
+        """
+        keys = list(self._entries)
+        packed = bool(keys) and isinstance(keys[0], bytes)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": packed,
+            "keys": [key.hex() for key in keys] if packed else keys,
+            "values": list(self._entries.values())
+        }
+
+    def import_state(self, state: dict) -> None:
+        """
+        Odtwarza zawartość pamięci i liczniki zapisane przez export_state.
+        """
+        keys = [bytes.fromhex(key) for key in state["keys"]] if state["bytes"] else state["keys"]
+        self._entries = OrderedDict(zip(keys, state["values"]))
+        self.hits = state["hits"]
+        self.misses = state["misses"]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Zwraca liczniki trafień i chybień w postaci gotowej do umieszczenia w wyniku.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize
+        }
@@ -1,6 +1,9 @@
 from backend.models.chromosome import Chromosome
 
 class Individual:
+    # Bez słownika atrybutów – osobnik to trzy referencje
+    __slots__ = ("chromosome", "fitness", "phenotype")
+
     def __init__(self, chromosome: Chromosome):
         """
         Inicjalizacja osobnika z pojedynczym chromosomem.
@@ -8,15 +11,17 @@ class Individual:
         """
         self.chromosome = chromosome
         self.fitness = None  # wartość funkcji celu, ustalana później
+        self.phenotype = None  # zdekodowana wartość, ustalana podczas oceny populacji
 
-    def get_phenotype(self, a: float, b: float) -> float:
+    def get_phenotype(self, a: float, b: float, num_vars: int = 1):
         """
         Zwraca zdekodowaną wartość (fenotyp) chromosomu.
         :param a: dolny zakres poszukiwań
         :param b: górny zakres poszukiwań
-        :return: wartość dziesiętna
+        :param num_vars: liczba zmiennych zakodowanych w chromosomie
+        :return: wartość dziesiętna lub lista wartości dla num_vars > 1
         """
-        return self.chromosome.decode(a, b)
+        return self.chromosome.decode(a, b, num_vars)
 
     def __str__(self):
         phenotype = self.get_phenotype(-65.536, 65.536)
@@ -1,37 +1,150 @@
+import heapq
 import random
+import itertools
+import numpy as np
 from backend.models.individual import Individual
 from backend.models.chromosome import Chromosome
+from backend.models.decoder import BinaryDecoder, values_to_bits, bits_to_values
 # Importujemy interfejsy operatorów z modułu operators
 from backend.services.operators import SelectionOperator, CrossoverOperator, MutationOperator, InversionOperator
+from backend.services.replacement import GENERATIONAL, STEADY_STATE, offspring_plan, survivors
 
 class Population:
-    def __init__(self, population_size: int):
+    def __init__(self, population_size: int, search_range=(-65.536, 65.536), num_vars: int = 1, gray: bool = False,
+                 fitness_cache=None, rng: np.random.Generator = None):
         """
         Inicjalizacja populacji osobników.
         :param population_size: liczba osobników w populacji
+        :param search_range: zakres poszukiwań [a, b]
+        :param num_vars: liczba zmiennych (segmentów chromosomu)
+        :param gray: czy geny zapisane są w kodzie Graya
+        :param fitness_cache: opcjonalna pamięć podręczna FitnessCache (genotyp -> fitness)
+        :param rng: generator liczb losowych NumPy przekazywany wszystkim operatorom
+                    (domyślnie inicjalizowany z modułu random)
         """
         self.population_size = population_size
+        self.search_range = search_range
+        self.num_vars = num_vars
+        self.gray = gray
+        self.fitness_cache = fitness_cache
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        self.evaluations = 0  # liczba faktycznych wywołań funkcji celu
+        self.timer = None  # opcjonalny EpochTimer mierzący czas etapów evolve
+        self.decoder = None
+        self.chromosome_length = 0
         self.individuals = []
+        # Najlepszy osobnik bieżącej populacji i najlepszy osobnik znaleziony dotąd
+        self.best_individual = None
+        self.incumbent = None
 
     def initialize(self, chromosome_length: int) -> None:
         """
-        Losowa inicjalizacja populacji. Każdy osobnik otrzymuje pojedynczy losowy chromosom o zadanej długości.
-        :param chromosome_length: długość chromosomu
+        Losowa inicjalizacja populacji. Każdy osobnik otrzymuje pojedynczy losowy chromosom o zadanej długości,
+        złożony z num_vars następujących po sobie segmentów.
+        :param chromosome_length: długość całego chromosomu
         """
+        self.chromosome_length = chromosome_length
+        self.decoder = BinaryDecoder(self.search_range, chromosome_length, num_vars=self.num_vars, gray=self.gray)
         self.individuals = [
-            Individual(Chromosome.random(chromosome_length))
+            Individual(Chromosome.random(chromosome_length, self.rng))
             for _ in range(self.population_size)
         ]
 
     def evaluate(self, fitness_function) -> None:
         """
-        Ocena funkcji celu (fitness) dla każdego osobnika w populacji.
-        :param fitness_function: instancja klasy FitnessFunction z metodą evaluate(phenotype)
+        Ocena funkcji celu (fitness) dla osobników, których wartość nie jest jeszcze znana.
+        Elity oraz potomkowie przepisani bez zmian zachowują swoją wartość fitness.
+        Po ocenie aktualizowany jest najlepszy osobnik populacji i najlepszy osobnik dotąd.
+        :param fitness_function: instancja klasy FitnessFunction z metodą evaluate_batch(X)
         """
-        for individual in self.individuals:
-            # Przyjmujemy stały zakres poszukiwań, np. [-65.536, 65.536]
-            phenotype = individual.get_phenotype(-65.536, 65.536)
-            individual.fitness = fitness_function.evaluate(phenotype)
+        pending = [ind for ind in self.individuals if ind.fitness is None]
+        if pending:
+            self._evaluate_individuals(fitness_function, pending)
+        self._track_best()
+
+    def _evaluate_individuals(self, fitness_function, pending) -> None:
+        # Dekodowanie wszystkich nowych osobników w jednym przebiegu
+        phenotypes = self.decoder.decode_values([ind.chromosome.value for ind in pending])
+        for individual, phenotype in zip(pending, phenotypes.tolist()):
+            individual.phenotype = phenotype
+
+        # Osobniki, których genotyp jest w pamięci podręcznej, nie są oceniane ponownie
+        if self.fitness_cache is not None:
+            misses = []
+            for i, individual in enumerate(pending):
+                value = self.fitness_cache.get(individual.chromosome.value)
+                if value is None:
+                    misses.append(i)
+                else:
+                    individual.fitness = value
+        else:
+            misses = list(range(len(pending)))
+        if not misses:
+            return
+
+        fitness = fitness_function.evaluate_batch(phenotypes[misses])
+        self.evaluations += len(misses)
+        for i, value in zip(misses, fitness.tolist()):
+            pending[i].fitness = value
+            if self.fitness_cache is not None:
+                self.fitness_cache.put(pending[i].chromosome.value, value)
+
+    def _track_best(self) -> None:
+        """
+        Jedno przejście O(n) po populacji – raport najlepszego osobnika jest potem O(1).
+        """
+        self.best_individual = min(self.individuals, key=lambda ind: ind.fitness)
+        if self.incumbent is None or self.best_individual.fitness < self.incumbent.fitness:
+            self.incumbent = self.best_individual
+
+    def best_solution(self):
+        """
+        Zwraca parę (x, fitness) najlepszego osobnika bieżącej populacji.
+        """
+        return self.best_individual.phenotype, self.best_individual.fitness
+
+    def incumbent_solution(self):
+        """
+        Zwraca parę (x, fitness) najlepszego osobnika znalezionego od początku przebiegu.
+        """
+        return self.incumbent.phenotype, self.incumbent.fitness
+
+    def statistics(self):
+        """
+        Zwraca parę (średnia wartość fitness, różnorodność populacji).
+        Różnorodność liczona jest ze średnich kolumn macierzy bitów: średnia z 4p(1 - p)
+        po wszystkich pozycjach – 0 dla populacji jednorodnej, 1 dla maksymalnie zróżnicowanej.
+        """
+        p = values_to_bits([ind.chromosome.value for ind in self.individuals], self.chromosome_length).mean(axis=0)
+        mean_fitness = sum(ind.fitness for ind in self.individuals) / len(self.individuals)
+        return mean_fitness, float(np.mean(4 * p * (1 - p)))
+
+    def export_arrays(self):
+        """
+        Zwraca stan populacji jako parę (spakowana macierz genów, wektor fitness) z najlepszym
+        osobnikiem dotąd dołączonym jako ostatni wiersz – do zapisu w punkcie kontrolnym.
+        """
+        individuals = self.individuals + [self.incumbent]
+        genes = np.packbits(values_to_bits([ind.chromosome.value for ind in individuals], self.chromosome_length), axis=1)
+        return genes, np.array([ind.fitness for ind in individuals], dtype=float)
+
+    def import_arrays(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Odtwarza osobniki (wraz z wartościami fitness i fenotypami) z macierzy zapisanej przez export_arrays.
+        """
+        if genes.shape != (self.population_size + 1, (self.chromosome_length + 7) // 8):
+            raise ValueError("Punkt kontrolny nie pasuje do rozmiaru populacji lub długości chromosomu.")
+        bits = np.unpackbits(genes, axis=1, count=self.chromosome_length)
+        phenotypes = self.decoder.decode(bits).tolist()
+        individuals = []
+        for gene, value, phenotype in zip(bits_to_values(bits), fitness.tolist(), phenotypes):
+            individual = Individual(Chromosome.from_value(gene, self.chromosome_length))
+            individual.fitness = value
+            individual.phenotype = phenotype
+            individuals.append(individual)
+        self.individuals = individuals[:-1]
+        self.incumbent = individuals[-1]
+        self.best_individual = min(self.individuals, key=lambda ind: ind.fitness)
 
     def get_best(self, n: int):
         """
@@ -39,8 +152,75 @@ class Population:
         :param n: liczba najlepszych osobników do zwrócenia
         :return: lista n najlepszych osobników
         """
-        sorted_individuals = sorted(self.individuals, key=lambda ind: ind.fitness)
-        return sorted_individuals[:n]
+        if n <= 0:
+            return []
+        # Częściowe sortowanie – O(n log k) zamiast sortowania całej populacji
+        return heapq.nsmallest(n, self.individuals, key=lambda ind: ind.fitness)
+
+    def breed(self, offspring_count: int,
+              selection_operator: SelectionOperator,
+              crossover_operator: CrossoverOperator,
+              mutation_operator: MutationOperator,
+              inversion_operator: InversionOperator,
+              crossover_probability: float,
+              mutation_probability: float,
+              inversion_probability: float,
+              parents: list = None,
+              **selection_params):
+        """
+        Tworzy potomstwo bieżącej populacji: selekcja, krzyżowanie, mutacja i inwersja.
+        Potomkowie niezmienieni przez operatory są tymi samymi obiektami co rodzice i zachowują fitness.
+        :param offspring_count: liczba potomków
+        :param parents: rodzice wybrani wcześniej (domyślnie selekcja wykonywana jest dla tego wywołania)
+        :return: lista potomków
+        """
+        timer = self.timer
+
+        # Wybór rodziców przy użyciu operatora selekcji
+        if parents is None:
+            parents = selection_operator.select(self, rng=self.rng, **selection_params)
+            if timer is not None:
+                timer.lap("select")
+        
+        # Pary rodziców (dwa różne miejsca na liście, jak w random.sample) i decyzje o krzyżowaniu losowane są naraz
+        pair_count = (offspring_count + 1) // 2
+        rng = self.rng
+        first = rng.integers(0, len(parents), size=pair_count)
+        second = (first + rng.integers(1, len(parents), size=pair_count)) % len(parents)
+        crossed = rng.random(pair_count) < crossover_probability
+
+        offspring = []
+        # Potomkowie z krzyżowania są nowymi obiektami – mutacja i inwersja mogą je zmieniać w miejscu.
+        # Potomkowie przepisani bez krzyżowania to referencje do rodziców (także elit i najlepszego
+        # osobnika dotąd), więc operator tworzy dla nich kopię.
+        owned = []
+        # Generowanie potomstwa z uwzględnieniem prawdopodobieństwa krzyżowania
+        for i, j, cross in zip(first.tolist(), second.tolist(), crossed.tolist()):
+            parent1, parent2 = parents[i], parents[j]
+            if cross:
+                child1, child2 = crossover_operator.crossover(parent1, parent2, rng)
+            else:
+                child1, child2 = parent1, parent2
+            offspring.extend([child1, child2])
+            owned.extend([cross, cross])
+        offspring = offspring[:offspring_count]
+        if timer is not None:
+            timer.lap("crossover")
+        
+        # Mutacja potomstwa – osobnik zwrócony przez operator jako nowy obiekt też jest już własny
+        for k, child in enumerate(offspring):
+            mutated = mutation_operator.mutate(child, mutation_probability, rng, owned[k])
+            owned[k] = owned[k] or mutated is not child
+            offspring[k] = mutated
+        if timer is not None:
+            timer.lap("mutate")
+        
+        # Inwersja potomstwa
+        for k, child in enumerate(offspring):
+            offspring[k] = inversion_operator.invert(child, inversion_probability, rng, owned[k])
+        if timer is not None:
+            timer.lap("invert")
+        return offspring
 
     def evolve(self, fitness_function,
            selection_operator: SelectionOperator,
@@ -51,35 +231,118 @@ class Population:
            mutation_probability: float,
            inversion_probability: float,
            elitism_count: int,
+           replacement: str = GENERATIONAL,
+           offspring_count: int = None,
            **selection_params):
+        """
+        Jedna epoka algorytmu.
+        :param replacement: strategia zastępowania – "generational" (cała populacja poza elitami),
+                            "steady_state", "mu_plus_lambda" lub "mu_comma_lambda"
+        :param offspring_count: liczba potomków w kroku strategii innej niż pokoleniowa
+                                (k dla steady_state, lambda dla strategii (mu, lambda))
+        """
+        timer = self.timer
+        if timer is not None:
+            timer.start_epoch(self.evaluations)
+
         # Ocena populacji
         self.evaluate(fitness_function)
-        
-        # Wybór rodziców przy użyciu operatora selekcji
-        parents = selection_operator.select(self, **selection_params)
-        
-        offspring = []
-        # Generowanie potomstwa z uwzględnieniem prawdopodobieństwa krzyżowania
-        while len(offspring) < self.population_size - elitism_count:
-            parent1, parent2 = random.sample(parents, 2)
-            if random.random() < crossover_probability:
-                child1, child2 = crossover_operator.crossover(parent1, parent2)
-            else:
-                child1, child2 = parent1, parent2
-            offspring.extend([child1, child2])
-        offspring = offspring[:self.population_size - elitism_count]
-        
-        # Mutacja potomstwa
-        mutated_offspring = [mutation_operator.mutate(child, mutation_probability) for child in offspring]
-        
-        # Inwersja potomstwa
-        inverted_offspring = [inversion_operator.invert(child, inversion_probability) for child in mutated_offspring]
+        if timer is not None:
+            timer.lap("evaluate")
+
+        operators = (selection_operator, crossover_operator, mutation_operator, inversion_operator,
+                     crossover_probability, mutation_probability, inversion_probability)
+        if replacement != GENERATIONAL:
+            self._evolve_incremental(fitness_function, operators, elitism_count, replacement, offspring_count,
+                                     selection_params)
+            if timer is not None:
+                timer.end_epoch(self.evaluations)
+            return
+
+        inverted_offspring = self.breed(self.population_size - elitism_count, *operators, **selection_params)
         
         # Zachowanie elitarnych osobników (najlepszych)
         elite = self.get_best(elitism_count)
         
         # Aktualizacja populacji
         self.individuals = elite + inverted_offspring
+        if timer is not None:
+            timer.lap("elitism")
         
-        # Opcjonalnie: ponowna ocena populacji
-        self.evaluate(fitness_function)
\ No newline at end of file
+        # Ponowna ocena populacji – oceniani są tylko nowi osobnicy
+        self.evaluate(fitness_function)
+        if timer is not None:
+            timer.lap("evaluate")
+            timer.end_epoch(self.evaluations)
+
+    def _evolve_incremental(self, fitness_function, operators: tuple, elitism_count: int, replacement: str,
+                            offspring_count: int, selection_params: dict) -> None:
+        """
+        Strategie z oceną przyrostową: oceniani są tylko nowi potomkowie, a populacja pozostaje
+        uporządkowana według fitness – potomkowie dołączani są przez scalanie posortowanych list.
+        """
+        timer = self.timer
+        step, steps = offspring_plan(replacement, self.population_size, elitism_count, offspring_count)
+        if replacement == STEADY_STATE:
+            self._evolve_steady_state(fitness_function, operators, step, steps, selection_params)
+            return
+        fitness = lambda ind: ind.fitness
+        self.individuals.sort(key=fitness)  # Timsort – liniowy, gdy populacja jest już uporządkowana
+        keep = survivors(replacement, self.population_size, elitism_count, step)
+
+        for _ in range(steps):
+            offspring = self.breed(step, *operators, **selection_params)
+            pending = [ind for ind in offspring if ind.fitness is None]
+            if pending:
+                self._evaluate_individuals(fitness_function, pending)
+            offspring.sort(key=fitness)
+            if timer is not None:
+                timer.lap("evaluate")
+
+            # Scalenie uporządkowanych potomków z keep najlepszymi osobnikami
+            merged = heapq.merge(self.individuals[:keep], offspring, key=fitness)
+            self.individuals = list(itertools.islice(merged, self.population_size))
+            self._track_best()
+            if timer is not None:
+                timer.lap("elitism")
+
+    def _evolve_steady_state(self, fitness_function, operators: tuple, step: int, steps: int,
+                             selection_params: dict) -> None:
+        """
+        Strategia steady_state: rodzice wybierani są raz na epokę, a potomkowie każdego kroku
+        zastępują w miejscu najgorszych osobników wskazywanych przez kopiec – krok kosztuje O(k log n)
+        zamiast selekcji i przebudowy całej listy.
+        """
+        timer = self.timer
+        selection_operator = operators[0]
+        parents = selection_operator.select(self, rng=self.rng, **selection_params)
+        if timer is not None:
+            timer.lap("select")
+        # Kopiec najgorszych osobników: (-fitness, indeks na liście)
+        worst = [(-ind.fitness, index) for index, ind in enumerate(self.individuals)]
+        heapq.heapify(worst)
+
+        for _ in range(steps):
+            offspring = self.breed(step, *operators, parents=parents, **selection_params)
+            pending = [ind for ind in offspring if ind.fitness is None]
+            if pending:
+                self._evaluate_individuals(fitness_function, pending)
+            if timer is not None:
+                timer.lap("evaluate")
+
+            replaced = [heapq.heappop(worst)[1] for _ in offspring]
+            best_replaced = any(self.individuals[index] is self.best_individual for index in replaced)
+            for index, child in zip(replaced, offspring):
+                self.individuals[index] = child
+                heapq.heappush(worst, (-child.fitness, index))
+            # Najlepszy osobnik zastępowany jest tylko wtedy, gdy brakuje gorszych – zwykle wystarczy
+            # porównać go z potomkami
+            best_child = min(offspring, key=lambda ind: ind.fitness)
+            if best_replaced:
+                self._track_best()
+            elif best_child.fitness < self.best_individual.fitness:
+                self.best_individual = best_child
+                if best_child.fitness < self.incumbent.fitness:
+                    self.incumbent = best_child
+            if timer is not None:
+                timer.lap("elitism")
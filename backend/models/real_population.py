@@ -0,0 +1,60 @@
+import numpy as np
+from backend.models.array_population import ArrayPopulation
+from backend.services.real_operators import RealCrossoverOperator, RealMutationOperator
+
+class RealPopulation(ArrayPopulation):
+    def __init__(self, population_size: int, search_range=(-65.536, 65.536), num_vars: int = 1,
+                 rng: np.random.Generator = None, fitness_cache=None):
+        """
+        Populacja o kodowaniu rzeczywistym: macierz float (wiersz = osobnik, kolumna = zmienna)
+        wraz z wektorem wartości funkcji celu. Wiersz macierzy genów jest jednocześnie fenotypem.
+        :param population_size: liczba osobników w populacji
+        :param search_range: zakres poszukiwań [a, b] – geny potomków są do niego przycinane
+        :param num_vars: liczba zmiennych
+        :param rng: generator liczb losowych NumPy
+        :param fitness_cache: opcjonalna pamięć podręczna FitnessCache (bajty wiersza -> fitness)
+        """
+        super().__init__(population_size, search_range, num_vars, rng=rng, fitness_cache=fitness_cache)
+        self.chromosome_length = num_vars
+        self.genes = np.empty((population_size, num_vars))
+
+    @property
+    def phenotypes(self) -> np.ndarray:
+        # Kodowanie rzeczywiste nie wymaga dekodowania – fenotypem jest sam wiersz genów
+        return self.genes
+
+    def initialize(self) -> None:
+        """
+        Losowa inicjalizacja populacji – geny z rozkładu jednostajnego w zakresie poszukiwań.
+        """
+        low, high = self.search_range
+        self.genes = self.rng.uniform(low, high, size=(self.population_size, self.num_vars))
+        self.fitness = np.full(self.population_size, np.nan)
+
+    def decode_rows(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Kodowanie rzeczywiste nie wymaga dekodowania – zwraca same wiersze genów.
+        """
+        return genes
+
+    def statistics(self):
+        """
+        Zwraca parę (średnia wartość fitness, różnorodność populacji).
+        Różnorodność to średnie odchylenie standardowe genów odniesione do odchylenia rozkładu
+        jednostajnego w zakresie poszukiwań – 0 dla populacji jednorodnej, około 1 dla losowej.
+        """
+        width = self.search_range[1] - self.search_range[0]
+        spread = self.genes.std(axis=0) / (width / np.sqrt(12))
+        return float(np.mean(self.fitness)), float(np.mean(spread))
+
+    def _crossover(self, crossover_operator: RealCrossoverOperator, children1: np.ndarray, children2: np.ndarray):
+        return crossover_operator.crossover(children1, children2, self.rng)
+
+    def _vary(self, offspring: np.ndarray, mutation_operator: RealMutationOperator, inversion_operator,
+              mutation_probability: float, inversion_probability: float) -> None:
+        # Mutacja i przycięcie do zakresu poszukiwań. Inwersja nie dotyczy kodowania rzeczywistego –
+        # operator inwersji i jego prawdopodobieństwo są przyjmowane dla zgodności z BitPopulation i pomijane.
+        mutation_operator.mutate(offspring, self.search_range, mutation_probability, self.rng)
+        np.clip(offspring, self.search_range[0], self.search_range[1], out=offspring)
+        if self.timer is not None:
+            self.timer.lap("mutate")
@@ -0,0 +1,67 @@
+import re
+import sys
+import argparse
+import subprocess
+
+# Profil startu aplikacji: instrukcja uruchamiana jest w świeżym interpreterze z opcją
+# -X importtime, a raport zawiera czas importu każdego modułu (własny i łączny z zależnościami).
+
+STARTUP_STATEMENT = "from app import create_app; create_app()"
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def parse_import_times(output: str) -> list:
+    """
+    Parsuje wyjście -X importtime.
+    :return: lista słowników module, self_ms, cumulative_ms, depth w kolejności zakończenia importu
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                "module": module,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(indent) - 1) // 2
+            })
+    return entries
+
+def profile_imports(statement: str = STARTUP_STATEMENT, cwd: str = None) -> dict:
+    """
+    Mierzy koszt importów potrzebnych do wykonania instrukcji w nowym procesie.
+    :param statement: kod Pythona do wykonania (domyślnie utworzenie aplikacji Flask)
+    :param cwd: katalog roboczy procesu (domyślnie bieżący)
+    :return: słownik z łącznym czasem importów najwyższego poziomu i listą modułów
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                               cwd=cwd, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else
+                           f"Proces zakończył się kodem {completed.returncode}.")
+    modules = parse_import_times(completed.stderr)
+    return {
+        "statement": statement,
+        "total_ms": sum(entry["cumulative_ms"] for entry in modules if entry["depth"] == 0),
+        "modules": modules
+    }
+
+def format_report(profile: dict, top: int = 20, sort_by: str = "cumulative_ms") -> str:
+    """
+    Tekstowy raport z top modułów o największym koszcie importu.
+    """
+    lines = [f"Importy dla: {profile['statement']}", f"Łącznie: {profile['total_ms']:.1f} ms", "",
+             f"{'łącznie [ms]':>13} {'własny [ms]':>11}  moduł"]
+    for entry in sorted(profile["modules"], key=lambda entry: entry[sort_by], reverse=True)[:top]:
+        lines.append(f"{entry['cumulative_ms']:13.1f} {entry['self_ms']:11.1f}  {entry['module']}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profil czasu importu modułów przy starcie aplikacji.")
+    parser.add_argument("statement", nargs="?", default=STARTUP_STATEMENT, help="instrukcja do zmierzenia")
+    parser.add_argument("--top", type=int, default=20, help="liczba modułów w raporcie")
+    parser.add_argument("--self", dest="sort_by", action="store_const", const="self_ms", default="cumulative_ms",
+                        help="sortuj według czasu własnego zamiast łącznego")
+    arguments = parser.parse_args()
+    print(format_report(profile_imports(arguments.statement), arguments.top, arguments.sort_by))
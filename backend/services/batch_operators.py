@@ -0,0 +1,268 @@
+import numpy as np
+from abc import ABC, abstractmethod
+
+# Operatory dla populacji przechowywanej jako macierz bitów (BitPopulation).
+# Selekcja pracuje na wektorze wartości funkcji celu i zwraca indeksy wierszy,
+# krzyżowanie, mutacja i inwersja – na całych spakowanych macierzach genów (np.packbits, 8 genów na bajt).
+
+# --- SELEKCJA ---
+
+class BatchSelectionOperator(ABC):
+    @abstractmethod
+    def select(self, fitness: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Wybiera osobniki na podstawie wektora wartości funkcji celu.
+        :return: tablica indeksów wybranych osobników
+        """
+        pass
+
+def smallest_indices(fitness: np.ndarray, n: int) -> np.ndarray:
+    """
+    Zwraca indeksy n najmniejszych wartości w kolejności rosnącej.
+    Częściowe sortowanie (argpartition) kosztuje O(size + n log n) zamiast O(size log size).
+    """
+    size = len(fitness)
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    if n >= size:
+        return np.argsort(fitness, kind="stable")
+    candidates = np.argpartition(fitness, n - 1)[:n]
+    return candidates[np.argsort(fitness[candidates], kind="stable")]
+
+def sample_cumulative(cumulative: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Zwraca dla każdego punktu indeks pierwszego elementu sumy skumulowanej nie mniejszego od punktu
+    (wyszukiwanie binarne – O(log n) na jedno losowanie).
+    """
+    return np.minimum(np.searchsorted(cumulative, points, side="left"), len(cumulative) - 1)
+
+def roulette_weights(fitness: np.ndarray) -> np.ndarray:
+    """
+    Wagi ruletki przy minimalizacji – im mniejsza wartość fitness, tym większa waga.
+    """
+    epsilon = 1e-6
+    return fitness.max() - fitness + epsilon
+
+def sample_without_replacement(population_size: int, count: int, rows: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Losuje w każdym z rows wierszy count różnych indeksów z przedziału [0, population_size).
+    Kolejny indeks losowany jest spośród population_size - j pozostałych wartości i przesuwany
+    za każdą mniejszą lub równą wartość wylosowaną wcześniej – O(rows * count^2) zamiast
+    permutacji całej populacji w każdym wierszu.
+    """
+    chosen = np.empty((rows, count), dtype=np.intp)
+    for j in range(count):
+        candidate = rng.integers(0, population_size - j, size=rows)
+        # Wcześniej wylosowane indeksy przeglądane rosnąco (dla j < 2 nie trzeba sortować)
+        previous = chosen[:, :j] if j < 2 else np.sort(chosen[:, :j], axis=1)
+        for column in range(j):
+            candidate += candidate >= previous[:, column]
+        chosen[:, j] = candidate
+    return chosen
+
+class BatchTournamentSelection(BatchSelectionOperator):
+    def __init__(self, tournament_size=3):
+        self.tournament_size = tournament_size
+
+    def select(self, fitness, rng):
+        size = len(fitness)
+        # Wszystkie turnieje losowane naraz jako macierz indeksów (size, tournament_size);
+        # uczestnicy jednego turnieju są różni, jak w random.sample
+        tournaments = sample_without_replacement(size, min(self.tournament_size, size), size, rng)
+        winners = np.argmin(fitness[tournaments], axis=1)  # Zakładamy minimalizację
+        return tournaments[np.arange(size), winners]
+
+class BatchRouletteSelection(BatchSelectionOperator):
+    def select(self, fitness, rng):
+        cumulative = np.cumsum(roulette_weights(fitness))
+        return sample_cumulative(cumulative, rng.uniform(0, cumulative[-1], size=len(fitness)))
+
+class BatchStochasticUniversalSampling(BatchSelectionOperator):
+    def select(self, fitness, rng):
+        # Jeden losowy punkt startowy i size równo odległych wskaźników na kole ruletki
+        cumulative = np.cumsum(roulette_weights(fitness))
+        step = cumulative[-1] / len(fitness)
+        points = rng.uniform(0, step) + step * np.arange(len(fitness))
+        return sample_cumulative(cumulative, points)
+
+class BatchRankSelection(BatchSelectionOperator):
+    def __init__(self, selection_pressure=1.5):
+        """
+        Selekcja rankingowa z liniowym rozkładem prawdopodobieństwa.
+        :param selection_pressure: oczekiwana liczba kopii najlepszego osobnika, z przedziału [1, 2]
+        """
+        self.selection_pressure = selection_pressure
+
+    def select(self, fitness, rng):
+        size = len(fitness)
+        if size == 1:
+            return np.zeros(1, dtype=np.intp)
+        order = np.argsort(fitness, kind="stable")[::-1]  # od najgorszego do najlepszego
+        ranks = np.arange(size)
+        s = self.selection_pressure
+        probabilities = (2 - s) / size + 2 * ranks * (s - 1) / (size * (size - 1))
+        positions = sample_cumulative(np.cumsum(probabilities), rng.uniform(0, 1, size=size))
+        return order[positions]
+
+class BatchBestSelection(BatchSelectionOperator):
+    def __init__(self, count):
+        self.count = count
+
+    def select(self, fitness, rng):
+        return smallest_indices(fitness, self.count)
+
+# --- KRZYŻOWANIE ---
+
+def pack_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Pakuje macierz logiczną (n, chromosome_length) do maski bajtowej zgodnej z np.packbits.
+    """
+    return np.packbits(mask, axis=1)
+
+def random_mask(rows: int, chromosome_length: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Losowa spakowana maska, w której każdy bit jest ustawiony z prawdopodobieństwem 0.5.
+    Losowane są od razu całe bajty; bity dopełnienia ostatniego bajtu pozostają wyzerowane.
+    """
+    mask = rng.integers(0, 256, size=(rows, (chromosome_length + 7) // 8), dtype=np.uint8)
+    padding = (-chromosome_length) % 8
+    mask[:, -1] &= np.uint8((0xFF << padding) & 0xFF)
+    return mask
+
+def cut_mask(points: np.ndarray, chromosome_length: int) -> np.ndarray:
+    """
+    Spakowana maska z bitami ustawionymi od pozycji points[i] do końca wiersza i.
+    """
+    return pack_mask(np.arange(chromosome_length) >= points[:, None])
+
+def swap_masked(parents1: np.ndarray, parents2: np.ndarray, mask: np.ndarray):
+    """
+    Wymienia między rodzicami bity wskazane maską: potomek 1 ma geny rodzica 2 tam, gdzie maska = 1.
+    """
+    difference = (parents1 ^ parents2) & mask
+    return parents1 ^ difference, parents2 ^ difference
+
+class BatchCrossoverOperator(ABC):
+    @abstractmethod
+    def crossover(self, parents1: np.ndarray, parents2: np.ndarray, chromosome_length: int,
+                  rng: np.random.Generator):
+        """
+        Krzyżuje parami wiersze dwóch spakowanych macierzy rodziców naraz.
+        :param parents1: spakowane geny pierwszych rodziców, kształt (n, bajty)
+        :param parents2: spakowane geny drugich rodziców, kształt (n, bajty)
+        :param chromosome_length: liczba bitów chromosomu
+        :return: para spakowanych macierzy potomków
+        """
+        pass
+
+class BatchOnePointCrossover(BatchCrossoverOperator):
+    def crossover(self, parents1, parents2, chromosome_length, rng):
+        points = rng.integers(1, chromosome_length, size=len(parents1))
+        return swap_masked(parents1, parents2, cut_mask(points, chromosome_length))
+
+class BatchTwoPointCrossover(BatchCrossoverOperator):
+    def crossover(self, parents1, parents2, chromosome_length, rng):
+        if chromosome_length < 3:
+            return BatchOnePointCrossover().crossover(parents1, parents2, chromosome_length, rng)
+        # Dwa różne punkty cięcia z przedziału [1, chromosome_length - 1] dla każdej pary
+        point1 = rng.integers(1, chromosome_length, size=len(parents1))
+        point2 = (point1 - 1 + rng.integers(1, chromosome_length - 1, size=len(parents1))) % (chromosome_length - 1) + 1
+        start, stop = np.minimum(point1, point2), np.maximum(point1, point2)
+        positions = np.arange(chromosome_length)
+        mask = (positions >= start[:, None]) & (positions < stop[:, None])
+        return swap_masked(parents1, parents2, pack_mask(mask))
+
+class BatchUniformCrossover(BatchCrossoverOperator):
+    def crossover(self, parents1, parents2, chromosome_length, rng):
+        # Potomkowie losowani niezależnie – każdy gen od dowolnego z rodziców z prawdopodobieństwem 0.5
+        mask1 = random_mask(len(parents1), chromosome_length, rng)
+        mask2 = random_mask(len(parents1), chromosome_length, rng)
+        child1, _ = swap_masked(parents1, parents2, mask1)
+        _, child2 = swap_masked(parents1, parents2, mask2)
+        return child1, child2
+
+class BatchGrainCrossover(BatchCrossoverOperator):
+    def crossover(self, parents1, parents2, chromosome_length, rng):
+        # Dla każdego potomka losujemy niezależnie pochodzenie każdego genu
+        child1, _ = swap_masked(parents1, parents2, random_mask(len(parents1), chromosome_length, rng))
+        child2, _ = swap_masked(parents1, parents2, random_mask(len(parents1), chromosome_length, rng))
+        return child1, child2
+
+# --- MUTACJA ---
+
+def flip_bits(genes: np.ndarray, rows: np.ndarray, positions: np.ndarray) -> None:
+    """
+    Odwraca w miejscu bity spakowanej macierzy genów (XOR z maską bitu w odpowiednim bajcie).
+    Powtórzenia tego samego bajtu w jednym wywołaniu są obsługiwane poprawnie.
+    :param rows: indeksy wierszy
+    :param positions: pozycje bitów w chromosomie (0 = pierwszy gen)
+    """
+    np.bitwise_xor.at(genes, (rows, positions >> 3), (0x80 >> (positions & 7)).astype(np.uint8))
+
+class BatchMutationOperator(ABC):
+    @abstractmethod
+    def mutate(self, genes: np.ndarray, chromosome_length: int, mutation_probability: float,
+               rng: np.random.Generator) -> None:
+        """
+        Mutuje w miejscu wiersze spakowanej macierzy genów z podanym prawdopodobieństwem.
+        """
+        pass
+
+class BatchOnePointMutation(BatchMutationOperator):
+    def mutate(self, genes, chromosome_length, mutation_probability, rng):
+        rows = np.flatnonzero(rng.random(len(genes)) < mutation_probability)
+        flip_bits(genes, rows, rng.integers(0, chromosome_length, size=len(rows)))
+
+class BatchBoundaryMutation(BatchMutationOperator):
+    def mutate(self, genes, chromosome_length, mutation_probability, rng):
+        rows = np.flatnonzero(rng.random(len(genes)) < mutation_probability)
+        # Losowo wybieramy, czy zmodyfikować pierwszy czy ostatni bit
+        positions = np.where(rng.random(len(rows)) < 0.5, 0, chromosome_length - 1)
+        flip_bits(genes, rows, positions)
+
+class BatchTwoPointMutation(BatchMutationOperator):
+    def mutate(self, genes, chromosome_length, mutation_probability, rng):
+        if chromosome_length < 2:
+            return
+        rows = np.flatnonzero(rng.random(len(genes)) < mutation_probability)
+        first = rng.integers(0, chromosome_length, size=len(rows))
+        second = (first + rng.integers(1, chromosome_length, size=len(rows))) % chromosome_length
+        flip_bits(genes, np.concatenate((rows, rows)), np.concatenate((first, second)))
+
+class BatchBitFlipMutation(BatchMutationOperator):
+    def mutate(self, genes, chromosome_length, mutation_probability, rng):
+        # Każdy bit odwracany niezależnie z prawdopodobieństwem mutation_probability.
+        # Zamiast losować liczbę dla każdego bitu, losujemy liczbę mutacji z rozkładu
+        # dwumianowego, a potem tylko tyle różnych pozycji w całej macierzy.
+        total_bits = len(genes) * chromosome_length
+        count = rng.binomial(total_bits, mutation_probability)
+        flat = rng.choice(total_bits, size=count, replace=False)
+        flip_bits(genes, flat // chromosome_length, flat % chromosome_length)
+
+# --- INWERSJA ---
+
+class BatchInversionOperator(ABC):
+    @abstractmethod
+    def invert(self, genes: np.ndarray, chromosome_length: int, inversion_probability: float,
+               rng: np.random.Generator) -> None:
+        """
+        Stosuje w miejscu inwersję na wierszach spakowanej macierzy genów z zadanym prawdopodobieństwem.
+        """
+        pass
+
+class BatchSimpleInversion(BatchInversionOperator):
+    def invert(self, genes, chromosome_length, inversion_probability, rng):
+        if chromosome_length < 2:
+            return
+        rows = np.flatnonzero(rng.random(len(genes)) < inversion_probability)
+        if len(rows) == 0:
+            return
+        # Dwa różne losowe indeksy i < j dla każdego wiersza; fragment [i, j] jest odwracany
+        first = rng.integers(0, chromosome_length, size=len(rows))
+        second = (first + rng.integers(1, chromosome_length, size=len(rows))) % chromosome_length
+        start, stop = np.minimum(first, second)[:, None], np.maximum(first, second)[:, None]
+        positions = np.arange(chromosome_length)
+        inside = (positions >= start) & (positions <= stop)
+        source = np.where(inside, start + stop - positions, positions)
+        bits = np.unpackbits(genes[rows], axis=1, count=chromosome_length)
+        genes[rows] = np.packbits(np.take_along_axis(bits, source, axis=1), axis=1)
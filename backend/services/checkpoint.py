@@ -0,0 +1,121 @@
+import os
+import json
+import numpy as np
+
+# Punkt kontrolny długiego przebiegu w katalogu:
+#   genes-0.npy, genes-1.npy, fitness-0.npy, fitness-1.npy – dwa bufory (mapowane w pamięć)
+#       macierzy genów i wektora fitness, zapisywane naprzemiennie,
+#   history.jsonl – historia epok dopisywana przyrostowo,
+#   cache-0.json, cache-1.json – opcjonalna zawartość pamięci podręcznej funkcji celu,
+#       zapisywana do tego samego bufora co geny,
+#   state.json – wskazanie aktywnego bufora, numer epoki, stan generatora i liczniki.
+# state.json podmieniany jest atomowo dopiero po zapisaniu bufora, więc przerwanie zapisu
+# w dowolnym momencie pozostawia poprzedni, spójny punkt kontrolny.
+
+STATE_FILE = "state.json"
+HISTORY_FILE = "history.jsonl"
+
+class Checkpoint:
+    def __init__(self, directory: str):
+        """
+        :param directory: katalog punktu kontrolnego (tworzony przy pierwszym zapisie)
+        """
+        self.directory = directory
+        self._genes = [None, None]
+        self._fitness = [None, None]
+        self._state = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def exists(self) -> bool:
+        return os.path.exists(self._path(STATE_FILE))
+
+    def reset(self) -> None:
+        """
+        Usuwa stan i historię poprzedniego przebiegu (bufory zostaną nadpisane).
+        """
+        for name in (STATE_FILE, HISTORY_FILE):
+            if os.path.exists(self._path(name)):
+                os.remove(self._path(name))
+        self._state = None
+
+    def load(self):
+        """
+        Wczytuje ostatni spójny punkt kontrolny.
+        :return: krotka (stan, macierz genów, wektor fitness, historia)
+        """
+        with open(self._path(STATE_FILE)) as f:
+            state = json.load(f)
+        slot = state["slot"]
+        genes = np.load(self._path(f"genes-{slot}.npy"))
+        fitness = np.load(self._path(f"fitness-{slot}.npy"))
+        history = []
+        with open(self._path(HISTORY_FILE), "rb+") as f:
+            for _ in range(state["history_length"]):
+                history.append(json.loads(f.readline()))
+            # Wpisy dopisane po ostatnim zapisie stanu są odrzucane
+            f.truncate(f.tell())
+        self._state = state
+        return state, genes, fitness, history
+
+    def load_cache(self):
+        """
+        Wczytuje zawartość pamięci podręcznej funkcji celu z aktywnego bufora (po load).
+        :return: stan zapisany przez FitnessCache.export_state lub None, jeśli nie był zapisany
+        """
+        path = self._path(f"cache-{self._state['slot']}.json")
+        if not self._state.get("cache") or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _buffer(self, buffers: list, name: str, slot: int, array: np.ndarray) -> np.ndarray:
+        # Bufor mapowany w pamięć tworzony jest raz; kolejne zapisy nadpisują go w miejscu
+        buffer = buffers[slot]
+        if buffer is None or buffer.shape != array.shape or buffer.dtype != array.dtype:
+            buffer = np.lib.format.open_memmap(self._path(f"{name}-{slot}.npy"), mode="w+",
+                                               dtype=array.dtype, shape=array.shape)
+            buffers[slot] = buffer
+        return buffer
+
+    def save(self, genes: np.ndarray, fitness: np.ndarray, state: dict, new_history: list,
+             cache: dict = None) -> None:
+        """
+        Zapisuje punkt kontrolny: bufor nieaktywny, dopisane wpisy historii, a na końcu state.json.
+        :param genes: spakowana macierz genów
+        :param fitness: wektor wartości fitness
+        :param state: stan przebiegu (epoka, stan generatora, liczniki) – zapisywany jako JSON
+        :param new_history: wpisy historii od poprzedniego zapisu
+        :param cache: opcjonalny stan pamięci podręcznej funkcji celu (FitnessCache.export_state)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        previous = self._state or {"slot": 1, "history_length": 0}
+        slot = 1 - previous["slot"]
+
+        for buffers, name, array in ((self._genes, "genes", genes), (self._fitness, "fitness", fitness)):
+            buffer = self._buffer(buffers, name, slot, array)
+            buffer[...] = array
+            buffer.flush()
+
+        if cache is not None:
+            with open(self._path(f"cache-{slot}.json"), "w") as f:
+                json.dump(cache, f)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with open(self._path(HISTORY_FILE), "a") as f:
+            for entry in new_history:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        state = {**state, "slot": slot, "history_length": previous["history_length"] + len(new_history),
+                 "cache": cache is not None}
+        temporary = self._path(STATE_FILE + ".tmp")
+        with open(temporary, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self._path(STATE_FILE))
+        self._state = state
@@ -1,8 +1,28 @@
 import time
 import math
-import random
+import numpy as np
 from backend.models.population import Population
-from backend.services.operators import *
+from backend.models.bit_population import BitPopulation
+from backend.models.real_population import RealPopulation
+from backend.models.fitness import get_fitness_function
+from backend.models.fitness_cache import FitnessCache
+from backend.services.stopping import StoppingCriteria, EPOCHS
+from backend.services.replacement import GENERATIONAL, STRATEGIES as REPLACEMENT_STRATEGIES
+from backend.services.instrumentation import EpochTimer, profile_report
+from backend.services.checkpoint import Checkpoint
+from backend.services.operators import (
+    TournamentSelection, RouletteSelection, StochasticUniversalSampling, RankSelection, BestSelection,
+    OnePointCrossover, TwoPointCrossover, UniformCrossover, GrainCrossover,
+    OnePointMutation, BoundaryMutation, TwoPointMutation, BitFlipMutation, SimpleInversion
+)
+from backend.services.batch_operators import (
+    BatchTournamentSelection, BatchRouletteSelection, BatchStochasticUniversalSampling, BatchRankSelection,
+    BatchBestSelection, BatchOnePointCrossover, BatchTwoPointCrossover, BatchUniformCrossover, BatchGrainCrossover,
+    BatchOnePointMutation, BatchBoundaryMutation, BatchTwoPointMutation, BatchBitFlipMutation, BatchSimpleInversion
+)
+from backend.services.real_operators import (
+    ArithmeticCrossover, BlendCrossover, SimulatedBinaryCrossover, GaussianMutation, PolynomialMutation
+)
 
 def calculate_chromosome_length(search_range, precision):
     a, b = search_range
@@ -10,129 +30,374 @@ def calculate_chromosome_length(search_range, precision):
     m = math.ceil(math.log2((b - a) * (10 ** precision) + 1))
     return m
 
+def build_object_operators(config: dict):
+    """
+    Tworzy operatory dla populacji obiektowej (engine = "object") na podstawie konfiguracji.
+    :return: krotka (selekcja, krzyżowanie, mutacja, inwersja)
+    """
+    selection_method = config.get("selection_method", "tournament").lower()
+    crossover_method = config.get("crossover_method", "one_point").lower()
+    mutation_method = config.get("mutation_method", "one_point").lower()
+
+    if selection_method == "roulette":
+        selection_operator = RouletteSelection()
+    elif selection_method == "sus":
+        selection_operator = StochasticUniversalSampling()
+    elif selection_method == "rank":
+        selection_operator = RankSelection(selection_pressure=config.get("selection_pressure", 1.5))
+    elif selection_method == "best":
+        selection_operator = BestSelection(count=config.get("best_count", 3))
+    else:
+        # Domyślnie Tournament
+        selection_operator = TournamentSelection(tournament_size=config.get("tournament_size", 3))
+
+    if crossover_method == "two_point":
+        crossover_operator = TwoPointCrossover()
+    elif crossover_method == "uniform":
+        crossover_operator = UniformCrossover()
+    elif crossover_method == "grain":
+        crossover_operator = GrainCrossover()
+    else:
+        crossover_operator = OnePointCrossover()
+
+    if mutation_method == "boundary":
+        mutation_operator = BoundaryMutation()
+    elif mutation_method == "two_point":
+        mutation_operator = TwoPointMutation()
+    elif mutation_method == "bit_flip":
+        mutation_operator = BitFlipMutation()
+    else:
+        mutation_operator = OnePointMutation()
+
+    # Jedyna dostępna metoda inwersji (inversion_method = "simple")
+    inversion_operator = SimpleInversion()
+
+    return selection_operator, crossover_operator, mutation_operator, inversion_operator
+
+def build_batch_operators(config: dict):
+    """
+    Tworzy operatory dla populacji bitowej (engine = "numpy") na podstawie konfiguracji.
+    :return: krotka (selekcja, krzyżowanie, mutacja, inwersja)
+    """
+    selection_method = config.get("selection_method", "tournament").lower()
+    crossover_method = config.get("crossover_method", "one_point").lower()
+    mutation_method = config.get("mutation_method", "one_point").lower()
+
+    if selection_method == "roulette":
+        selection_operator = BatchRouletteSelection()
+    elif selection_method == "sus":
+        selection_operator = BatchStochasticUniversalSampling()
+    elif selection_method == "rank":
+        selection_operator = BatchRankSelection(selection_pressure=config.get("selection_pressure", 1.5))
+    elif selection_method == "best":
+        selection_operator = BatchBestSelection(count=config.get("best_count", 3))
+    else:
+        selection_operator = BatchTournamentSelection(tournament_size=config.get("tournament_size", 3))
+
+    if crossover_method == "two_point":
+        crossover_operator = BatchTwoPointCrossover()
+    elif crossover_method == "uniform":
+        crossover_operator = BatchUniformCrossover()
+    elif crossover_method == "grain":
+        crossover_operator = BatchGrainCrossover()
+    else:
+        crossover_operator = BatchOnePointCrossover()
+
+    if mutation_method == "boundary":
+        mutation_operator = BatchBoundaryMutation()
+    elif mutation_method == "two_point":
+        mutation_operator = BatchTwoPointMutation()
+    elif mutation_method == "bit_flip":
+        mutation_operator = BatchBitFlipMutation()
+    else:
+        mutation_operator = BatchOnePointMutation()
+
+    inversion_operator = BatchSimpleInversion()
+
+    return selection_operator, crossover_operator, mutation_operator, inversion_operator
+
+def build_real_operators(config: dict):
+    """
+    Tworzy operatory dla populacji o kodowaniu rzeczywistym (encoding = "real") na podstawie konfiguracji.
+    Selekcja jest wspólna z populacją bitową; inwersja nie dotyczy kodowania rzeczywistego (None).
+    :return: krotka (selekcja, krzyżowanie, mutacja, inwersja)
+    """
+    selection_operator = build_batch_operators(config)[0]
+    crossover_method = config.get("crossover_method", "blx").lower()
+    mutation_method = config.get("mutation_method", "gaussian").lower()
+
+    if crossover_method == "arithmetic":
+        crossover_operator = ArithmeticCrossover()
+    elif crossover_method == "sbx":
+        crossover_operator = SimulatedBinaryCrossover(eta=config.get("sbx_eta", 15.0))
+    else:
+        # Domyślnie BLX-alfa – także dla metod binarnych (np. "one_point") przekazanych przez interfejs
+        crossover_operator = BlendCrossover(alpha=config.get("blx_alpha", 0.5))
+
+    if mutation_method == "polynomial":
+        mutation_operator = PolynomialMutation(eta=config.get("mutation_eta", 20.0))
+    else:
+        mutation_operator = GaussianMutation(scale=config.get("mutation_scale", 0.1))
+
+    return selection_operator, crossover_operator, mutation_operator, None
+
+def create_fitness_function(config: dict):
+    """
+    Tworzy funkcję celu z rejestru – bez podanego zakresu używany jest zakres właściwy dla funkcji.
+    """
+    return get_fitness_function(config.get("function", "hyperellipsoid"), config.get("variables", 10),
+                                config.get("search_range"))
+
+def create_bit_population(config: dict, fitness_function, fitness_cache=None, rng=None) -> BitPopulation:
+    """
+    Tworzy i losowo inicjalizuje populację bitową (engine = "numpy") na podstawie konfiguracji.
+    """
+    num_vars = config.get("variables", 10)
+    search_range = fitness_function.search_range
+    chromosome_length = calculate_chromosome_length(search_range, config.get("precision", 6)) * num_vars
+    population = BitPopulation(config.get("population_size", 100), search_range, num_vars=num_vars,
+                               gray=config.get("encoding", "binary").lower() == "gray",
+                               rng=rng, fitness_cache=fitness_cache)
+    population.initialize(chromosome_length)
+    return population
+
+def create_real_population(config: dict, fitness_function, fitness_cache=None, rng=None) -> RealPopulation:
+    """
+    Tworzy i losowo inicjalizuje populację o kodowaniu rzeczywistym (encoding = "real").
+    """
+    population = RealPopulation(config.get("population_size", 100), fitness_function.search_range,
+                                num_vars=config.get("variables", 10), rng=rng, fitness_cache=fitness_cache)
+    population.initialize()
+    return population
+
+def evolution_parameters(config: dict) -> dict:
+    """
+    Zwraca prawdopodobieństwa operatorów i liczbę elit przekazywane do metody evolve.
+    """
+    return {
+        "crossover_probability": config.get("crossover_probability", 0.8),
+        "mutation_probability": config.get("mutation_probability", 0.3),
+        "inversion_probability": config.get("inversion_probability", 0.3),
+        "elitism_count": config.get("elitism_count", 2),
+        "replacement": config.get("replacement", GENERATIONAL),
+        "offspring_count": config.get("offspring_count")
+    }
+
 def run_ga(config: dict) -> dict:
+    """
+    Uruchamia algorytm genetyczny i zwraca wynik wraz z pełną historią epok.
+    W modelu wyspowym wynik zawiera też historię każdej wyspy (pole history w elementach islands).
+    """
+    history = []
+    island_histories = None
+    stream = iter_ga(config)
+    while True:
+        try:
+            snapshot = next(stream)
+        except StopIteration as stop:
+            result = stop.value
+            break
+        history.append({"x": snapshot["x"], "fitness": snapshot["fitness"]})
+        if "islands" in snapshot:
+            if island_histories is None:
+                island_histories = [[] for _ in snapshot["islands"]]
+            for island_history, entry in zip(island_histories, snapshot["islands"]):
+                island_history.append(entry)
+    result["history"] = history
+    if island_histories is not None:
+        for island, island_history in zip(result["islands"], island_histories):
+            island["history"] = island_history
+    return result
+
+def iter_ga(config: dict):
+    """
+    Generator uruchamiający algorytm genetyczny epoka po epoce.
+    Po każdej epoce zwraca migawkę: epoch, x, fitness (najlepszy osobnik populacji), mean (średnia
+    wartość fitness), diversity (różnorodność populacji) i elapsed (czas od startu w sekundach).
+    Historia nie jest przechowywana – wartością zwracaną przez generator (StopIteration.value)
+    jest podsumowanie przebiegu bez pola history. Przebieg kończy się po epochs epokach
+    lub wcześniej, gdy zadziała jedno z kryteriów zatrzymania (StoppingCriteria).
+    """
     start_time = time.time()
     
     # Odczyt parametrów z JSON
-    function_name = config.get("function", "hyperellipsoid")
     num_vars = config.get("variables", 10)
     pop_size = config.get("population_size", 100)
     epochs = config.get("epochs", 50)
-    search_range = config.get("search_range", [-65.536, 65.536])
     precision = config.get("precision", 6)
-    optimization_type = config.get("optimization_type", "minimization")
+    engine = config.get("engine", "object")
+    gray = config.get("encoding", "binary").lower() == "gray"
+    fitness_cache_size = config.get("fitness_cache_size", 0)
+    workers = config.get("workers", 0)
+    chunk_size = config.get("chunk_size")
+    seed = config.get("seed")
     
     # Parametry operatorów
-    tournament_size = config.get("tournament_size", 3)
     crossover_probability = config.get("crossover_probability", 0.8)
     mutation_probability = config.get("mutation_probability", 0.3)
     inversion_probability = config.get("inversion_probability", 0.3)
     elitism_count = config.get("elitism_count", 2)
+    # Strategia zastępowania populacji i liczba potomków w kroku (steady_state, mu_plus_lambda, mu_comma_lambda)
+    replacement = config.get("replacement", GENERATIONAL)
+    offspring_count = config.get("offspring_count")
+    if replacement not in REPLACEMENT_STRATEGIES:
+        raise ValueError(f"Nieznana strategia zastępowania: {replacement}")
     
-    # Wyliczamy długość chromosomu dla jednej zmiennej
-    chromosome_length = calculate_chromosome_length(search_range, precision)
-    
-    # Inicjalizacja funkcji celu – przykładowo Hyperellipsoid
-    if function_name.lower() == "hyperellipsoid":
-        from backend.models.fitness import HyperellipsoidFitness
-        fitness_function = HyperellipsoidFitness(num_vars=num_vars, search_range=search_range)
-    else:
-        # Domyślnie Hyperellipsoid
-        from backend.models.fitness import HyperellipsoidFitness
-        fitness_function = HyperellipsoidFitness(num_vars=num_vars, search_range=search_range)
-    
-    # Inicjalizacja populacji
-    population = Population(pop_size)
-    population.initialize(chromosome_length)
-    
-    # Odczyt dodatkowych parametrów dotyczących metod operatorów
-    selection_method = config.get("selection_method", "tournament")
-    crossover_method = config.get("crossover_method", "one_point")
-    mutation_method = config.get("mutation_method", "one_point")
-    inversion_method = config.get("inversion_method", "simple")
-    
-    # Inicjalizacja operatora selekcji
-    if selection_method.lower() == "tournament":
-        
-        selection_operator = TournamentSelection(tournament_size=tournament_size)
-    elif selection_method.lower() == "roulette":
-
-        selection_operator = RouletteSelection()
-    elif selection_method.lower() == "best":
-
-        best_count = config.get("best_count", 3)
-        selection_operator = BestSelection(count=best_count)
-    else:
-        # Domyślnie Tournament
+    # Model wyspowy – osobne populacje w osobnych procesach z okresową migracją
+    if config.get("island_count", 1) > 1 or config.get("islands"):
+        from backend.services.island_service import iter_islands
+        return (yield from iter_islands(config))
 
-        selection_operator = TournamentSelection(tournament_size=tournament_size)
-    
-    # Inicjalizacja operatora krzyżowania
-    if crossover_method.lower() == "one_point":
+    # Inicjalizacja funkcji celu z rejestru – bez podanego zakresu używamy zakresu właściwego dla funkcji
+    fitness_function = create_fitness_function(config)
+    search_range = fitness_function.search_range
 
-        crossover_operator = OnePointCrossover()
-    elif crossover_method.lower() == "two_point":
+    # Chromosom składa się z num_vars segmentów – po jednym na każdą zmienną
+    chromosome_length = calculate_chromosome_length(search_range, precision) * num_vars
 
-        crossover_operator = TwoPointCrossover()
-    elif crossover_method.lower() == "uniform":
+    # Jeden generator na przebieg, przekazywany populacji i wszystkim operatorom –
+    # ten sam seed daje tę samą historię (bez seed generator inicjalizowany jest entropią systemu)
+    rng = np.random.default_rng(seed)
 
-        crossover_operator = UniformCrossover()
-    elif crossover_method.lower() == "grain":
+    # Opcjonalna pamięć podręczna wartości funkcji celu (genotyp -> fitness)
+    fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size > 0 else None
 
-        crossover_operator = GrainCrossover()
+    # Inicjalizacja populacji – rzeczywistej (macierz float), obiektowej lub bitowej (macierz NumPy)
+    if config.get("encoding", "binary").lower() == "real":
+        population = create_real_population(config, fitness_function, fitness_cache, rng)
+        selection_operator, crossover_operator, mutation_operator, inversion_operator = build_real_operators(config)
+    elif engine.lower() == "numpy":
+        population = create_bit_population(config, fitness_function, fitness_cache, rng)
+        selection_operator, crossover_operator, mutation_operator, inversion_operator = build_batch_operators(config)
     else:
+        population = Population(pop_size, search_range, num_vars=num_vars, gray=gray, fitness_cache=fitness_cache,
+                                rng=rng)
+        population.initialize(chromosome_length)
+        selection_operator, crossover_operator, mutation_operator, inversion_operator = build_object_operators(config)
 
-        crossover_operator = OnePointCrossover()
-    
-    # Inicjalizacja operatora mutacji
-    if mutation_method.lower() == "one_point":
-
-        mutation_operator = OnePointMutation()
-    elif mutation_method.lower() == "boundary":
-
-        mutation_operator = BoundaryMutation()
-    elif mutation_method.lower() == "two_point":
+    # Równoległa ocena w puli procesów – jedna pula na cały przebieg; moduł puli ładowany tylko, gdy jest potrzebny
+    evaluator = fitness_function
+    if workers > 1:
+        from backend.services.parallel_evaluation import ParallelEvaluator
+        evaluator = ParallelEvaluator(fitness_function, workers, chunk_size)
 
-        mutation_operator = TwoPointMutation()
-    else:
+    # Opcjonalne pomiary etapów evolve i profil cProfile samego algorytmu (bez konsumenta migawek)
+    timer = None
+    if config.get("instrument") or config.get("track_allocations"):
+        timer = EpochTimer(track_allocations=config.get("track_allocations", False))
+        population.timer = timer
+    profiler = None
+    if config.get("profile"):
+        import cProfile
+        profiler = cProfile.Profile()
 
-        mutation_operator = OnePointMutation()
-    
-    # Inicjalizacja operatora inwersji
-    if inversion_method.lower() == "simple":
-
-        inversion_operator = SimpleInversion()
-    else:
+    stopping = StoppingCriteria.from_config(config, fitness_function)
+    stop_reason = EPOCHS
+    epochs_run = 0
 
-        inversion_operator = SimpleInversion()
+    # Punkt kontrolny – wznowienie od ostatniego zapisu (populacja, fitness, stan generatora, historia
+    # i zawartość pamięci podręcznej, dzięki której liczba ocen zgadza się z przebiegiem nieprzerwanym)
+    checkpoint = None
+    checkpoint_interval = config.get("checkpoint_interval", 10)
+    pending_history = []
+    restored_history = []
+    if config.get("checkpoint_path"):
+        checkpoint = Checkpoint(config["checkpoint_path"])
+        if checkpoint.exists() and config.get("resume", True):
+            state, genes, fitness, restored_history = checkpoint.load()
+            population.import_arrays(genes, fitness)
+            population.evaluations = state["evaluations"]
+            cache_state = checkpoint.load_cache()
+            if fitness_cache is not None and cache_state is not None:
+                fitness_cache.import_state(cache_state)
+            rng.bit_generator.state = state["rng"]
+            epochs_run = state["epoch"]
+            stop_reason = state.get("stop_reason") or EPOCHS
+            start_time -= state["elapsed"]
+        else:
+            checkpoint.reset()
 
+    def save_checkpoint(reason=None):
+        genes, fitness = population.export_arrays()
+        checkpoint.save(genes, fitness, {
+            "epoch": epochs_run,
+            "elapsed": time.time() - start_time,
+            "evaluations": population.evaluations,
+            "rng": rng.bit_generator.state,
+            "stop_reason": reason
+        }, pending_history, fitness_cache.export_state() if fitness_cache is not None else None)
+        pending_history.clear()
 
-    history = []
-    for epoch in range(epochs):
-        population.evolve(
-            fitness_function,
-            selection_operator=selection_operator,
-            crossover_operator=crossover_operator,
-            mutation_operator=mutation_operator,
-            inversion_operator=inversion_operator,
-            crossover_probability=crossover_probability,
-            mutation_probability=mutation_probability,
-            inversion_probability=inversion_probability,
-            elitism_count=elitism_count
-        )
-        best_individual = population.get_best(1)[0]
-        best_x = best_individual.get_phenotype(search_range[0], search_range[1])
-        best_fitness = best_individual.fitness
-        history.append({"x": best_x, "fitness": best_fitness})
+    try:
+        # Historia sprzed wznowienia odtwarzana jest jak zwykłe migawki (także dla kryteriów zatrzymania)
+        for snapshot in restored_history:
+            yield snapshot
+            stopping.check(snapshot, population.evaluations)
+        first_epoch = epochs if stop_reason != EPOCHS else epochs_run
+        for epoch in range(first_epoch, epochs):
+            if profiler is not None:
+                profiler.enable()
+            population.evolve(
+                evaluator,
+                selection_operator=selection_operator,
+                crossover_operator=crossover_operator,
+                mutation_operator=mutation_operator,
+                inversion_operator=inversion_operator,
+                crossover_probability=crossover_probability,
+                mutation_probability=mutation_probability,
+                inversion_probability=inversion_probability,
+                elitism_count=elitism_count,
+                replacement=replacement,
+                offspring_count=offspring_count
+            )
+            best_x, best_fitness = population.best_solution()
+            mean_fitness, diversity = population.statistics()
+            if profiler is not None:
+                profiler.disable()
+            snapshot = {
+                "epoch": epoch + 1,
+                "x": best_x,
+                "fitness": best_fitness,
+                "mean": mean_fitness,
+                "diversity": diversity,
+                "elapsed": time.time() - start_time
+            }
+            epochs_run = epoch + 1
+            yield snapshot
+            reason = stopping.check(snapshot, population.evaluations)
+            if checkpoint is not None:
+                pending_history.append(snapshot)
+                if reason is None and epochs_run % checkpoint_interval == 0 and epochs_run < epochs:
+                    save_checkpoint()
+            if reason is not None:
+                stop_reason = reason
+                break
+        if checkpoint is not None and (pending_history or not checkpoint.exists()):
+            save_checkpoint(stop_reason)
+    finally:
+        if evaluator is not fitness_function:
+            evaluator.close()
+        if timer is not None:
+            timer.close()
 
     elapsed_time = time.time() - start_time
-    best_individual = population.get_best(1)[0]
+    best_x, best_fitness = population.incumbent_solution()
 
     result = {
-        "best_fitness": best_individual.fitness,
-        "best_individual": best_individual.get_phenotype(search_range[0], search_range[1]),
-        "history": history,
+        "function": fitness_function.name,
+        "optimum": fitness_function.optimum_value,
+        "best_fitness": best_fitness,
+        "best_individual": best_x,
+        "evaluations": population.evaluations,
+        "epochs": epochs_run,
+        "stop_reason": stop_reason,
         "time": elapsed_time
     }
+    if fitness_cache is not None:
+        result["cache"] = fitness_cache.stats()
+    if timer is not None:
+        result["metrics"] = timer.summary()
+    if profiler is not None:
+        result["profile"] = profile_report(profiler, config.get("profile_limit", 30))
     
     return result
@@ -0,0 +1,137 @@
+import io
+import sys
+import time
+import pstats
+import threading
+import tracemalloc
+from collections import deque
+
+# Opcjonalne pomiary wewnątrz metody evolve. Populacja trzyma referencję do EpochTimer
+# (domyślnie None) – przy wyłączonych pomiarach koszt to kilka porównań z None na epokę.
+
+STAGES = ("evaluate", "select", "crossover", "mutate", "invert", "elitism")
+
+class EpochTimer:
+    def __init__(self, track_allocations: bool = False):
+        """
+        Pomiar czasu etapów epoki metodą okrążeń: lap(nazwa) dolicza czas od poprzedniego znacznika.
+        :param track_allocations: czy śledzić alokacje pamięci (tracemalloc – zauważalnie spowalnia przebieg)
+        """
+        self.track_allocations = track_allocations
+        self.totals = dict.fromkeys(STAGES, 0.0)
+        self.maxima = dict.fromkeys(STAGES, 0.0)
+        self.epochs = 0
+        self.evaluations = 0
+        self.max_evaluations = 0
+        # Bajty zaalokowane w epoce: szczyt tracemalloc ponad poziom z początku epoki
+        self.allocated_bytes = 0
+        self.max_allocated_bytes = 0
+        # Netto zatrzymane bloki pamięci (przyrost sys.getallocatedblocks() w epoce)
+        self.retained_blocks = 0
+        self.peak_bytes = 0
+        self._mark = None
+        self._epoch_evaluations = 0
+        self._epoch_blocks = 0
+        self._epoch_bytes = 0
+        self._started_tracing = False
+
+    def start_epoch(self, evaluations: int) -> None:
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._epoch_bytes = tracemalloc.get_traced_memory()[0]
+            self._epoch_blocks = sys.getallocatedblocks()
+        self._epoch_evaluations = evaluations
+        self._mark = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        self.totals[stage] += elapsed
+        if elapsed > self.maxima[stage]:
+            self.maxima[stage] = elapsed
+        self._mark = now
+
+    def end_epoch(self, evaluations: int) -> None:
+        self.epochs += 1
+        epoch_evaluations = evaluations - self._epoch_evaluations
+        self.evaluations += epoch_evaluations
+        self.max_evaluations = max(self.max_evaluations, epoch_evaluations)
+        if self.track_allocations:
+            self.retained_blocks += sys.getallocatedblocks() - self._epoch_blocks
+            peak = tracemalloc.get_traced_memory()[1]
+            self.allocated_bytes += peak - self._epoch_bytes
+            self.max_allocated_bytes = max(self.max_allocated_bytes, peak - self._epoch_bytes)
+            self.peak_bytes = max(self.peak_bytes, peak)
+
+    def close(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self) -> dict:
+        """
+        Zestawienie pomiarów: czas łączny, średni i maksymalny na epokę dla każdego etapu,
+        liczba ocen funkcji celu na epokę i (opcjonalnie) alokacje.
+        """
+        epochs = max(self.epochs, 1)
+        metrics = {
+            "epochs": self.epochs,
+            "stages": {
+                stage: {"total": self.totals[stage], "mean": self.totals[stage] / epochs, "max": self.maxima[stage]}
+                for stage in STAGES
+            },
+            "evaluations": {"total": self.evaluations, "mean": self.evaluations / epochs, "max": self.max_evaluations}
+        }
+        if self.track_allocations:
+            metrics["allocations"] = {
+                "bytes_per_epoch": self.allocated_bytes / epochs,
+                "max_bytes_per_epoch": self.max_allocated_bytes,
+                "net_retained_blocks_per_epoch": self.retained_blocks / epochs,
+                "peak_bytes": self.peak_bytes
+            }
+        return metrics
+
+def profile_report(profiler, limit: int = 30, sort_by: str = "cumulative") -> str:
+    """
+    Tekstowy raport cProfile ograniczony do limit najkosztowniejszych funkcji.
+    """
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(sort_by).print_stats(limit)
+    return stream.getvalue()
+
+class MetricsRegistry:
+    def __init__(self, max_runs: int = 50):
+        """
+        Zbiór pomiarów ostatnich przebiegów udostępniany przez endpoint /api/ga/metrics.
+        :param max_runs: liczba przechowywanych przebiegów
+        """
+        self._runs = deque(maxlen=max_runs)
+        self._totals = dict.fromkeys(STAGES, 0.0)
+        self._epochs = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def record(self, result: dict) -> None:
+        metrics = result.get("metrics")
+        if metrics is None:
+            return
+        with self._lock:
+            self._count += 1
+            self._epochs += metrics["epochs"]
+            for stage, values in metrics["stages"].items():
+                self._totals[stage] += values["total"]
+            self._runs.append({"function": result.get("function"), "time": result.get("time"), **metrics})
+
+    def summary(self) -> dict:
+        with self._lock:
+            epochs = max(self._epochs, 1)
+            return {
+                "runs": self._count,
+                "epochs": self._epochs,
+                "stages": {stage: {"total": total, "mean_per_epoch": total / epochs}
+                           for stage, total in self._totals.items()},
+                "recent": list(self._runs)
+            }
@@ -1,11 +1,21 @@
+import io
 import json
+import logging
 import os
+import queue
+import sqlite3
+import threading
+import uuid
 from time import time
+from abc import ABC, abstractmethod
 from datetime import datetime
-import matplotlib
-matplotlib.use('Agg')  # Use a non-GUI backend for matplotlib
-# This is required for saving plots to files
-import matplotlib.pyplot as plt
+import numpy as np
+
+# Results are written by pluggable sinks. The history of a run is the bulky part, so the
+# compact sinks store it as arrays (npz) instead of a list of JSON objects. Plots are not
+# rendered when a result is saved - matplotlib is imported only when a plot is requested.
+
+logger = logging.getLogger(__name__)
 
 
 def save_json_to_file(data, filename):
@@ -19,7 +29,7 @@ def save_json_to_file(data, filename):
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, 'w') as f:
         json.dump(data, f, indent=4)
-        
+
 def save_plot_of_fitness_values(result, filename):
     """
     Save a plot of the fitness values to a file.
@@ -27,22 +37,241 @@ def save_plot_of_fitness_values(result, filename):
     :param filename: The name of the file to save the plot to.
     :return: None
     """
-
     y = list(map(lambda x: x["fitness"], result['history']))
-    plt.plot(y)
+    render_plot(y, filename)
+
+def render_plot(fitness, filename):
+    """
+    Render fitness values over generations to a PNG file. matplotlib is imported here,
+    on first use, so that saving results does not pay for it.
+    :param fitness: Sequence of best fitness values, one per epoch.
+    :param filename: The name of the file to save the plot to.
+    :return: None
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Use a non-GUI backend for matplotlib
+    # This is required for saving plots to files
+    import matplotlib.pyplot as plt
+
+    plt.plot(fitness)
     plt.title('Fitness Values Over Generations')
     plt.xlabel('Generation')
     plt.ylabel('Fitness Value')
     plt.savefig(filename)
     plt.close()
 
+def new_run_id():
+    """
+    Return a unique, time-ordered name for a persisted result.
+    """
+    now = datetime.now().fromtimestamp(time()).strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{now}_{uuid.uuid4().hex[:8]}"
+
+def split_history(result):
+    """
+    Split a result into its summary (everything except history) and history arrays.
+    :param result: The result returned by run_ga.
+    :return: Tuple (summary, x, fitness) where x has shape (epochs, num_vars) and fitness (epochs,).
+    """
+    summary = {key: value for key, value in result.items() if key != "history"}
+    history = result.get("history") or []
+    fitness = np.array([entry["fitness"] for entry in history], dtype=float)
+    x = np.array([entry["x"] for entry in history], dtype=float).reshape(len(history), -1)
+    return summary, x, fitness
+
+def history_to_npz(x, fitness):
+    """
+    Serialize history arrays to compressed npz bytes.
+    """
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, x=x, fitness=fitness)
+    return buffer.getvalue()
+
+def load_history(directory, run_id):
+    """
+    Load the fitness history of a run saved by NpzSink.
+    :return: Tuple (x, fitness) or None if the run has no stored history.
+    """
+    filename = os.path.join(directory, f"{run_id}.npz")
+    if not os.path.exists(filename):
+        return None
+    with np.load(filename) as data:
+        return data["x"], data["fitness"]
+
+
+class ResultSink(ABC):
+    """
+    Destination for persisted results.
+    """
+    @abstractmethod
+    def write(self, run_id, result):
+        pass
+
+    def close(self):
+        pass
+
+class JsonSink(ResultSink):
+    """
+    One indented JSON file per run, with the full history (the original format).
+    """
+    def __init__(self, directory="results"):
+        self.directory = directory
+
+    def write(self, run_id, result):
+        save_json_to_file(result, os.path.join(self.directory, f"{run_id}.json"))
+
+class JsonLinesSink(ResultSink):
+    """
+    All runs appended to a single JSON Lines file, one compact line per run.
+    """
+    def __init__(self, path="results/results.jsonl", include_history=False):
+        self.path = path
+        self.include_history = include_history
+
+    def write(self, run_id, result):
+        record = result if self.include_history else split_history(result)[0]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"run_id": run_id, **record}) + "\n")
+
+class NpzSink(ResultSink):
+    """
+    Compact summary JSON plus the history as a compressed NumPy archive (x and fitness arrays).
+    """
+    def __init__(self, directory="results"):
+        self.directory = directory
+
+    def write(self, run_id, result):
+        summary, x, fitness = split_history(result)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{run_id}.json"), "w") as f:
+            json.dump(summary, f)
+        np.savez_compressed(os.path.join(self.directory, f"{run_id}.npz"), x=x, fitness=fitness)
+
+class SqliteSink(ResultSink):
+    """
+    Results store in an SQLite database: summary columns for querying, the remaining summary
+    as JSON and the history as a compressed npz blob.
+    """
+    def __init__(self, path="results/results.db"):
+        self.path = path
+        self._connection = None
+
+    def _connect(self):
+        # The connection is opened lazily, in the thread that writes
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "run_id TEXT PRIMARY KEY, function TEXT, best_fitness REAL, evaluations INTEGER, "
+                "time REAL, summary TEXT, history BLOB)"
+            )
+        return self._connection
+
+    def write(self, run_id, result):
+        summary, x, fitness = split_history(result)
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, summary.get("function"), summary.get("best_fitness"), summary.get("evaluations"),
+                 summary.get("time"), json.dumps(summary), history_to_npz(x, fitness))
+            )
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
-def persist_result(result):
+SINKS = {
+    "json": JsonSink,
+    "jsonl": JsonLinesSink,
+    "npz": NpzSink,
+    "sqlite": SqliteSink,
+}
+
+def create_sinks(names, directory="results"):
+    """
+    Create sinks by name. File-based sinks write into the given directory.
+    :param names: Iterable of sink names from SINKS.
+    :return: List of sinks.
+    """
+    sinks = []
+    for name in names:
+        if name == "jsonl":
+            sinks.append(JsonLinesSink(os.path.join(directory, "results.jsonl")))
+        elif name == "sqlite":
+            sinks.append(SqliteSink(os.path.join(directory, "results.db")))
+        else:
+            sinks.append(SINKS[name](directory))
+    return sinks
+
+
+class ResultWriter:
+    """
+    Background writer: results are put on a bounded queue and written by a worker thread,
+    so persistence is not part of the request latency.
     """
-    Persist the result to a file and creates a plot of the fitness values.
+    def __init__(self, sinks, max_queue=256):
+        self.sinks = sinks
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    def submit(self, result, run_id=None):
+        """
+        Queue a result for writing. Blocks only when the queue is full.
+        :return: The run id under which the result will be stored.
+        """
+        run_id = run_id or new_run_id()
+        self._queue.put((run_id, result))
+        return run_id
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    break
+                run_id, result = item
+                for sink in self.sinks:
+                    try:
+                        sink.write(run_id, result)
+                    except Exception:
+                        logger.exception("Failed to persist result %s with %s", run_id, type(sink).__name__)
+            finally:
+                self._queue.task_done()
+        for sink in self.sinks:
+            sink.close()
+
+    def flush(self):
+        """
+        Wait until all queued results are written.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Write the remaining results and stop the worker thread.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+
+def persist_result(result, sinks=None, plot=False, directory="results"):
+    """
+    Persist the result synchronously.
     :param result: The result to persist.
-    :return: None
+    :param sinks: Sinks to write to, by default NpzSink in the given directory.
+    :param plot: Whether to also render a plot of the fitness values.
+    :return: The run id of the persisted result.
     """
-    now = datetime.now().fromtimestamp(time()).strftime("%Y-%m-%d_%H-%M-%S")
-    save_json_to_file(result, f"results/{now}.json")
-    save_plot_of_fitness_values(result, f"results/{now}.png")
+    run_id = new_run_id()
+    sinks = sinks if sinks is not None else [NpzSink(directory)]
+    for sink in sinks:
+        sink.write(run_id, result)
+        sink.close()
+    if plot:
+        save_plot_of_fitness_values(result, os.path.join(directory, f"{run_id}.png"))
+    return run_id
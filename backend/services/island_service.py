@@ -0,0 +1,204 @@
+import time
+import multiprocessing
+import numpy as np
+from backend.services.stopping import StoppingCriteria, EPOCHS
+from backend.services.ga_service import (
+    create_fitness_function, create_bit_population, build_batch_operators, evolution_parameters
+)
+
+# Model wyspowy: każda wyspa to osobna populacja bitowa ewoluująca w osobnym procesie.
+# Co migration_interval epok najlepsze osobniki wędrują między wyspami. Migranci przesyłani są
+# jako surowe bajty spakowanej macierzy genów i wektora fitness, a nie jako obiekty Pythona.
+
+def _island_worker(connection, config: dict) -> None:
+    """
+    Pętla procesu wyspy. Obsługuje polecenia:
+    ("run", epochs, migrants) – przyjmuje migrantów, wykonuje epochs epok i odsyła historię oraz emigrantów,
+    ("stop",) – kończy pracę.
+    """
+    fitness_function = create_fitness_function(config)
+    population = create_bit_population(config, fitness_function, rng=np.random.default_rng(config["seed_sequence"]))
+    operators = build_batch_operators(config)
+    parameters = evolution_parameters(config)
+    migration_size = config.get("migration_size", 2)
+    row_bytes = population.genes.shape[1]
+
+    while True:
+        command = connection.recv()
+        if command[0] == "stop":
+            break
+        _, epochs, migrants = command
+        if migrants is not None:
+            # Migranci zastępują najgorsze osobniki wyspy
+            genes_payload, fitness_payload = migrants
+            genes = np.frombuffer(genes_payload, dtype=np.uint8).reshape(-1, row_bytes)
+            fitness = np.frombuffer(fitness_payload, dtype=float)
+            worst = np.argsort(population.fitness, kind="stable")[::-1][:len(genes)]
+            population.genes[worst] = genes
+            population.fitness[worst] = fitness  # wartość fitness przychodzi razem z migrantem
+            population.phenotypes[worst] = population.decoder.decode(
+                np.unpackbits(genes, axis=1, count=population.chromosome_length))
+
+        history = []
+        for _ in range(epochs):
+            population.evolve(fitness_function, *operators, **parameters)
+            best_x, best_fitness = population.best_solution()
+            mean_fitness, diversity = population.statistics()
+            history.append({"x": best_x, "fitness": best_fitness, "mean": mean_fitness, "diversity": diversity})
+
+        emigrants = population.get_best(migration_size)
+        connection.send({
+            "history": history,
+            "evaluations": population.evaluations,
+            "migrants": (population.genes[emigrants].tobytes(), population.fitness[emigrants].tobytes())
+        })
+    connection.close()
+
+def validate_island_config(config: dict) -> None:
+    """
+    Odrzuca opcje, których model wyspowy nie obsługuje – zamiast je po cichu pomijać.
+    Wyspy to zawsze populacje bitowe (engine = "numpy") oceniane szeregowo w procesie wyspy.
+    """
+    if config.get("encoding", "binary").lower() == "real":
+        raise ValueError("Model wyspowy obsługuje tylko kodowanie binarne.")
+    if config.get("engine", "numpy").lower() != "numpy":
+        raise ValueError('Model wyspowy obsługuje tylko silnik "numpy".')
+    if config.get("workers", 0) > 1:
+        raise ValueError("Model wyspowy nie obsługuje równoległej oceny (workers).")
+    if config.get("fitness_cache_size", 0) > 0:
+        raise ValueError("Model wyspowy nie obsługuje pamięci podręcznej funkcji celu (fitness_cache_size).")
+    if config.get("checkpoint_path"):
+        raise ValueError("Model wyspowy nie obsługuje punktów kontrolnych (checkpoint_path).")
+
+def migration_sources(island_count: int, topology: str, rng: np.random.Generator) -> list:
+    """
+    Zwraca dla każdej wyspy indeks wyspy, z której przyjmuje migrantów.
+    :param topology: "ring" (wyspa i otrzymuje od i-1) lub "random" (losowa inna wyspa)
+    """
+    if topology == "random":
+        offsets = rng.integers(1, island_count, size=island_count)
+        return [(i - int(offset)) % island_count for i, offset in enumerate(offsets)]
+    return [(i - 1) % island_count for i in range(island_count)]
+
+def iter_islands(config: dict):
+    """
+    Generator uruchamiający algorytm genetyczny w modelu wyspowym.
+    Konfiguracja wysp: "island_count" wysp o wspólnych parametrach lub lista "islands"
+    z nadpisaniami parametrów (np. operatorów) dla każdej wyspy.
+    Migawki epok mają te same pola co w iter_ga (najlepszy wynik spośród wysp, średnie mean
+    i diversity po wyspach) oraz listę "islands" z parą (x, fitness) każdej wyspy.
+    Wyspy raportują epoki paczkami co migration_interval, więc migawki przychodzą seriami.
+    Kryterium zatrzymania przerywa przebieg w epoce, w której zadziałało – pozostałe migawki
+    paczki nie są zwracane (wyspy wykonały już jednak całą paczkę, co widać w evaluations).
+    """
+    validate_island_config(config)
+    start_time = time.time()
+    epochs = config.get("epochs", 50)
+    migration_interval = config.get("migration_interval", 10)
+    topology = config.get("topology", "ring").lower()
+    island_overrides = config.get("islands") or [{}] * config.get("island_count", 4)
+    island_configs = [{**config, **overrides} for overrides in island_overrides]
+    for island_config in island_configs:
+        validate_island_config(island_config)
+        island_config["engine"] = "numpy"
+    island_count = len(island_configs)
+    # Niezależne strumienie losowe: jeden dla migracji i po jednym dla każdej wyspy, wyprowadzone z seed
+    migration_seed, *island_seeds = np.random.SeedSequence(config.get("seed")).spawn(island_count + 1)
+    for island_config, island_seed in zip(island_configs, island_seeds):
+        island_config["seed_sequence"] = island_seed
+    rng = np.random.default_rng(migration_seed)
+    stopping = StoppingCriteria.from_config(config, create_fitness_function(config))
+    stop_reason = EPOCHS
+
+    # Procesy "spawn" zamiast fork – model wyspowy działa w wątkach serwera obok innych wątków
+    context = multiprocessing.get_context("spawn")
+    connections = []
+    processes = []
+    for island_config in island_configs:
+        parent_connection, child_connection = context.Pipe()
+        process = context.Process(target=_island_worker, args=(child_connection, island_config), daemon=True)
+        process.start()
+        child_connection.close()
+        connections.append(parent_connection)
+        processes.append(process)
+
+    island_best = [{"x": None, "fitness": None} for _ in range(island_count)]
+    best = {"x": None, "fitness": None}
+    evaluations = [0] * island_count
+    migrations = 0
+    migrants = [None] * island_count
+    try:
+        completed = 0
+        while completed < epochs:
+            chunk = min(migration_interval, epochs - completed)
+            for connection, incoming in zip(connections, migrants):
+                connection.send(("run", chunk, incoming))
+            replies = [connection.recv() for connection in connections]
+            elapsed = time.time() - start_time
+            for i, reply in enumerate(replies):
+                evaluations[i] = reply["evaluations"]
+            # Migawka łączna – w każdej epoce najlepszy wynik spośród wszystkich wysp
+            for offset, entries in enumerate(zip(*(reply["history"] for reply in replies))):
+                for i, entry in enumerate(entries):
+                    if island_best[i]["fitness"] is None or entry["fitness"] < island_best[i]["fitness"]:
+                        island_best[i] = {"x": entry["x"], "fitness": entry["fitness"]}
+                leader = min(entries, key=lambda entry: entry["fitness"])
+                if best["fitness"] is None or leader["fitness"] < best["fitness"]:
+                    best = {"x": leader["x"], "fitness": leader["fitness"]}
+                snapshot = {
+                    "epoch": completed + offset + 1,
+                    "x": leader["x"],
+                    "fitness": leader["fitness"],
+                    "mean": sum(entry["mean"] for entry in entries) / island_count,
+                    "diversity": sum(entry["diversity"] for entry in entries) / island_count,
+                    "elapsed": elapsed,
+                    "islands": [{"x": entry["x"], "fitness": entry["fitness"]} for entry in entries]
+                }
+                yield snapshot
+                reason = stopping.check(snapshot, sum(evaluations))
+                if reason is not None:
+                    stop_reason = reason
+                    break
+            if stop_reason != EPOCHS:
+                completed = snapshot["epoch"]
+                break
+            completed += chunk
+            if completed < epochs and island_count > 1:
+                sources = migration_sources(island_count, topology, rng)
+                migrants = [replies[source]["migrants"] for source in sources]
+                migrations += 1
+            else:
+                migrants = [None] * island_count
+    finally:
+        for connection in connections:
+            try:
+                connection.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in processes:
+            process.join()
+
+    islands = []
+    for island_config, island_result in zip(island_configs, island_best):
+        islands.append({
+            "selection_method": island_config.get("selection_method", "tournament"),
+            "crossover_method": island_config.get("crossover_method", "one_point"),
+            "mutation_method": island_config.get("mutation_method", "one_point"),
+            "best_fitness": island_result["fitness"],
+            "best_individual": island_result["x"]
+        })
+    fitness_function = create_fitness_function(config)
+
+    return {
+        "function": fitness_function.name,
+        "optimum": fitness_function.optimum_value,
+        "best_fitness": best["fitness"],
+        "best_individual": best["x"],
+        "islands": islands,
+        "migrations": migrations,
+        "evaluations": sum(evaluations),
+        "epochs": completed,
+        "stop_reason": stop_reason,
+        "time": time.time() - start_time
+    }
@@ -0,0 +1,226 @@
+import os
+import time
+import uuid
+import signal
+import threading
+import multiprocessing
+from collections import OrderedDict, deque
+
+# Asynchroniczne uruchamianie algorytmu: zlecenia trafiają do ograniczonej kolejki,
+# a stała liczba wątków dyspozytora uruchamia każde z nich w osobnym procesie.
+# Osobny proces pozwala przerwać zlecenie (anulowanie, przekroczenie czasu) bez
+# współpracy ze strony algorytmu i nie blokuje wątków serwera HTTP.
+# Proces zlecenia nie jest demonem (model wyspowy i równoległa ocena tworzą własne procesy)
+# i działa we własnej grupie procesów – przerwanie zlecenia kończy całe drzewo procesów.
+
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = "finished"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMEOUT = "timeout"
+
+class QueueFullError(Exception):
+    """
+    Kolejka zleceń osiągnęła maksymalną długość.
+    """
+    pass
+
+def _run_job(connection, config: dict, persist: bool, result_sinks, results_dir: str) -> None:
+    """
+    Funkcja procesu roboczego – uruchamia algorytm i odsyła wynik przez potok.
+    Rodzaje zapisu przekazywane są jako nazwy, bo obiekty zapisu nie przechodzą do procesu "spawn".
+    """
+    # Własna grupa procesów – obejmuje także procesy wysp i puli oceny tworzone przez zlecenie
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    try:
+        from backend.services.ga_service import run_ga
+        result = run_ga(config)
+        if persist:
+            from backend.services.io_service import persist_result, create_sinks
+            persist_result(result, create_sinks(result_sinks, results_dir), directory=results_dir)
+        connection.send(("ok", result))
+    except Exception as error:
+        connection.send(("error", f"{type(error).__name__}: {error}"))
+    finally:
+        connection.close()
+
+def _terminate_tree(process) -> None:
+    """
+    Kończy proces zlecenia wraz z procesami, które utworzył (wyspy, pula oceny).
+    """
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # Proces nie zdążył utworzyć własnej grupy (lub system jej nie obsługuje)
+        process.terminate()
+
+class Job:
+    def __init__(self, config: dict, timeout: float = None):
+        self.id = uuid.uuid4().hex
+        self.config = config
+        self.timeout = timeout
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_requested = threading.Event()
+
+    def to_dict(self) -> dict:
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished
+        }
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+class JobManager:
+    def __init__(self, max_workers: int = 2, max_queue: int = 16, timeout: float = None,
+                 max_finished: int = 100, poll_interval: float = 0.1, persist: bool = True,
+                 result_sinks=("npz",), results_dir: str = "results"):
+        """
+        Pula zleceń uruchamiających algorytm genetyczny w tle.
+        :param max_workers: maksymalna liczba jednocześnie wykonywanych zleceń
+        :param max_queue: maksymalna liczba zleceń oczekujących w kolejce
+        :param timeout: domyślny i zarazem maksymalny czas wykonania zlecenia w sekundach (None – bez limitu)
+        :param max_finished: liczba przechowywanych zakończonych zleceń
+        :param poll_interval: co ile sekund dyspozytor sprawdza stan procesu
+        :param persist: czy zapisywać wyniki zakończonych zleceń (persist_result)
+        :param result_sinks: nazwy rodzajów zapisu wyników (jak w create_sinks)
+        :param results_dir: katalog zapisywanych wyników
+        """
+        self.timeout = timeout
+        self.persist = persist
+        self.result_sinks = list(result_sinks)
+        self.results_dir = results_dir
+        self.max_finished = max_finished
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        # Zlecenia oczekujące – anulowane są z niej usuwane, więc od razu zwalniają miejsce
+        self._pending = deque()
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._context = multiprocessing.get_context("spawn")
+        self._threads = [threading.Thread(target=self._dispatch, daemon=True) for _ in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, config: dict) -> str:
+        """
+        Dodaje zlecenie do kolejki.
+        :param config: konfiguracja algorytmu (jak dla run_ga); opcjonalne pole "timeout" skraca limit czasu
+        :return: identyfikator zlecenia
+        :raises QueueFullError: gdy kolejka jest pełna
+        """
+        timeout = config.get("timeout", self.timeout)
+        if self.timeout is not None and (timeout is None or timeout > self.timeout):
+            timeout = self.timeout
+        job = Job(config, timeout)
+        with self._lock:
+            if len(self._pending) >= self.max_queue:
+                raise QueueFullError("Kolejka zleceń jest pełna.")
+            self._pending.append(job)
+            self._jobs[job.id] = job
+            self._available.notify()
+        return job.id
+
+    def get(self, job_id: str) -> dict:
+        """
+        Zwraca stan zlecenia (wraz z wynikiem po zakończeniu) lub None dla nieznanego identyfikatora.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job is not None else None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Anuluje zlecenie oczekujące lub przerywa wykonywane.
+        :return: False, jeśli zlecenie nie istnieje lub już się zakończyło
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in (QUEUED, RUNNING):
+                return False
+            if job.status == QUEUED:
+                self._pending.remove(job)
+                self._finish(job, CANCELLED)
+            job.cancel_requested.set()
+            return True
+
+    def _finish(self, job: Job, status: str, result: dict = None, error: str = None) -> None:
+        # Wywoływane z założoną blokadą
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished = time.time()
+        finished = [key for key, value in self._jobs.items() if value.status not in (QUEUED, RUNNING)]
+        for key in finished[:max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[key]
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._available:
+                while not self._pending:
+                    self._available.wait()
+                job = self._pending.popleft()
+                job.status = RUNNING
+                job.started = time.time()
+            try:
+                self._execute(job)
+            except Exception as error:
+                # Błąd uruchomienia procesu (np. konfiguracja, której nie da się przesłać) kończy
+                # tylko to zlecenie – wątek dyspozytora obsługuje kolejne
+                with self._lock:
+                    self._finish(job, FAILED, error=f"{type(error).__name__}: {error}")
+
+    def _execute(self, job: Job) -> None:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=_run_job,
+                                        args=(sender, job.config, self.persist, self.result_sinks, self.results_dir))
+        try:
+            process.start()
+        except BaseException:
+            receiver.close()
+            raise
+        finally:
+            sender.close()
+
+        status, result, error = FAILED, None, None
+        try:
+            while True:
+                if receiver.poll(self.poll_interval):
+                    kind, payload = receiver.recv()
+                    if kind == "ok":
+                        status, result = FINISHED, payload
+                    else:
+                        error = payload
+                    break
+                if job.cancel_requested.is_set():
+                    status = CANCELLED
+                    break
+                if job.timeout is not None and time.time() - job.started > job.timeout:
+                    status, error = TIMEOUT, f"Przekroczono limit czasu {job.timeout} s."
+                    break
+                if not process.is_alive():
+                    error = f"Proces zakończył się kodem {process.exitcode}."
+                    break
+        except EOFError:
+            error = f"Proces zakończył się kodem {process.exitcode}."
+        finally:
+            if process.is_alive():
+                _terminate_tree(process)
+            process.join()
+            receiver.close()
+
+        with self._lock:
+            self._finish(job, status, result, error)
@@ -1,191 +1,257 @@
+import heapq
 import random
+import numpy as np
 from abc import ABC, abstractmethod
 from backend.models.individual import Individual
 from backend.models.chromosome import Chromosome
+from backend.services.batch_operators import (
+    BatchTournamentSelection, BatchRouletteSelection, BatchStochasticUniversalSampling, BatchRankSelection
+)
+
+def resolve_rng(rng: np.random.Generator = None) -> np.random.Generator:
+    """
+    Zwraca przekazany generator lub – gdy go brak – nowy generator inicjalizowany z modułu random.
+    Population przekazuje swój generator, więc wszystkie losowania przebiegu pochodzą z jednego źródła.
+    """
+    return rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+def mask_value(mask: np.ndarray) -> int:
+    """
+    Zamienia wektor logiczny (pozycje genów) na maskę bitową zgodną z Chromosome.value.
+    """
+    return int.from_bytes(np.packbits(mask).tobytes(), "big") >> ((-len(mask)) % 8)
+
+def writable(individual: Individual, in_place: bool) -> Individual:
+    """
+    Zwraca osobnika, którego chromosom operator może zmienić: samego osobnika, gdy nie jest
+    współdzielony z populacją (in_place), w przeciwnym razie kopię. Wartość fitness jest kasowana.
+    """
+    if in_place:
+        individual.fitness = None
+        individual.phenotype = None
+        return individual
+    chromosome = individual.chromosome
+    return Individual(Chromosome.from_value(chromosome.value, chromosome.length))
 
 # --- SELEKCJA ---
 
 class SelectionOperator(ABC):
     @abstractmethod
-    def select(self, population, **kwargs):
+    def select(self, population, rng: np.random.Generator = None, **kwargs):
         """
         Wybiera osobniki z populacji.
         """
         pass
 
-class TournamentSelection(SelectionOperator):
+class VectorizedSelection(SelectionOperator):
+    """
+    Selekcja wykonywana na wektorze wartości fitness przez operator z batch_operators.
+    """
+    def __init__(self, batch_operator):
+        self.batch_operator = batch_operator
+
+    def select(self, population, rng: np.random.Generator = None, **kwargs):
+        pop = population.individuals
+        fitness = np.fromiter((ind.fitness for ind in pop), dtype=float, count=len(pop))
+        return [pop[i] for i in self.batch_operator.select(fitness, resolve_rng(rng))]
+
+class TournamentSelection(VectorizedSelection):
     def __init__(self, tournament_size=3):
+        super().__init__(BatchTournamentSelection(tournament_size))
         self.tournament_size = tournament_size
 
-    def select(self, population, **kwargs):
-        selected = []
-        pop = population.individuals
-        for _ in range(len(pop)):
-            tournament = random.sample(pop, self.tournament_size)
-            best = min(tournament, key=lambda ind: ind.fitness)  # Zakładamy minimalizację
-            selected.append(best)
-        return selected
-
-class RouletteSelection(SelectionOperator):
-    def select(self, population, **kwargs):
-        pop = population.individuals
-        epsilon = 1e-6
-        max_fitness = max(ind.fitness for ind in pop)
-        total = sum(max_fitness - ind.fitness + epsilon for ind in pop)
-        selected = []
-        for _ in range(len(pop)):
-            r = random.uniform(0, total)
-            accumulator = 0
-            for ind in pop:
-                accumulator += max_fitness - ind.fitness + epsilon
-                if accumulator >= r:
-                    selected.append(ind)
-                    break
-        return selected
+class RouletteSelection(VectorizedSelection):
+    def __init__(self):
+        super().__init__(BatchRouletteSelection())
+
+class StochasticUniversalSampling(VectorizedSelection):
+    def __init__(self):
+        super().__init__(BatchStochasticUniversalSampling())
+
+class RankSelection(VectorizedSelection):
+    def __init__(self, selection_pressure=1.5):
+        super().__init__(BatchRankSelection(selection_pressure))
+        self.selection_pressure = selection_pressure
 
 class BestSelection(SelectionOperator):
     def __init__(self, count):
         self.count = count
 
-    def select(self, population, **kwargs):
-        sorted_individuals = sorted(population.individuals, key=lambda ind: ind.fitness)
-        return sorted_individuals[:self.count]
+    def select(self, population, rng: np.random.Generator = None, **kwargs):
+        return heapq.nsmallest(self.count, population.individuals, key=lambda ind: ind.fitness)
 
 # --- KRZYŻOWANIE ---
 
 class CrossoverOperator(ABC):
     @abstractmethod
-    def crossover(self, parent1: Individual, parent2: Individual):
+    def crossover(self, parent1: Individual, parent2: Individual, rng: np.random.Generator = None):
         """
-        Krzyżuje dwóch rodziców i zwraca parę potomków.
+        Krzyżuje dwóch rodziców i zwraca parę nowych potomków (rodzice pozostają bez zmian).
         """
         pass
 
+def swap_masked(parent1: Individual, parent2: Individual, mask: int):
+    """
+    Potomkowie z genami rodziców wymienionymi na pozycjach wskazanych maską.
+    """
+    chromosome1, chromosome2 = parent1.chromosome, parent2.chromosome
+    if chromosome1.length != chromosome2.length:
+        raise ValueError("Chromosomy muszą mieć taką samą długość.")
+    difference = (chromosome1.value ^ chromosome2.value) & mask
+    length = chromosome1.length
+    return (Individual(Chromosome.from_value(chromosome1.value ^ difference, length)),
+            Individual(Chromosome.from_value(chromosome2.value ^ difference, length)))
+
 class OnePointCrossover(CrossoverOperator):
-    def crossover(self, parent1: Individual, parent2: Individual):
-        gene1 = parent1.chromosome.gene
-        gene2 = parent2.chromosome.gene
-        if len(gene1) != len(gene2):
+    def crossover(self, parent1: Individual, parent2: Individual, rng: np.random.Generator = None):
+        chromosome = parent1.chromosome
+        if chromosome.length != parent2.chromosome.length:
             raise ValueError("Chromosomy muszą mieć taką samą długość.")
-        point = random.randint(1, len(gene1) - 1)
-        child_gene1 = gene1[:point] + gene2[point:]
-        child_gene2 = gene2[:point] + gene1[point:]
-        return Individual(Chromosome(child_gene1)), Individual(Chromosome(child_gene2))
+        point = int(resolve_rng(rng).integers(1, chromosome.length))
+        return swap_masked(parent1, parent2, chromosome.mask(point, chromosome.length))
 
 class TwoPointCrossover(CrossoverOperator):
-    def crossover(self, parent1: Individual, parent2: Individual):
-        gene1 = parent1.chromosome.gene
-        gene2 = parent2.chromosome.gene
-        if len(gene1) != len(gene2):
+    def crossover(self, parent1: Individual, parent2: Individual, rng: np.random.Generator = None):
+        chromosome = parent1.chromosome
+        if chromosome.length != parent2.chromosome.length:
             raise ValueError("Chromosomy muszą mieć taką samą długość.")
-        if len(gene1) < 2:
-            return OnePointCrossover().crossover(parent1, parent2)
-        point1, point2 = sorted(random.sample(range(1, len(gene1)), 2))
-        child_gene1 = gene1[:point1] + gene2[point1:point2] + gene1[point2:]
-        child_gene2 = gene2[:point1] + gene1[point1:point2] + gene2[point2:]
-        return Individual(Chromosome(child_gene1)), Individual(Chromosome(child_gene2))
+        if chromosome.length < 2:
+            return OnePointCrossover().crossover(parent1, parent2, rng)
+        point1, point2 = sorted((resolve_rng(rng).choice(chromosome.length - 1, size=2, replace=False) + 1).tolist())
+        return swap_masked(parent1, parent2, chromosome.mask(point1, point2))
 
 class UniformCrossover(CrossoverOperator):
-    def crossover(self, parent1: Individual, parent2: Individual):
-        gene1 = parent1.chromosome.gene
-        gene2 = parent2.chromosome.gene
-        if len(gene1) != len(gene2):
+    def crossover(self, parent1: Individual, parent2: Individual, rng: np.random.Generator = None):
+        chromosome1, chromosome2 = parent1.chromosome, parent2.chromosome
+        if chromosome1.length != chromosome2.length:
             raise ValueError("Chromosomy muszą mieć taką samą długość.")
-        child_gene1 = ''.join(g1 if random.random() < 0.5 else g2 for g1, g2 in zip(gene1, gene2))
-        child_gene2 = ''.join(g2 if random.random() < 0.5 else g1 for g1, g2 in zip(gene1, gene2))
-        return Individual(Chromosome(child_gene1)), Individual(Chromosome(child_gene2))
+        # Maski pochodzenia genów losowane naraz dla całego chromosomu
+        masks = resolve_rng(rng).random((2, chromosome1.length)) < 0.5
+        value1, value2, length = chromosome1.value, chromosome2.value, chromosome1.length
+        difference = value1 ^ value2
+        # Potomek 1 ma geny rodzica 1 tam, gdzie pierwsza maska; potomek 2 – geny rodzica 2 tam, gdzie druga
+        child_value1 = value2 ^ (difference & mask_value(masks[0]))
+        child_value2 = value1 ^ (difference & mask_value(masks[1]))
+        return (Individual(Chromosome.from_value(child_value1, length)),
+                Individual(Chromosome.from_value(child_value2, length)))
 
 class GrainCrossover(CrossoverOperator):
-    def crossover(self, parent1: Individual, parent2: Individual):
-        gene1 = parent1.chromosome.gene
-        gene2 = parent2.chromosome.gene
-        if len(gene1) != len(gene2):
+    def crossover(self, parent1: Individual, parent2: Individual, rng: np.random.Generator = None):
+        chromosome1, chromosome2 = parent1.chromosome, parent2.chromosome
+        if chromosome1.length != chromosome2.length:
             raise ValueError("Chromosomy muszą mieć taką samą długość.")
         
-        child_gene1 = ""
-        child_gene2 = ""
-        for i in range(len(gene1)):
-            # Dla potomka 1 losujemy osobno dla każdego genu
-            if random.random() <= 0.5:
-                child_gene1 += gene1[i]
-            else:
-                child_gene1 += gene2[i]
-            # Dla potomka 2 również losujemy niezależnie
-            if random.random() <= 0.5:
-                child_gene2 += gene1[i]
-            else:
-                child_gene2 += gene2[i]
-                
-        return Individual(Chromosome(child_gene1)), Individual(Chromosome(child_gene2))
+        # Dla każdego potomka losujemy niezależnie pochodzenie każdego genu
+        masks = resolve_rng(rng).random((2, chromosome1.length)) <= 0.5
+        value1, value2, length = chromosome1.value, chromosome2.value, chromosome1.length
+        difference = value1 ^ value2
+        child_value1 = value2 ^ (difference & mask_value(masks[0]))
+        child_value2 = value2 ^ (difference & mask_value(masks[1]))
+
+        return (Individual(Chromosome.from_value(child_value1, length)),
+                Individual(Chromosome.from_value(child_value2, length)))
 
 
 # --- MUTACJA ---
 
 class MutationOperator(ABC):
     @abstractmethod
-    def mutate(self, individual: Individual, mutation_probability: float):
+    def mutate(self, individual: Individual, mutation_probability: float, rng: np.random.Generator = None,
+               in_place: bool = False):
         """
-        Mutuje danego osobnika z podanym prawdopodobieństwem.
+        Mutuje danego osobnika z podanym prawdopodobieństwem. Bez mutacji zwraca tego samego osobnika.
+        :param in_place: czy osobnik może zostać zmieniony w miejscu – tylko dla potomka, który nie jest
+                         współdzielony z populacją (np. świeżo utworzonego przez krzyżowanie)
         """
         pass
 
 class OnePointMutation(MutationOperator):
-    def mutate(self, individual: Individual, mutation_probability: float):
+    def mutate(self, individual: Individual, mutation_probability: float, rng: np.random.Generator = None,
+               in_place: bool = False):
+        rng = resolve_rng(rng)
         # Losujemy, czy mutacja ma zajść – jeśli nie, zwracamy osobnika bez zmian
-        if random.random() < mutation_probability:
-            gene = list(individual.chromosome.gene)
+        if rng.random() < mutation_probability:
             # Wybieramy losowy indeks w chromosomie
-            index = random.randint(0, len(gene) - 1)
-            gene[index] = '1' if gene[index] == '0' else '0'
-            mutated_gene = ''.join(gene)
-            return Individual(Chromosome(mutated_gene))
+            index = int(rng.integers(0, individual.chromosome.length))
+            mutated = writable(individual, in_place)
+            mutated.chromosome.flip(index)
+            return mutated
         else:
             return individual
 
 
 class BoundaryMutation(MutationOperator):
-    def mutate(self, individual: Individual, mutation_probability: float):
-        gene = list(individual.chromosome.gene)
-        if random.random() < mutation_probability:
-            # Losowo wybieramy, czy zmodyfikować pierwszy czy ostatni bit
-            if random.random() < 0.5:
-                # Mutacja pierwszego bitu
-                gene[0] = '1' if gene[0] == '0' else '0'
-            else:
-                # Mutacja ostatniego bitu
-                gene[-1] = '1' if gene[-1] == '0' else '0'
-        mutated_gene = ''.join(gene)
-        return Individual(Chromosome(mutated_gene))
+    def mutate(self, individual: Individual, mutation_probability: float, rng: np.random.Generator = None,
+               in_place: bool = False):
+        rng = resolve_rng(rng)
+        # Bez mutacji zwracamy osobnika bez zmian – nie tworzymy nowego obiektu
+        if rng.random() >= mutation_probability:
+            return individual
+        mutated = writable(individual, in_place)
+        # Losowo wybieramy, czy zmodyfikować pierwszy czy ostatni bit
+        if rng.random() < 0.5:
+            mutated.chromosome.flip(0)
+        else:
+            mutated.chromosome.flip(mutated.chromosome.length - 1)
+        return mutated
 
 class TwoPointMutation(MutationOperator):
-    def mutate(self, individual: Individual, mutation_probability: float):
-        gene = list(individual.chromosome.gene)
-        if len(gene) < 2:
+    def mutate(self, individual: Individual, mutation_probability: float, rng: np.random.Generator = None,
+               in_place: bool = False):
+        rng = resolve_rng(rng)
+        length = individual.chromosome.length
+        if length < 2 or rng.random() >= mutation_probability:
+            return individual
+        i, j = rng.choice(length, size=2, replace=False).tolist()
+        mutated = writable(individual, in_place)
+        mutated.chromosome.flip(i)
+        mutated.chromosome.flip(j)
+        return mutated
+
+class BitFlipMutation(MutationOperator):
+    def mutate(self, individual: Individual, mutation_probability: float, rng: np.random.Generator = None,
+               in_place: bool = False):
+        # Każdy bit odwracany niezależnie z prawdopodobieństwem mutation_probability;
+        # liczba mutacji losowana z rozkładu dwumianowego, potem tylko tyle różnych pozycji
+        length = individual.chromosome.length
+        rng = resolve_rng(rng)
+        count = rng.binomial(length, mutation_probability)
+        if count == 0:
             return individual
-        if random.random() < mutation_probability:
-            i, j = random.sample(range(len(gene)), 2)
-            gene[i] = '1' if gene[i] == '0' else '0'
-            gene[j] = '1' if gene[j] == '0' else '0'
-        mutated_gene = ''.join(gene)
-        return Individual(Chromosome(mutated_gene))
+        flips = 0
+        for index in rng.choice(length, size=count, replace=False).tolist():
+            flips |= 1 << (length - 1 - index)
+        mutated = writable(individual, in_place)
+        mutated.chromosome.value ^= flips
+        return mutated
 
 
 # --- INWERSJA ---
 
 class InversionOperator(ABC):
     @abstractmethod
-    def invert(self, individual: Individual, inversion_probability: float) -> Individual:
+    def invert(self, individual: Individual, inversion_probability: float,
+               rng: np.random.Generator = None, in_place: bool = False) -> Individual:
         """
         Stosuje inwersję na chromosomie osobnika z zadanym prawdopodobieństwem.
+        :param in_place: czy osobnik może zostać zmieniony w miejscu (jak w MutationOperator.mutate)
         """
         pass
 
 class SimpleInversion(InversionOperator):
-    def invert(self, individual: Individual, inversion_probability: float) -> Individual:
-        gene = list(individual.chromosome.gene)
-        if random.random() < inversion_probability:
-            # Wybieramy dwa losowe indeksy i odwracamy fragment między nimi
-            i, j = sorted(random.sample(range(len(gene)), 2))
-            gene[i:j+1] = reversed(gene[i:j+1])
-        inverted_gene = ''.join(gene)
-        return Individual(Chromosome(inverted_gene))
+    def invert(self, individual: Individual, inversion_probability: float,
+               rng: np.random.Generator = None, in_place: bool = False) -> Individual:
+        rng = resolve_rng(rng)
+        # Bez inwersji zwracamy osobnika bez zmian – nie tworzymy nowego obiektu
+        if rng.random() >= inversion_probability:
+            return individual
+        length = individual.chromosome.length
+        # Wybieramy dwa losowe indeksy i odwracamy fragment między nimi (włącznie)
+        i, j = sorted(rng.choice(length, size=2, replace=False).tolist())
+        width, shift = j - i + 1, length - 1 - j
+        inverted = writable(individual, in_place)
+        chromosome = inverted.chromosome
+        segment = (chromosome.value >> shift) & ((1 << width) - 1)
+        reversed_segment = int(format(segment, f"0{width}b")[::-1], 2)
+        chromosome.value ^= (segment ^ reversed_segment) << shift
+        return inverted
@@ -0,0 +1,124 @@
+import math
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Stan procesu roboczego – funkcja celu przekazywana raz, przy starcie puli,
+# oraz segmenty pamięci współdzielonej otwarte przez ten proces
+_worker_fitness_function = None
+_worker_segments = {}
+
+def _init_worker(fitness_function) -> None:
+    global _worker_fitness_function
+    _worker_fitness_function = fitness_function
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Otwiera segment pamięci współdzielonej w procesie roboczym (raz na segment).
+    """
+    segment = _worker_segments.get(name)
+    if segment is None:
+        segment = shared_memory.SharedMemory(name=name)
+        _worker_segments[name] = segment
+    return segment
+
+def _evaluate_chunk(input_name: str, output_name: str, capacity: int, num_vars: int, start: int, stop: int) -> None:
+    """
+    Ocenia wiersze [start, stop) macierzy fenotypów i zapisuje wynik do wektora wyjściowego.
+    Oba bufory leżą w pamięci współdzielonej – przez kolejkę przesyłane są tylko nazwy i indeksy.
+    """
+    # Segmenty zastąpione przez proces główny (po zmianie rozmiaru populacji) są zamykane
+    for name in list(_worker_segments):
+        if name not in (input_name, output_name):
+            _worker_segments.pop(name).close()
+    X = np.ndarray((capacity, num_vars), dtype=float, buffer=_attach(input_name).buf)
+    fitness = np.ndarray(capacity, dtype=float, buffer=_attach(output_name).buf)
+    fitness[start:stop] = _worker_fitness_function.evaluate_batch(X[start:stop])
+
+class ParallelEvaluator:
+    def __init__(self, fitness_function, workers: int, chunk_size: int = None):
+        """
+        Równoległa ocena funkcji celu w puli procesów. Obiekt udostępnia ten sam interfejs
+        co FitnessFunction, więc może zastąpić ją w Population i BitPopulation.
+        Jedna pula procesów jest używana przez cały przebieg algorytmu.
+        :param fitness_function: instancja FitnessFunction oceniana w procesach roboczych
+        :param workers: liczba procesów roboczych
+        :param chunk_size: liczba wierszy na zadanie – domyślnie populacja dzielona równo między procesy
+        """
+        self.fitness_function = fitness_function
+        self.workers = workers
+        self.chunk_size = chunk_size
+        # Procesy "spawn" zamiast fork – ocena działa w wątkach serwera obok innych wątków
+        # (zapis wyników, zlecenia), a fork kopiuje tylko bieżący wątek wraz z zajętymi blokadami
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                             initargs=(fitness_function,),
+                                             mp_context=multiprocessing.get_context("spawn"))
+        self._capacity = 0
+        self._num_vars = 0
+        self._input = None
+        self._output = None
+
+    def __getattr__(self, name):
+        # Metadane (name, search_range, optimum_value...) pochodzą z opakowanej funkcji celu
+        if name == "fitness_function":
+            raise AttributeError(name)
+        return getattr(self.fitness_function, name)
+
+    def evaluate(self, phenotype) -> float:
+        return self.fitness_function.evaluate(phenotype)
+
+    def _ensure_buffers(self, rows: int, num_vars: int) -> None:
+        """
+        Przydziela bufory pamięci współdzielonej – tylko gdy obecne są za małe.
+        """
+        if rows <= self._capacity and num_vars == self._num_vars:
+            return
+        self._release_buffers()
+        self._capacity = rows
+        self._num_vars = num_vars
+        self._input = shared_memory.SharedMemory(create=True, size=max(rows * num_vars, 1) * 8)
+        self._output = shared_memory.SharedMemory(create=True, size=max(rows, 1) * 8)
+
+    def evaluate_batch(self, X: np.ndarray) -> np.ndarray:
+        rows, num_vars = X.shape
+        chunk_size = self.chunk_size or math.ceil(rows / self.workers)
+        if rows <= chunk_size:
+            # Jedno zadanie – szybciej ocenić je lokalnie niż przesyłać do puli
+            return self.fitness_function.evaluate_batch(X)
+
+        self._ensure_buffers(rows, num_vars)
+        shared_X = np.ndarray((self._capacity, num_vars), dtype=float, buffer=self._input.buf)
+        shared_fitness = np.ndarray(self._capacity, dtype=float, buffer=self._output.buf)
+        shared_X[:rows] = X
+
+        # Każde zadanie zapisuje do własnego zakresu wierszy, więc wynik nie zależy od kolejności wykonania
+        futures = [
+            self._executor.submit(_evaluate_chunk, self._input.name, self._output.name,
+                                  self._capacity, num_vars, start, min(start + chunk_size, rows))
+            for start in range(0, rows, chunk_size)
+        ]
+        for future in futures:
+            future.result()
+        return shared_fitness[:rows].copy()
+
+    def _release_buffers(self) -> None:
+        for segment in (self._input, self._output):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self._input = self._output = None
+        self._capacity = 0
+
+    def close(self) -> None:
+        """
+        Zamyka pulę procesów i zwalnia pamięć współdzieloną.
+        """
+        self._executor.shutdown()
+        self._release_buffers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
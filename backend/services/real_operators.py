@@ -0,0 +1,96 @@
+import numpy as np
+from abc import ABC, abstractmethod
+
+# Operatory dla populacji o kodowaniu rzeczywistym (RealPopulation).
+# Geny to macierz float o kształcie (population_size, num_vars) – wiersz jest od razu fenotypem,
+# więc nie ma dekodowania. Selekcja korzysta z operatorów z batch_operators (pracują na wektorze fitness),
+# krzyżowanie i mutacja – na całych macierzach naraz. Potomkowie przycinani są do zakresu poszukiwań.
+
+# --- KRZYŻOWANIE ---
+
+class RealCrossoverOperator(ABC):
+    @abstractmethod
+    def crossover(self, parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator):
+        """
+        Krzyżuje parami wiersze dwóch macierzy rodziców naraz.
+        :param parents1: geny pierwszych rodziców, kształt (n, num_vars)
+        :param parents2: geny drugich rodziców, kształt (n, num_vars)
+        :return: para macierzy potomków
+        """
+        pass
+
+class ArithmeticCrossover(RealCrossoverOperator):
+    def crossover(self, parents1, parents2, rng):
+        # Kombinacja wypukła rodziców z jednym losowym współczynnikiem na parę
+        weight = rng.random((len(parents1), 1))
+        return weight * parents1 + (1 - weight) * parents2, (1 - weight) * parents1 + weight * parents2
+
+class BlendCrossover(RealCrossoverOperator):
+    def __init__(self, alpha: float = 0.5):
+        """
+        Krzyżowanie BLX-alfa: każdy gen potomka losowany jednostajnie z przedziału wyznaczonego przez geny
+        rodziców, poszerzonego z obu stron o alpha jego długości.
+        :param alpha: współczynnik poszerzenia przedziału
+        """
+        self.alpha = alpha
+
+    def crossover(self, parents1, parents2, rng):
+        low, high = np.minimum(parents1, parents2), np.maximum(parents1, parents2)
+        spread = self.alpha * (high - low)
+        low, high = low - spread, high + spread
+        return rng.uniform(low, high), rng.uniform(low, high)
+
+class SimulatedBinaryCrossover(RealCrossoverOperator):
+    def __init__(self, eta: float = 15.0):
+        """
+        Krzyżowanie SBX (simulated binary crossover).
+        :param eta: indeks rozkładu – im większy, tym potomkowie bliżsi rodzicom
+        """
+        self.eta = eta
+
+    def crossover(self, parents1, parents2, rng):
+        u = rng.random(parents1.shape)
+        exponent = 1.0 / (self.eta + 1.0)
+        beta = np.where(u <= 0.5, (2 * u) ** exponent, (1 / (2 * (1 - u))) ** exponent)
+        mean, half = (parents1 + parents2) / 2, (parents2 - parents1) / 2
+        return mean - beta * half, mean + beta * half
+
+# --- MUTACJA ---
+
+class RealMutationOperator(ABC):
+    @abstractmethod
+    def mutate(self, genes: np.ndarray, search_range, mutation_probability: float,
+               rng: np.random.Generator) -> None:
+        """
+        Mutuje w miejscu wiersze macierzy genów – każdy wiersz (wszystkie jego geny)
+        z prawdopodobieństwem mutation_probability.
+        :param search_range: zakres poszukiwań [a, b] wyznaczający skalę zaburzenia
+        """
+        pass
+
+class GaussianMutation(RealMutationOperator):
+    def __init__(self, scale: float = 0.1):
+        """
+        :param scale: odchylenie standardowe zaburzenia jako ułamek szerokości zakresu poszukiwań
+        """
+        self.scale = scale
+
+    def mutate(self, genes, search_range, mutation_probability, rng):
+        rows = np.flatnonzero(rng.random(len(genes)) < mutation_probability)
+        sigma = self.scale * (search_range[1] - search_range[0])
+        genes[rows] += rng.normal(0.0, sigma, size=(len(rows), genes.shape[1]))
+
+class PolynomialMutation(RealMutationOperator):
+    def __init__(self, eta: float = 20.0):
+        """
+        Mutacja wielomianowa (Deb) – zaburzenie z rozkładu wielomianowego o indeksie eta.
+        :param eta: indeks rozkładu – im większy, tym mniejsze zaburzenia
+        """
+        self.eta = eta
+
+    def mutate(self, genes, search_range, mutation_probability, rng):
+        rows = np.flatnonzero(rng.random(len(genes)) < mutation_probability)
+        u = rng.random((len(rows), genes.shape[1]))
+        exponent = 1.0 / (self.eta + 1.0)
+        delta = np.where(u < 0.5, (2 * u) ** exponent - 1, 1 - (2 * (1 - u)) ** exponent)
+        genes[rows] += delta * (search_range[1] - search_range[0])
@@ -0,0 +1,45 @@
+# Strategie zastępowania populacji w metodzie evolve:
+#   generational – potomstwo zastępuje całą populację poza elitami (domyślnie),
+#   steady_state – w każdym kroku k potomków zastępuje k najgorszych osobników,
+#   mu_plus_lambda – z mu rodziców i lambda potomków przeżywa mu najlepszych,
+#   mu_comma_lambda – przeżywają elity i najlepsi potomkowie, pozostali rodzice odpadają.
+# Strategie inne niż pokoleniowa oceniają wyłącznie nowych potomków. steady_state wybiera rodziców
+# raz na epokę i zastępuje najgorszych osobników w miejscu (kopiec), strategie (mu, lambda) utrzymują
+# populację uporządkowaną według fitness, więc wstawienie potomka to wyszukiwanie binarne zamiast sortowania.
+
+GENERATIONAL = "generational"
+STEADY_STATE = "steady_state"
+MU_PLUS_LAMBDA = "mu_plus_lambda"
+MU_COMMA_LAMBDA = "mu_comma_lambda"
+
+STRATEGIES = (GENERATIONAL, STEADY_STATE, MU_PLUS_LAMBDA, MU_COMMA_LAMBDA)
+
+def offspring_plan(replacement: str, population_size: int, elitism_count: int, offspring_count: int = None):
+    """
+    Wyznacza liczbę potomków w kroku i liczbę kroków w epoce dla strategii innej niż pokoleniowa.
+    :param offspring_count: k dla steady_state (domyślnie 2), lambda dla strategii (mu, lambda)
+                            (domyślnie population_size)
+    :return: para (liczba potomków w kroku, liczba kroków)
+    """
+    if replacement not in STRATEGIES:
+        raise ValueError(f"Nieznana strategia zastępowania: {replacement}")
+    replaced = population_size - elitism_count
+    if replacement == STEADY_STATE:
+        # Epoka to tyle kroków, ile potrzeba do wytworzenia population_size - elitism_count potomków
+        step = max(1, min(offspring_count or 2, replaced))
+        return step, -(-replaced // step)
+    step = offspring_count or population_size
+    if replacement == MU_COMMA_LAMBDA:
+        # Potomków musi wystarczyć do uzupełnienia populacji poza elitami
+        step = max(step, replaced)
+    return step, 1
+
+def survivors(replacement: str, population_size: int, elitism_count: int, step: int) -> int:
+    """
+    Liczba najlepszych osobników populacji, do których dołączani są potomkowie w kroku.
+    """
+    if replacement == STEADY_STATE:
+        return population_size - step
+    if replacement == MU_COMMA_LAMBDA:
+        return elitism_count
+    return population_size
@@ -0,0 +1,75 @@
+# Kryteria zatrzymania przebiegu przed wykonaniem wszystkich epok. Sprawdzane są po każdej
+# epoce na podstawie migawki z iter_ga, więc nie wymagają dodatkowych ocen funkcji celu.
+
+EPOCHS = "epochs"
+TARGET = "target"
+PATIENCE = "patience"
+TIME_LIMIT = "time_limit"
+MAX_EVALUATIONS = "max_evaluations"
+DIVERSITY = "diversity"
+
+class StoppingCriteria:
+    def __init__(self, target_fitness: float = None, patience: int = None, min_improvement: float = 0.0,
+                 time_limit: float = None, max_evaluations: int = None, min_diversity: float = None):
+        """
+        Zestaw kryteriów zatrzymania – każde jest opcjonalne (None wyłącza kryterium).
+        :param target_fitness: zatrzymanie po osiągnięciu wartości fitness nie większej niż podana
+        :param patience: liczba kolejnych epok bez poprawy najlepszego wyniku
+        :param min_improvement: minimalna poprawa najlepszego wyniku uznawana za postęp
+        :param time_limit: limit czasu przebiegu w sekundach
+        :param max_evaluations: limit liczby ocen funkcji celu
+        :param min_diversity: dolny próg różnorodności populacji (0 – populacja jednorodna)
+        """
+        self.target_fitness = target_fitness
+        self.patience = patience
+        self.min_improvement = min_improvement
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.min_diversity = min_diversity
+        self.best_fitness = None
+        self.stale_epochs = 0
+
+    @classmethod
+    def from_config(cls, config: dict, fitness_function=None) -> "StoppingCriteria":
+        """
+        Tworzy kryteria z konfiguracji algorytmu. "target_fitness" może mieć wartość "optimum" –
+        wtedy celem jest znane optimum funkcji celu powiększone o "target_tolerance".
+        """
+        target_fitness = config.get("target_fitness")
+        if target_fitness == "optimum":
+            target_fitness = fitness_function.optimum_value + config.get("target_tolerance", 0.0)
+        return cls(
+            target_fitness=target_fitness,
+            patience=config.get("patience"),
+            min_improvement=config.get("min_improvement", 0.0),
+            time_limit=config.get("time_limit"),
+            max_evaluations=config.get("max_evaluations"),
+            min_diversity=config.get("min_diversity")
+        )
+
+    def check(self, snapshot: dict, evaluations: int) -> str:
+        """
+        Sprawdza kryteria po epoce.
+        :param snapshot: migawka epoki (pola fitness, diversity, elapsed)
+        :param evaluations: łączna liczba ocen funkcji celu
+        :return: nazwa kryterium, które zatrzymuje przebieg, lub None
+        """
+        fitness = snapshot["fitness"]
+        if self.best_fitness is None or fitness < self.best_fitness - self.min_improvement:
+            self.best_fitness = fitness
+            self.stale_epochs = 0
+        else:
+            self.best_fitness = min(self.best_fitness, fitness)
+            self.stale_epochs += 1
+
+        if self.target_fitness is not None and self.best_fitness <= self.target_fitness:
+            return TARGET
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return MAX_EVALUATIONS
+        if self.time_limit is not None and snapshot["elapsed"] >= self.time_limit:
+            return TIME_LIMIT
+        if self.patience is not None and self.stale_epochs >= self.patience:
+            return PATIENCE
+        if self.min_diversity is not None and snapshot["diversity"] <= self.min_diversity:
+            return DIVERSITY
+        return None
@@ -0,0 +1,146 @@
+import os
+import time
+import itertools
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from backend.services.ga_service import iter_ga
+
+# Przegląd parametrów: siatka lub lista konfiguracji, każda uruchamiana wielokrotnie
+# z różnymi ziarnami w jednej puli procesów. Powtórzenia nie przechowują historii
+# i nie są zapisywane na dysk – do procesu głównego wraca tylko krótkie podsumowanie.
+
+def expand_grid(base: dict, grid: dict = None, configs: list = None) -> list:
+    """
+    Rozwija opis przeglądu do listy konfiguracji.
+    :param base: parametry wspólne dla wszystkich konfiguracji
+    :param grid: słownik parametr -> lista wartości (iloczyn kartezjański)
+    :param configs: lista nadpisań parametrów – alternatywa dla siatki
+    :return: lista par (nadpisania, pełna konfiguracja)
+    """
+    if configs:
+        overrides = list(configs)
+    elif grid:
+        names = list(grid)
+        overrides = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+    else:
+        overrides = [{}]
+    return [(override, {**base, **override}) for override in overrides]
+
+def _run_replicate(config: dict, target: float = None) -> dict:
+    """
+    Funkcja procesu roboczego – jedno powtórzenie konfiguracji.
+    Czas i liczba epok do osiągnięcia celu odczytywane są z migawek, bez zapamiętywania historii.
+    """
+    time_to_target = None
+    epochs_to_target = None
+    stream = iter_ga(config)
+    while True:
+        try:
+            snapshot = next(stream)
+        except StopIteration as stop:
+            summary = stop.value
+            break
+        if target is not None and time_to_target is None and snapshot["fitness"] <= target:
+            time_to_target = snapshot["elapsed"]
+            epochs_to_target = snapshot["epoch"]
+    return {
+        "seed": config.get("seed"),
+        "best_fitness": summary["best_fitness"],
+        "evaluations": summary["evaluations"],
+        "time": summary["time"],
+        "epochs": summary["epochs"],
+        "stop_reason": summary["stop_reason"],
+        "time_to_target": time_to_target,
+        "epochs_to_target": epochs_to_target
+    }
+
+def summarize(values: list) -> dict:
+    """
+    Statystyki rozkładu: mediana, kwartyle, IQR, minimum i maksimum (None dla pustej listy).
+    """
+    if not values:
+        return {"median": None, "q1": None, "q3": None, "iqr": None, "min": None, "max": None}
+    q1, median, q3 = np.percentile(values, [25, 50, 75]).tolist()
+    return {"median": median, "q1": q1, "q3": q3, "iqr": q3 - q1, "min": min(values), "max": max(values)}
+
+def aggregate(replicates: list, target: float = None) -> dict:
+    """
+    Łączy wyniki powtórzeń jednej konfiguracji.
+    """
+    statistics = {
+        "replicates": len(replicates),
+        "best_fitness": summarize([replicate["best_fitness"] for replicate in replicates]),
+        "time": summarize([replicate["time"] for replicate in replicates]),
+        "evaluations": summarize([replicate["evaluations"] for replicate in replicates]),
+        "epochs": summarize([replicate["epochs"] for replicate in replicates])
+    }
+    if target is not None:
+        reached = [replicate for replicate in replicates if replicate["time_to_target"] is not None]
+        statistics["success_rate"] = len(reached) / len(replicates)
+        statistics["time_to_target"] = summarize([replicate["time_to_target"] for replicate in reached])
+        statistics["epochs_to_target"] = summarize([replicate["epochs_to_target"] for replicate in reached])
+    return statistics
+
+def resolve_processes(requested=None) -> int:
+    """
+    Liczba procesów puli: domyślnie liczba rdzeni, a żądana wartość jest do niej przycinana.
+    :raises ValueError: dla wartości, która nie jest dodatnią liczbą całkowitą
+    """
+    available = os.cpu_count() or 1
+    if requested is None:
+        return available
+    if isinstance(requested, bool) or not isinstance(requested, int) or requested <= 0:
+        raise ValueError("Liczba procesów (processes) musi być dodatnią liczbą całkowitą.")
+    return min(requested, available)
+
+def resolve_seeds(request: dict) -> list:
+    """
+    Ziarna powtórzeń: lista "seeds" lub kolejne liczby 0..replicates-1 (domyślnie 5 powtórzeń).
+    :raises ValueError: dla pustej listy ziaren lub liczby powtórzeń, która nie jest dodatnią liczbą całkowitą
+    """
+    if "seeds" in request:
+        seeds = request["seeds"]
+        if not isinstance(seeds, list) or not seeds:
+            raise ValueError("Lista ziaren (seeds) nie może być pusta.")
+        return seeds
+    replicates = request.get("replicates", 5)
+    if isinstance(replicates, bool) or not isinstance(replicates, int) or replicates <= 0:
+        raise ValueError("Liczba powtórzeń (replicates) musi być dodatnią liczbą całkowitą.")
+    return list(range(replicates))
+
+def run_sweep(request: dict) -> dict:
+    """
+    Uruchamia przegląd parametrów w puli procesów.
+    Pola żądania: "base" (konfiguracja wspólna), "grid" lub "configs" (warianty), "replicates"
+    (liczba powtórzeń, domyślnie 5) lub "seeds" (lista ziaren), "target" (próg fitness dla czasu
+    do osiągnięcia celu), "processes" (liczba procesów, domyślnie i najwyżej liczba rdzeni).
+    Procesy tworzone są metodą spawn, jak w JobManager – fork procesu serwera z działającymi
+    wątkami (ResultWriter, JobManager) mógłby skopiować zablokowane blokady.
+    """
+    start_time = time.time()
+    variants = expand_grid(request.get("base", {}), request.get("grid"), request.get("configs"))
+    seeds = resolve_seeds(request)
+    target = request.get("target")
+    processes = resolve_processes(request.get("processes"))
+
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [
+            [executor.submit(_run_replicate, {**config, "seed": seed}, target) for seed in seeds]
+            for _, config in variants
+        ]
+        results = []
+        for (override, _), replicate_futures in zip(variants, futures):
+            replicates = [future.result() for future in replicate_futures]
+            results.append({
+                "parameters": override,
+                **aggregate(replicates, target),
+                "runs": replicates
+            })
+
+    return {
+        "configurations": len(variants),
+        "runs": len(variants) * len(seeds),
+        "results": results,
+        "time": time.time() - start_time
+    }
@@ -15,8 +15,8 @@ def hyperelipsoid(x) -> float:
     """
     N = len(x)
 
-    return sum(x[j] ** 2 
-        for i in range(N) 
-        for j in range(i))
+    # Składnik x[j] ** 2 występuje w sumie dla każdego i > j, czyli N - 1 - j razy
+    return sum((N - 1 - j) * x[j] ** 2
+        for j in range(N))
 
 #jak cos to przenioslem implementacje funckji do backend.models.fitness (mozesz przeniesc gdzies indziej)
\ No newline at end of file
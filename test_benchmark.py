@@ -0,0 +1,19 @@
+from backend.benchmark import run_benchmark, compare, STAGES
+
+def test_benchmark_covers_all_stages_for_both_engines():
+    report = run_benchmark(population_sizes=(20,), variables=(2,), precisions=(3,), repeat=1)
+    assert len(report["results"]) == 2 * len(STAGES)
+    for entry in report["results"]:
+        assert entry["seconds"] >= 0 and entry["peak_memory_bytes"] >= 0
+        assert entry["chromosome_length"] == 2 * 18  # zakres 131.072 z precyzją 3 wymaga 18 bitów
+    # Krzyżowanie obiektowe tworzy nowych osobników – ich bloki pamięci są widoczne w raporcie
+    crossover = next(entry for entry in report["results"] if entry["engine"] == "object" and entry["stage"] == "crossover")
+    assert crossover["blocks_per_individual"] >= 1
+
+def test_compare_flags_regressions():
+    entry = {"engine": "numpy", "population_size": 20, "variables": 2, "precision": 3, "stage": "evolve"}
+    baseline = {"results": [{**entry, "seconds": 1.0}]}
+    current = {"results": [{**entry, "seconds": 1.5}, {**entry, "stage": "decode", "seconds": 0.1}]}
+    comparison = compare(baseline, current, threshold=1.2)
+    assert len(comparison) == 1
+    assert comparison[0]["ratio"] == 1.5 and comparison[0]["regression"]
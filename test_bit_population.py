@@ -0,0 +1,131 @@
+import numpy as np
+from backend.models.chromosome import Chromosome
+from backend.models.bit_population import BitPopulation
+from backend.models.decoder import BinaryDecoder
+from backend.models.fitness import HyperellipsoidFitness
+from backend.services.batch_operators import *
+from backend.services.ga_service import run_ga
+
+def make_population(genes, search_range=(-65.536, 65.536)):
+    population = BitPopulation(len(genes), search_range, rng=np.random.default_rng(0))
+    population.chromosome_length = len(genes[0])
+    population.decoder = BinaryDecoder(search_range, len(genes[0]))
+    bits = np.array([[int(g) for g in gene] for gene in genes], dtype=np.uint8)
+    population.genes = BitPopulation.pack(bits)
+    return population
+
+def test_pack_roundtrip():
+    genes = ["1010101010", "0101010101", "1111100000"]
+    population = make_population(genes)
+    unpacked = population.unpack()
+    assert ["".join(map(str, row)) for row in unpacked] == genes
+
+def test_decode_matches_chromosome():
+    genes = ["1010101010", "0000000000", "1111111111", "0110011001"]
+    population = make_population(genes)
+    expected = [Chromosome(gene).decode(-65.536, 65.536) for gene in genes]
+    assert np.allclose(population.decode()[:, 0], expected)
+
+def test_batch_crossover_on_packed_parents():
+    rng = np.random.default_rng(1)
+    length = 13
+    parents1 = BitPopulation.pack(np.ones((50, length), dtype=np.uint8))
+    parents2 = BitPopulation.pack(np.zeros((50, length), dtype=np.uint8))
+    for operator in (BatchOnePointCrossover(), BatchTwoPointCrossover(), BatchUniformCrossover(), BatchGrainCrossover()):
+        children1, children2 = operator.crossover(parents1, parents2, length, rng)
+        assert children1.shape == parents1.shape and children2.shape == parents1.shape
+        # Bity dopełnienia ostatniego bajtu pozostają wyzerowane
+        assert np.all(children1[:, -1] & 0b111 == 0) and np.all(children2[:, -1] & 0b111 == 0)
+
+    # Krzyżowanie jednopunktowe: prefiks od jednego rodzica, sufiks od drugiego, potomkowie komplementarni
+    children1, children2 = BatchOnePointCrossover().crossover(parents1, parents2, length, rng)
+    bits1 = np.unpackbits(children1, axis=1, count=length)
+    bits2 = np.unpackbits(children2, axis=1, count=length)
+    assert np.all(bits1 + bits2 == 1)
+    assert np.all(np.diff(bits1.astype(int), axis=1) <= 0)
+    assert np.all((bits1.sum(axis=1) >= 1) & (bits1.sum(axis=1) <= length - 1))
+
+    # Krzyżowanie dwupunktowe: od rodzica 2 pochodzi dokładnie jeden spójny fragment
+    children1, _ = BatchTwoPointCrossover().crossover(parents1, parents2, length, rng)
+    bits1 = np.unpackbits(children1, axis=1, count=length).astype(int)
+    assert np.all(np.abs(np.diff(bits1, axis=1)).sum(axis=1) == 2)
+    assert np.all(bits1[:, 0] == 1)
+
+def test_batch_mutation_and_inversion():
+    rng = np.random.default_rng(1)
+    length = 13
+
+    genes = BitPopulation.pack(np.zeros((40, length), dtype=np.uint8))
+    BatchTwoPointMutation().mutate(genes, length, 1.0, rng)
+    assert np.all(np.unpackbits(genes, axis=1, count=length).sum(axis=1) == 2)
+
+    genes = BitPopulation.pack(np.zeros((40, length), dtype=np.uint8))
+    BatchBoundaryMutation().mutate(genes, length, 1.0, rng)
+    bits = np.unpackbits(genes, axis=1, count=length)
+    assert np.all(bits.sum(axis=1) == 1) and np.all(bits[:, 0] + bits[:, -1] == 1)
+
+    genes = BitPopulation.pack(np.zeros((40, length), dtype=np.uint8))
+    BatchOnePointMutation().mutate(genes, length, 0.0, rng)
+    assert not genes.any()
+
+    # Mutacja bitowa: oczekiwana liczba odwróconych bitów to p * liczba bitów
+    genes = BitPopulation.pack(np.zeros((1000, length), dtype=np.uint8))
+    BatchBitFlipMutation().mutate(genes, length, 0.1, rng)
+    flipped = np.unpackbits(genes, axis=1, count=length).sum()
+    assert abs(flipped - 1300) < 150
+    assert np.all(genes[:, -1] & 0b111 == 0)
+
+    # Inwersja zachowuje liczbę jedynek i odwraca spójny fragment
+    original = np.array([[1, 1, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0]] * 40, dtype=np.uint8)
+    genes = BitPopulation.pack(original)
+    BatchSimpleInversion().invert(genes, length, 1.0, rng)
+    bits = np.unpackbits(genes, axis=1, count=length)
+    assert np.all(bits.sum(axis=1) == original.sum(axis=1))
+    for row in bits:
+        changed = np.flatnonzero(row != original[0])
+        if len(changed):
+            i, j = changed[0], changed[-1]
+            assert np.array_equal(row[i:j + 1], original[0][i:j + 1][::-1])
+
+def test_evolve_keeps_elite():
+    population = BitPopulation(30, rng=np.random.default_rng(2))
+    population.initialize(20)
+    fitness_function = HyperellipsoidFitness(num_vars=1, search_range=(-65.536, 65.536))
+    population.evaluate(fitness_function)
+    previous_best = population.fitness.min()
+    for _ in range(10):
+        population.evolve(
+            fitness_function,
+            selection_operator=BatchTournamentSelection(3),
+            crossover_operator=BatchOnePointCrossover(),
+            mutation_operator=BatchOnePointMutation(),
+            inversion_operator=BatchSimpleInversion(),
+            crossover_probability=0.8,
+            mutation_probability=0.3,
+            inversion_probability=0.3,
+            elitism_count=2
+        )
+        assert population.genes.shape == (30, 3)
+        assert population.fitness.min() <= previous_best
+        previous_best = population.fitness.min()
+
+def test_run_ga_numpy_engine():
+    result = run_ga({"engine": "numpy", "population_size": 20, "epochs": 5})
+    assert len(result["history"]) == 5
+    assert isinstance(result["best_fitness"], float)
+    assert len(result["best_individual"]) == 10
+
+def test_incumbent_tracks_best_so_far():
+    population = BitPopulation(20, rng=np.random.default_rng(5))
+    population.initialize(16)
+    fitness_function = HyperellipsoidFitness(num_vars=1)
+    population.evaluate(fitness_function)
+    assert population.best_solution()[1] == population.fitness.min()
+    best_so_far = population.incumbent_fitness
+    for _ in range(5):
+        # Bez elit najlepszy osobnik może zginąć, ale najlepsze rozwiązanie dotąd nie pogarsza się
+        population.evolve(fitness_function, BatchTournamentSelection(2), BatchUniformCrossover(),
+                          BatchBitFlipMutation(), BatchSimpleInversion(), 1.0, 0.2, 0.5, 0)
+        assert population.incumbent_fitness <= best_so_far
+        assert population.incumbent_fitness <= population.fitness.min()
+        best_so_far = population.incumbent_fitness
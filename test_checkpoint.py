@@ -0,0 +1,66 @@
+import json
+import numpy as np
+import pytest
+from backend.services.checkpoint import Checkpoint
+from backend.services.ga_service import iter_ga, run_ga
+
+BASE = {"population_size": 12, "epochs": 10, "variables": 2, "seed": 5, "checkpoint_interval": 3}
+
+def interrupt_after(config, epochs):
+    stream = iter_ga(config)
+    for _ in range(epochs):
+        next(stream)
+    stream.close()
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    for engine in ("object", "numpy"):
+        reference = run_ga({**BASE, "engine": engine})
+        config = {**BASE, "engine": engine, "checkpoint_path": str(tmp_path / engine)}
+
+        # Przerwanie w epoce 7 – ostatni punkt kontrolny z epoki 6
+        interrupt_after(config, 7)
+        state = json.loads((tmp_path / engine / "state.json").read_text())
+        assert state["epoch"] == 6 and state["history_length"] == 6
+
+        resumed = run_ga(config)
+        assert resumed["history"] == reference["history"]
+        assert resumed["best_fitness"] == reference["best_fitness"]
+        assert resumed["evaluations"] == reference["evaluations"]
+
+        # Zakończony przebieg można przedłużyć, zwiększając liczbę epok
+        extended = run_ga({**config, "epochs": 12})
+        assert len(extended["history"]) == 12
+        assert extended["history"][:10] == reference["history"]
+
+def test_resume_restores_fitness_cache(tmp_path):
+    for engine in ("object", "numpy"):
+        config = {**BASE, "engine": engine, "fitness_cache_size": 64, "mutation_probability": 0.05}
+        reference = run_ga(config)
+        config["checkpoint_path"] = str(tmp_path / engine)
+        interrupt_after(config, 7)
+        resumed = run_ga(config)
+        assert resumed["history"] == reference["history"]
+        assert resumed["evaluations"] == reference["evaluations"]
+        assert resumed["cache"] == reference["cache"] and resumed["cache"]["hits"] > 0
+
+def test_islands_reject_checkpoint(tmp_path):
+    with pytest.raises(ValueError):
+        run_ga({**BASE, "engine": "numpy", "island_count": 2, "checkpoint_path": str(tmp_path)})
+
+def test_fresh_run_without_resume_resets_checkpoint(tmp_path):
+    config = {**BASE, "engine": "numpy", "checkpoint_path": str(tmp_path)}
+    run_ga(config)
+    result = run_ga({**config, "resume": False, "epochs": 4})
+    assert len(result["history"]) == 4
+    assert len((tmp_path / "history.jsonl").read_text().splitlines()) == 4
+
+def test_checkpoint_alternates_buffers(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path))
+    genes = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    checkpoint.save(genes, np.zeros(3), {"epoch": 1}, [{"epoch": 1}])
+    checkpoint.save(genes + 1, np.ones(3), {"epoch": 2}, [{"epoch": 2}])
+    state, loaded_genes, loaded_fitness, history = Checkpoint(str(tmp_path)).load()
+    assert state["slot"] == 1 and state["epoch"] == 2
+    assert np.array_equal(loaded_genes, genes + 1) and loaded_fitness.tolist() == [1.0, 1.0, 1.0]
+    assert history == [{"epoch": 1}, {"epoch": 2}]
+    assert np.array_equal(np.load(tmp_path / "genes-0.npy"), genes)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from backend.models.chromosome import Chromosome
+from backend.models.individual import Individual
+from backend.models.decoder import values_to_bits, bits_to_values, genes_to_bits
+from backend.services.operators import (
+    OnePointCrossover, TwoPointCrossover, OnePointMutation, BitFlipMutation, SimpleInversion
+)
+
+def test_chromosome_stores_genes_as_integer():
+    chromosome = Chromosome("0010110")
+    assert chromosome.value == 0b0010110 and chromosome.length == 7 and chromosome.gene == "0010110"
+    chromosome.flip(0)
+    assert chromosome.gene == "1010110"
+    assert chromosome.mask(1, 3) == 0b0110000
+    # Bez słownika atrybutów
+    with pytest.raises(AttributeError):
+        chromosome.extra = 1
+    with pytest.raises(AttributeError):
+        Individual(chromosome).extra = 1
+
+def test_values_and_bits_round_trip():
+    genes = ["0010110011", "1111000010", "0000000001"]
+    values = [Chromosome(gene).value for gene in genes]
+    assert np.array_equal(values_to_bits(values, 10), genes_to_bits(genes))
+    assert bits_to_values(genes_to_bits(genes)) == values
+
+def test_crossover_matches_string_slicing():
+    parent1, parent2 = Individual(Chromosome("1111111111")), Individual(Chromosome("0000000000"))
+    child1, child2 = OnePointCrossover().crossover(parent1, parent2, np.random.default_rng(0))
+    point = child1.chromosome.gene.index("0")
+    assert child1.chromosome.gene == "1" * point + "0" * (10 - point)
+    assert child2.chromosome.gene == "0" * point + "1" * (10 - point)
+    child1, _ = TwoPointCrossover().crossover(parent1, parent2, np.random.default_rng(1))
+    assert child1.chromosome.gene.count("0") in range(1, 9) and child1.chromosome.gene[0] == "1"
+    assert parent1.chromosome.gene == "1111111111"  # rodzice bez zmian
+
+def test_inversion_reverses_segment():
+    gene = "1100101000"
+    individual = Individual(Chromosome(gene))
+    inverted = SimpleInversion().invert(individual, 1.0, np.random.default_rng(5))
+    # Te same losowania co w operatorze: decyzja o inwersji, potem dwa indeksy
+    rng = np.random.default_rng(5)
+    rng.random()
+    i, j = sorted(rng.choice(10, size=2, replace=False).tolist())
+    assert inverted.chromosome.gene == gene[:i] + gene[i:j + 1][::-1] + gene[j + 1:]
+    assert inverted is not individual and individual.chromosome.gene == gene
+
+def test_mutation_in_place_only_for_unshared_offspring():
+    parent = Individual(Chromosome("1010101010"))
+    parent.fitness = 1.0
+    copy = OnePointMutation().mutate(parent, 1.0, np.random.default_rng(0))
+    assert copy is not parent and parent.chromosome.gene == "1010101010" and parent.fitness == 1.0
+    assert copy.fitness is None
+
+    child = Individual(Chromosome("1010101010"))
+    child.fitness = 1.0
+    mutated = BitFlipMutation().mutate(child, 0.5, np.random.default_rng(0), in_place=True)
+    assert mutated is child and child.chromosome.gene != "1010101010" and child.fitness is None
+    # Bez mutacji zwracany jest ten sam osobnik z zachowaną wartością fitness
+    assert OnePointMutation().mutate(parent, 0.0, np.random.default_rng(0)) is parent
@@ -0,0 +1,27 @@
+import numpy as np
+from backend.models.chromosome import Chromosome
+from backend.models.decoder import BinaryDecoder, genes_to_bits
+
+def to_gray(value):
+    return value ^ (value >> 1)
+
+def test_decode_genes_matches_chromosome():
+    genes = ["1010101010", "0000000000", "1111111111", "0110011001"]
+    decoder = BinaryDecoder((-5.12, 5.12), 10)
+    phenotypes = decoder.decode_genes(genes)
+    assert phenotypes.shape == (4, 1)
+    assert np.allclose(phenotypes[:, 0], [Chromosome(gene).decode(-5.12, 5.12) for gene in genes])
+
+def test_gray_decoding():
+    length = 8
+    values = np.arange(2**length)
+    gray_genes = [format(to_gray(int(v)), f"0{length}b") for v in values]
+    decoder = BinaryDecoder((0, 2**length - 1), length, gray=True)
+    assert np.allclose(decoder.decode(genes_to_bits(gray_genes))[:, 0], values)
+
+def test_multi_variable_segments():
+    genes = ["1010101010" + "0000000000" + "1111111111"]
+    decoder = BinaryDecoder((-5.12, 5.12), 30, num_vars=3)
+    phenotypes = decoder.decode_genes(genes)
+    assert phenotypes.shape == (1, 3)
+    assert np.allclose(phenotypes[0], Chromosome(genes[0]).decode(-5.12, 5.12, num_vars=3))
@@ -0,0 +1,41 @@
+import numpy as np
+from backend.models.fitness import FITNESS_FUNCTIONS, HyperellipsoidFitness, get_fitness_function
+from domain.problem_function import hyperelipsoid
+
+def double_loop_hyperellipsoid(x):
+    return sum(x[j] ** 2 for i in range(len(x)) for j in range(i + 1))
+
+def test_hyperellipsoid_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-65.536, 65.536, size=(20, 15))
+    fitness_function = HyperellipsoidFitness(num_vars=15, search_range=(-65.536, 65.536))
+    batch = fitness_function.evaluate_batch(X)
+    assert np.allclose(batch, [fitness_function.evaluate(x) for x in X.tolist()])
+    assert np.allclose(batch, [double_loop_hyperellipsoid(x) for x in X.tolist()])
+    assert fitness_function.evaluate_batch(np.zeros((3, 15))).tolist() == [0.0, 0.0, 0.0]
+
+def test_domain_hyperelipsoid_unchanged():
+    x = [1.5, -2.0, 3.0, 0.5]
+    expected = sum(x[j] ** 2 for i in range(len(x)) for j in range(i))
+    assert np.isclose(hyperelipsoid(x), expected)
+
+def test_registry_batch_matches_scalar_reference():
+    rng = np.random.default_rng(1)
+    for name, fitness_class in FITNESS_FUNCTIONS.items():
+        fitness_function = get_fitness_function(name, num_vars=8)
+        assert isinstance(fitness_function, fitness_class)
+        a, b = fitness_function.search_range
+        X = rng.uniform(a, b, size=(25, 8))
+        batch = fitness_function.evaluate_batch(X)
+        reference = [fitness_function.evaluate(x) for x in X.tolist()]
+        assert np.allclose(batch, reference), name
+
+def test_registry_optimum_metadata():
+    for name in FITNESS_FUNCTIONS:
+        fitness_function = get_fitness_function(name, num_vars=5)
+        optimum = np.array([fitness_function.optimum_position()])
+        assert np.isclose(fitness_function.evaluate_batch(optimum)[0], fitness_function.optimum_value, atol=1e-4), name
+        assert np.isclose(fitness_function.evaluate(optimum[0].tolist()), fitness_function.optimum_value, atol=1e-4), name
+
+def test_unknown_function_falls_back_to_hyperellipsoid():
+    assert isinstance(get_fitness_function("unknown", num_vars=3), HyperellipsoidFitness)
@@ -0,0 +1,29 @@
+from backend.models.fitness_cache import FitnessCache
+from backend.services.ga_service import run_ga
+
+def test_lru_eviction_and_counters():
+    cache = FitnessCache(maxsize=2)
+    cache.put("00", 1.0)
+    cache.put("01", 2.0)
+    assert cache.get("00") == 1.0  # "01" staje się najdawniej używanym wpisem
+    cache.put("10", 3.0)
+    assert cache.get("01") is None
+    assert cache.get("10") == 3.0
+    assert len(cache) == 2
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+def test_known_fitness_is_not_evaluated_again():
+    config = {"population_size": 20, "epochs": 10, "variables": 2, "elitism_count": 2,
+              "crossover_probability": 0.0, "mutation_probability": 0.0, "inversion_probability": 0.0}
+    # Bez krzyżowania, mutacji i inwersji potomkowie są kopiami rodziców – ocenia się tylko populację startową
+    assert run_ga(dict(config, engine="numpy"))["evaluations"] == 20
+    for engine in ("object", "numpy"):
+        assert run_ga(dict(config, engine=engine, fitness_cache_size=100))["evaluations"] == 20
+
+def test_cache_reported_in_result():
+    for engine in ("object", "numpy"):
+        result = run_ga({"engine": engine, "population_size": 20, "epochs": 10, "variables": 1,
+                         "precision": 1, "fitness_cache_size": 100})
+        assert result["cache"]["hits"] > 0
+        assert result["cache"]["size"] <= 100
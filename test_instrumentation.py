@@ -0,0 +1,39 @@
+from flask import Flask
+from backend.controllers.ga_controller import ga_blueprint
+from backend.services.ga_service import run_ga
+from backend.services.instrumentation import STAGES
+
+BASE = {"population_size": 12, "epochs": 4, "variables": 2, "seed": 3}
+
+def test_instrumented_run_reports_stage_times():
+    for engine in ("object", "numpy"):
+        result = run_ga({**BASE, "engine": engine, "instrument": True, "track_allocations": True})
+        metrics = result["metrics"]
+        assert metrics["epochs"] == 4
+        assert set(metrics["stages"]) == set(STAGES)
+        assert all(values["total"] >= values["max"] >= 0 for values in metrics["stages"].values())
+        # Populacja początkowa oceniana jest w pierwszej epoce, więc pomiary obejmują wszystkie oceny
+        assert metrics["evaluations"]["total"] == result["evaluations"]
+        allocations = metrics["allocations"]
+        assert allocations["peak_bytes"] >= allocations["max_bytes_per_epoch"] >= allocations["bytes_per_epoch"] > 0
+        assert "net_retained_blocks_per_epoch" in allocations
+
+def test_instrumentation_is_off_by_default_and_does_not_change_history():
+    plain = run_ga({**BASE, "engine": "numpy"})
+    instrumented = run_ga({**BASE, "engine": "numpy", "instrument": True})
+    assert "metrics" not in plain and "profile" not in plain
+    assert plain["history"] == instrumented["history"]
+
+def test_profile_and_metrics_endpoint(tmp_path):
+    result = run_ga({**BASE, "profile": True, "profile_limit": 5})
+    assert "evolve" in result["profile"]
+
+    app = Flask(__name__)
+    app.config["GA_RESULTS_DIR"] = str(tmp_path)
+    app.register_blueprint(ga_blueprint)
+    client = app.test_client()
+    client.post("/api/ga/run", json={**BASE, "instrument": True})
+    client.post("/api/ga/run", json=BASE)
+    summary = client.get("/api/ga/metrics").get_json()
+    assert summary["runs"] == 1 and summary["epochs"] == 4
+    assert len(summary["recent"]) == 1
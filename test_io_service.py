@@ -0,0 +1,67 @@
+import json
+import sqlite3
+import numpy as np
+import pytest
+from flask import Flask
+from backend.controllers.ga_controller import ga_blueprint
+from backend.services.io_service import (
+    JsonSink, JsonLinesSink, NpzSink, SqliteSink, ResultSink, ResultWriter, load_history, split_history
+)
+
+RESULT = {
+    "function": "hyperellipsoid",
+    "best_fitness": 0.5,
+    "best_individual": [0.1, -0.2],
+    "history": [{"x": [1.0, 2.0], "fitness": 9.0}, {"x": [0.1, -0.2], "fitness": 0.5}],
+    "evaluations": 20,
+    "time": 0.01
+}
+
+def test_split_history():
+    summary, x, fitness = split_history(RESULT)
+    assert "history" not in summary
+    assert x.shape == (2, 2)
+    assert fitness.tolist() == [9.0, 0.5]
+
+def test_sinks_in_background_writer(tmp_path):
+    writer = ResultWriter([JsonSink(tmp_path / "json"), JsonLinesSink(str(tmp_path / "runs.jsonl")),
+                           NpzSink(tmp_path / "npz"), SqliteSink(str(tmp_path / "runs.db"))])
+    run_id = writer.submit(RESULT)
+    writer.close()
+
+    assert json.loads((tmp_path / "json" / f"{run_id}.json").read_text()) == RESULT
+    line = json.loads((tmp_path / "runs.jsonl").read_text())
+    assert line["run_id"] == run_id and "history" not in line
+    x, fitness = load_history(tmp_path / "npz", run_id)
+    assert np.array_equal(x, [[1.0, 2.0], [0.1, -0.2]]) and fitness.tolist() == [9.0, 0.5]
+    with sqlite3.connect(tmp_path / "runs.db") as connection:
+        assert connection.execute("SELECT best_fitness FROM results WHERE run_id = ?", (run_id,)).fetchone() == (0.5,)
+
+class FailingSink(ResultSink):
+    def write(self, run_id, result):
+        raise OSError("disk full")
+
+def test_writer_logs_sink_failures(tmp_path, caplog):
+    with pytest.raises(TypeError):
+        ResultSink()
+    writer = ResultWriter([FailingSink(), NpzSink(tmp_path)])
+    run_id = writer.submit(RESULT)
+    writer.close()
+    assert load_history(tmp_path, run_id) is not None
+    record = caplog.records[-1]
+    assert run_id in record.getMessage() and "FailingSink" in record.getMessage() and record.exc_info
+
+def test_run_persists_in_background_and_plots_on_demand(tmp_path):
+    app = Flask(__name__)
+    app.config["GA_RESULTS_DIR"] = str(tmp_path)
+    app.register_blueprint(ga_blueprint)
+    client = app.test_client()
+
+    run_id = client.post("/api/ga/run", json={"population_size": 10, "epochs": 3, "variables": 2}).get_json()["run_id"]
+    app.extensions["ga_results"].flush()
+    assert (tmp_path / f"{run_id}.npz").exists()
+    assert not (tmp_path / f"{run_id}.png").exists()
+
+    response = client.get(f"/api/ga/results/{run_id}/plot")
+    assert response.status_code == 200 and response.mimetype == "image/png"
+    assert client.get("/api/ga/results/missing/plot").status_code == 404
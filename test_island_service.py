@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from backend.services.island_service import migration_sources
+from backend.services.ga_service import run_ga
+
+def test_migration_sources():
+    assert migration_sources(4, "ring", np.random.default_rng(0)) == [3, 0, 1, 2]
+    sources = migration_sources(5, "random", np.random.default_rng(0))
+    assert all(source != i for i, source in enumerate(sources))
+
+def test_run_islands():
+    result = run_ga({
+        "population_size": 20, "epochs": 7, "variables": 3, "migration_interval": 3,
+        "islands": [{"selection_method": "tournament"}, {"selection_method": "roulette", "crossover_method": "uniform"}]
+    })
+    assert len(result["islands"]) == 2
+    assert result["islands"][1]["selection_method"] == "roulette"
+    assert all(len(island["history"]) == 7 for island in result["islands"])
+    assert len(result["history"]) == 7
+    assert result["migrations"] == 2
+    assert result["best_fitness"] == min(island["best_fitness"] for island in result["islands"])
+
+def test_unsupported_island_options_are_rejected():
+    base = {"population_size": 10, "epochs": 2, "island_count": 2}
+    for overrides in ({"engine": "object"}, {"workers": 2}, {"fitness_cache_size": 10}, {"encoding": "real"}):
+        with pytest.raises(ValueError):
+            run_ga({**base, **overrides})
+    with pytest.raises(ValueError):
+        run_ga({**base, "islands": [{}, {"engine": "object"}]})
@@ -0,0 +1,67 @@
+import time
+import pytest
+from backend.services.job_service import JobManager, QueueFullError
+
+def wait_for(manager, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("Zlecenie nie zakończyło się na czas.")
+
+def test_job_runs_in_background():
+    manager = JobManager(max_workers=1, max_queue=4, persist=False)
+    job_id = manager.submit({"engine": "numpy", "population_size": 10, "epochs": 3, "variables": 2})
+    assert manager.get(job_id)["status"] in ("queued", "running")
+    job = wait_for(manager, job_id)
+    assert job["status"] == "finished"
+    assert len(job["result"]["history"]) == 3
+    assert manager.get("unknown") is None
+
+def test_queue_limit_cancel_and_timeout():
+    manager = JobManager(max_workers=1, max_queue=1, timeout=1.0, persist=False)
+    long_config = {"engine": "object", "population_size": 200, "epochs": 100000, "variables": 10}
+    running = manager.submit(long_config)
+    while manager.get(running)["status"] == "queued":
+        time.sleep(0.01)
+    queued = manager.submit(long_config)
+    with pytest.raises(QueueFullError):
+        manager.submit(long_config)
+
+    assert manager.cancel(queued)
+    assert manager.get(queued)["status"] == "cancelled"
+    assert not manager.cancel(queued)
+    # Anulowane zlecenie zwalnia miejsce w kolejce
+    replacement = manager.submit(long_config)
+    assert manager.cancel(replacement)
+
+    # Zlecenie wykonywane zostaje przerwane po przekroczeniu limitu czasu
+    assert wait_for(manager, running)["status"] == "timeout"
+
+def test_job_results_use_configured_sinks(tmp_path):
+    manager = JobManager(max_workers=1, max_queue=4, result_sinks=["jsonl"], results_dir=str(tmp_path))
+    job_id = manager.submit({"engine": "numpy", "population_size": 10, "epochs": 2, "variables": 2})
+    assert wait_for(manager, job_id)["status"] == "finished"
+    assert (tmp_path / "results.jsonl").exists()
+    assert not list(tmp_path.glob("*.npz"))
+
+def test_jobs_with_islands_and_parallel_evaluation():
+    manager = JobManager(max_workers=2, max_queue=4, persist=False)
+    base = {"engine": "numpy", "population_size": 10, "epochs": 4, "variables": 2, "seed": 1}
+    islands = manager.submit({**base, "island_count": 2, "migration_interval": 2})
+    parallel = manager.submit({**base, "workers": 2})
+    for job_id in (islands, parallel):
+        job = wait_for(manager, job_id)
+        assert job["status"] == "finished", job.get("error")
+        assert len(job["result"]["history"]) == 4
+
+def test_dispatcher_survives_failed_start():
+    manager = JobManager(max_workers=1, max_queue=4, persist=False)
+    # Konfiguracji z funkcją lambda nie da się przesłać do procesu "spawn"
+    broken = manager.submit({"engine": "numpy", "callback": lambda: None})
+    job = wait_for(manager, broken)
+    assert job["status"] == "failed" and job["error"]
+    job_id = manager.submit({"engine": "numpy", "population_size": 10, "epochs": 2, "variables": 2})
+    assert wait_for(manager, job_id)["status"] == "finished"
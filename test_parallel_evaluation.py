@@ -0,0 +1,18 @@
+import numpy as np
+from backend.models.fitness import get_fitness_function
+from backend.services.parallel_evaluation import ParallelEvaluator
+from backend.services.ga_service import run_ga
+
+def test_parallel_matches_serial():
+    fitness_function = get_fitness_function("rastrigin", num_vars=6)
+    X = np.random.default_rng(0).uniform(-5.12, 5.12, size=(101, 6))
+    with ParallelEvaluator(fitness_function, workers=2, chunk_size=16) as evaluator:
+        assert np.array_equal(evaluator.evaluate_batch(X), fitness_function.evaluate_batch(X))
+        # Mniejsza partia korzysta z tych samych buforów
+        assert np.array_equal(evaluator.evaluate_batch(X[:40]), fitness_function.evaluate_batch(X[:40]))
+        assert evaluator.name == "rastrigin"
+
+def test_run_ga_with_workers():
+    result = run_ga({"engine": "numpy", "population_size": 40, "epochs": 3, "variables": 4,
+                     "workers": 2, "chunk_size": 10})
+    assert len(result["history"]) == 3
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from backend.profiling import parse_import_times
+
+def test_parse_import_times():
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     _json",
+        "import time:      1500 |       1620 |   json",
+        "import time:       300 |       1920 | app",
+    ])
+    entries = parse_import_times(output)
+    assert [entry["module"] for entry in entries] == ["_json", "json", "app"]
+    assert [entry["depth"] for entry in entries] == [2, 1, 0]
+    assert entries[1]["self_ms"] == 1.5 and entries[2]["cumulative_ms"] == 1.92
+
+def test_create_app_does_not_import_numerical_stack():
+    statement = ("import sys; from app import create_app; create_app(); "
+                 "print(sorted(name for name in ('numpy', 'matplotlib') if name in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
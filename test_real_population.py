@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from backend.models.real_population import RealPopulation
+from backend.services.ga_service import run_ga, iter_ga
+from backend.services.batch_operators import BatchTournamentSelection
+from backend.services.real_operators import (
+    ArithmeticCrossover, BlendCrossover, SimulatedBinaryCrossover, GaussianMutation, PolynomialMutation
+)
+
+def test_crossover_operators_keep_shape():
+    rng = np.random.default_rng(0)
+    parents1, parents2 = rng.uniform(-1, 1, (8, 3)), rng.uniform(-1, 1, (8, 3))
+    for operator in (ArithmeticCrossover(), BlendCrossover(0.5), SimulatedBinaryCrossover(15)):
+        child1, child2 = operator.crossover(parents1, parents2, rng)
+        assert child1.shape == child2.shape == (8, 3)
+    # Krzyżowanie arytmetyczne nie wychodzi poza przedział wyznaczony przez rodziców
+    child1, _ = ArithmeticCrossover().crossover(parents1, parents2, rng)
+    assert np.all(child1 >= np.minimum(parents1, parents2) - 1e-12)
+    assert np.all(child1 <= np.maximum(parents1, parents2) + 1e-12)
+    # SBX zachowuje średnią rodziców
+    child1, child2 = SimulatedBinaryCrossover(15).crossover(parents1, parents2, rng)
+    assert np.allclose(child1 + child2, parents1 + parents2)
+
+def test_mutation_operators_respect_probability():
+    rng = np.random.default_rng(1)
+    for operator in (GaussianMutation(0.1), PolynomialMutation(20)):
+        genes = np.zeros((50, 4))
+        operator.mutate(genes, (-1, 1), 0.0, rng)
+        assert not genes.any()
+        operator.mutate(genes, (-1, 1), 1.0, rng)
+        assert np.all(genes != 0)
+
+def test_offspring_are_clipped_to_search_range():
+    population = RealPopulation(30, (-1.0, 1.0), num_vars=3, rng=np.random.default_rng(2))
+    population.initialize()
+    population.fitness = np.arange(30, dtype=float)
+    offspring, fitness = population.breed(30, BatchTournamentSelection(3), BlendCrossover(5.0),
+                                          GaussianMutation(1.0), None, 1.0, 1.0, 0.0)
+    assert offspring.shape == (30, 3) and np.all(np.abs(offspring) <= 1.0)
+    assert np.isnan(fitness).all()
+
+@pytest.mark.parametrize("crossover_method", ["arithmetic", "blx", "sbx"])
+@pytest.mark.parametrize("mutation_method", ["gaussian", "polynomial"])
+def test_run_ga_with_real_encoding(crossover_method, mutation_method):
+    config = {"encoding": "real", "population_size": 30, "variables": 3, "epochs": 20, "seed": 4,
+              "crossover_method": crossover_method, "mutation_method": mutation_method}
+    result = run_ga(config)
+    assert len(result["history"]) == 20 and len(result["best_individual"]) == 3
+    assert result["history"][-1]["fitness"] <= result["history"][0]["fitness"]
+    assert run_ga(config)["best_fitness"] == result["best_fitness"]
+
+def test_real_encoding_supports_replacement_cache_and_checkpoint(tmp_path):
+    base = {"encoding": "real", "population_size": 20, "variables": 2, "epochs": 8, "seed": 6}
+    assert run_ga({**base, "replacement": "steady_state", "offspring_count": 4})["epochs"] == 8
+    assert run_ga({**base, "fitness_cache_size": 100})["best_fitness"] == run_ga(base)["best_fitness"]
+
+    reference = run_ga(base)
+    config = {**base, "checkpoint_path": str(tmp_path), "checkpoint_interval": 3}
+    stream = iter_ga(config)
+    for _ in range(5):
+        next(stream)
+    stream.close()
+    assert run_ga(config)["history"] == reference["history"]
+
+def test_islands_reject_real_encoding():
+    with pytest.raises(ValueError):
+        run_ga({"encoding": "real", "island_count": 2, "population_size": 10, "epochs": 2})
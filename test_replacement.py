@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from backend.services.ga_service import (
+    run_ga, create_fitness_function, create_bit_population, build_batch_operators, build_object_operators
+)
+from backend.models.population import Population
+from backend.services.replacement import offspring_plan
+
+def test_offspring_plan():
+    assert offspring_plan("steady_state", 20, 2, 4) == (4, 5)  # 18 potomków w krokach po 4
+    assert offspring_plan("mu_plus_lambda", 20, 2, None) == (20, 1)
+    assert offspring_plan("mu_comma_lambda", 20, 2, 5) == (18, 1)  # lambda uzupełnia populację poza elitami
+    with pytest.raises(ValueError):
+        offspring_plan("unknown", 20, 2)
+
+@pytest.mark.parametrize("engine", ["numpy", "object"])
+@pytest.mark.parametrize("replacement", ["steady_state", "mu_plus_lambda", "mu_comma_lambda"])
+def test_incremental_strategies(engine, replacement):
+    config = {"engine": engine, "population_size": 20, "variables": 2, "epochs": 15, "seed": 3,
+              "replacement": replacement, "offspring_count": 4}
+    result = run_ga(config)
+    assert result["epochs"] == 15 and len(result["history"]) == 15
+    # Oceniani są wyłącznie nowi potomkowie – nie więcej niż population_size + potomkowie każdej epoki
+    step = 4 if replacement != "mu_comma_lambda" else 18
+    steps = 5 if replacement == "steady_state" else 1
+    assert result["evaluations"] <= 20 + 15 * step * steps
+    assert run_ga(config)["best_fitness"] == result["best_fitness"]
+
+def test_plus_strategy_keeps_population_sorted_and_never_worsens():
+    config = {"engine": "numpy", "population_size": 30, "variables": 3}
+    fitness_function = create_fitness_function(config)
+    population = create_bit_population(config, fitness_function, rng=np.random.default_rng(0))
+    operators = build_batch_operators(config)
+    population.evaluate(fitness_function)
+    previous = population.fitness.min()
+    for _ in range(10):
+        population.evolve(fitness_function, *operators, 0.8, 0.3, 0.3, 2, replacement="mu_plus_lambda")
+        assert len(population.fitness) == 30 and np.all(np.diff(population.fitness) >= 0)
+        assert population.fitness[0] <= previous
+        previous = population.fitness[0]
+
+class CountingSelection:
+    def __init__(self, operator):
+        self.operator = operator
+        self.calls = 0
+
+    def select(self, *args, **kwargs):
+        self.calls += 1
+        return self.operator.select(*args, **kwargs)
+
+@pytest.mark.parametrize("engine", ["numpy", "object"])
+def test_steady_state_selects_once_per_epoch_and_replaces_worst(engine):
+    config = {"engine": engine, "population_size": 30, "variables": 3}
+    fitness_function = create_fitness_function(config)
+    rng = np.random.default_rng(0)
+    if engine == "numpy":
+        population = create_bit_population(config, fitness_function, rng=rng)
+        selection, *operators = build_batch_operators(config)
+        fitness = lambda: population.fitness
+    else:
+        population = Population(30, fitness_function.search_range, num_vars=3, rng=rng)
+        population.initialize(30)
+        selection, *operators = build_object_operators(config)
+        fitness = lambda: np.array([ind.fitness for ind in population.individuals])
+    selection = CountingSelection(selection)
+    population.evaluate(fitness_function)
+    elite = np.sort(fitness())[:2]
+    population.evolve(fitness_function, selection, *operators, 0.8, 0.3, 0.3, 2,
+                      replacement="steady_state", offspring_count=2)
+    # Jedna selekcja na epokę (14 kroków po 2 potomków), elity nie są zastępowane
+    assert selection.calls == 1
+    assert len(fitness()) == 30 and np.all(np.sort(fitness())[:2] <= elite)
+    assert population.best_solution()[1] == fitness().min()
+
+def test_unknown_replacement_rejected():
+    with pytest.raises(ValueError):
+        run_ga({"population_size": 10, "epochs": 2, "replacement": "tournament"})
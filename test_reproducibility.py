@@ -0,0 +1,34 @@
+import numpy as np
+from backend.models.chromosome import Chromosome
+from backend.models.individual import Individual
+from backend.services.ga_service import run_ga
+from backend.services.operators import UniformCrossover, TwoPointMutation, SimpleInversion
+
+BASE = {"population_size": 16, "epochs": 6, "variables": 3}
+
+def history(config):
+    return [entry["fitness"] for entry in run_ga(config)["history"]]
+
+def test_same_seed_gives_same_history():
+    for overrides in ({"engine": "object", "crossover_method": "uniform", "mutation_method": "bit_flip"},
+                      {"engine": "numpy", "selection_method": "rank"},
+                      {"engine": "numpy", "workers": 2, "chunk_size": 4},
+                      {"island_count": 2, "migration_interval": 2}):
+        config = {**BASE, **overrides, "seed": 42}
+        assert history(config) == history(config)
+        assert history(config) != history({**config, "seed": 43})
+
+def test_parallel_evaluation_does_not_change_history():
+    config = {**BASE, "engine": "numpy", "seed": 7}
+    assert history(config) == history({**config, "workers": 2, "chunk_size": 4})
+
+def test_operators_use_passed_generator():
+    parent1, parent2 = Individual(Chromosome("0" * 32)), Individual(Chromosome("1" * 32))
+    genes = []
+    for _ in range(2):
+        rng = np.random.default_rng(3)
+        child1, child2 = UniformCrossover().crossover(parent1, parent2, rng)
+        child1 = TwoPointMutation().mutate(child1, 1.0, rng)
+        child1 = SimpleInversion().invert(child1, 1.0, rng)
+        genes.append((child1.chromosome.gene, child2.chromosome.gene, Chromosome.random(16, rng).gene))
+    assert genes[0] == genes[1]
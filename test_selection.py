@@ -0,0 +1,44 @@
+import numpy as np
+from backend.services.batch_operators import *
+
+def test_tournament_winner_is_best_of_its_tournament():
+    fitness = np.array([5.0, 1.0, 3.0, 4.0, 2.0, 0.5])
+    selected = BatchTournamentSelection(tournament_size=len(fitness) * 4).select(fitness, np.random.default_rng(0))
+    # Przy bardzo dużym turnieju niemal zawsze wygrywa najlepszy osobnik
+    assert selected.shape == (6,)
+    assert np.mean(selected == 5) > 0.9
+
+def test_roulette_and_sus_follow_weights():
+    fitness = np.array([0.0, 10.0, 10.0, 10.0])  # wagi: 10, ~0, ~0, ~0
+    rng = np.random.default_rng(1)
+    assert np.all(BatchRouletteSelection().select(fitness, rng) == 0)
+    assert np.all(BatchStochasticUniversalSampling().select(fitness, rng) == 0)
+
+def test_sus_has_minimal_spread():
+    fitness = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    weights = roulette_weights(fitness)
+    expected = weights / weights.sum() * len(fitness)
+    counts = np.bincount(BatchStochasticUniversalSampling().select(fitness, np.random.default_rng(2)), minlength=8)
+    assert np.all(np.abs(counts - expected) < 1)
+
+def test_rank_selection_prefers_better_ranks():
+    fitness = np.arange(100, dtype=float)
+    selected = BatchRankSelection(selection_pressure=2.0).select(fitness, np.random.default_rng(3))
+    assert selected.shape == (100,)
+    assert np.mean(selected) < 45
+
+def test_smallest_indices_matches_full_sort():
+    fitness = np.random.default_rng(4).random(1000)
+    for n in (0, 1, 7, 1000, 1200):
+        assert np.array_equal(smallest_indices(fitness, n), np.argsort(fitness)[:n])
+
+def test_batch_tournament_samples_without_replacement():
+    rng = np.random.default_rng(0)
+    tournaments = sample_without_replacement(10, 4, 2000, rng)
+    assert all(len(set(row)) == 4 for row in tournaments.tolist())
+    # Rozkład jednostajny – każdy indeks pojawia się mniej więcej równie często
+    counts = np.bincount(tournaments.ravel(), minlength=10)
+    assert counts.min() > 0.8 * counts.mean()
+    # Turniej obejmujący całą populację zawsze wygrywa najlepszy osobnik
+    fitness = np.array([3.0, 1.0, 2.0])
+    assert (BatchTournamentSelection(3).select(fitness, rng) == 1).all()
@@ -0,0 +1,35 @@
+from backend.services.ga_service import run_ga
+from backend.services.stopping import StoppingCriteria
+
+def snapshot(fitness, diversity=0.5, elapsed=0.0):
+    return {"fitness": fitness, "diversity": diversity, "elapsed": elapsed}
+
+def test_patience_counts_epochs_without_improvement():
+    criteria = StoppingCriteria(patience=2, min_improvement=0.1)
+    assert criteria.check(snapshot(10.0), 10) is None
+    assert criteria.check(snapshot(9.95), 20) is None  # poprawa mniejsza niż min_improvement
+    assert criteria.check(snapshot(9.9), 30) == "patience"
+
+def test_other_criteria():
+    assert StoppingCriteria(target_fitness=1.0).check(snapshot(0.5), 1) == "target"
+    assert StoppingCriteria(max_evaluations=100).check(snapshot(5.0), 100) == "max_evaluations"
+    assert StoppingCriteria(time_limit=1.0).check(snapshot(5.0, elapsed=2.0), 1) == "time_limit"
+    assert StoppingCriteria(min_diversity=0.1).check(snapshot(5.0, diversity=0.05), 1) == "diversity"
+    assert StoppingCriteria().check(snapshot(5.0), 1) is None
+
+def test_run_ga_reports_stop_reason():
+    base = {"engine": "numpy", "population_size": 10, "variables": 2, "seed": 1}
+    result = run_ga({**base, "epochs": 5})
+    assert result["stop_reason"] == "epochs" and result["epochs"] == 5
+
+    result = run_ga({**base, "epochs": 500, "target_fitness": 1e12})
+    assert result["stop_reason"] == "target" and len(result["history"]) == 1
+
+    result = run_ga({**base, "epochs": 500, "max_evaluations": 50})
+    assert result["stop_reason"] == "max_evaluations" and result["evaluations"] >= 50
+    assert result["epochs"] < 500
+
+    result = run_ga({**base, "island_count": 2, "epochs": 50, "migration_interval": 5, "patience": 1,
+                     "min_improvement": 1e12})
+    # Przebieg kończy się w epoce, w której zadziałało kryterium, a nie na końcu paczki migracji
+    assert result["stop_reason"] == "patience" and result["epochs"] == 2 and len(result["history"]) == 2
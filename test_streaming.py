@@ -0,0 +1,47 @@
+import json
+from flask import Flask
+from backend.controllers.ga_controller import ga_blueprint
+from backend.services.ga_service import iter_ga, run_ga
+
+def collect(stream):
+    snapshots = []
+    while True:
+        try:
+            snapshots.append(next(stream))
+        except StopIteration as stop:
+            return snapshots, stop.value
+
+def test_iter_ga_yields_epoch_snapshots():
+    for engine in ("object", "numpy"):
+        snapshots, summary = collect(iter_ga({"engine": engine, "population_size": 12, "epochs": 4, "variables": 2}))
+        assert [snapshot["epoch"] for snapshot in snapshots] == [1, 2, 3, 4]
+        for snapshot in snapshots:
+            assert snapshot["fitness"] <= snapshot["mean"]
+            assert 0.0 <= snapshot["diversity"] <= 1.0
+            assert len(snapshot["x"]) == 2
+        assert "history" not in summary
+        assert summary["best_fitness"] == min(snapshot["fitness"] for snapshot in snapshots)
+
+def test_islands_stream_and_run_ga_history():
+    config = {"island_count": 2, "population_size": 10, "epochs": 5, "migration_interval": 2, "variables": 2}
+    snapshots, summary = collect(iter_ga(config))
+    assert [snapshot["epoch"] for snapshot in snapshots] == [1, 2, 3, 4, 5]
+    assert all(len(snapshot["islands"]) == 2 for snapshot in snapshots)
+    assert summary["migrations"] == 2
+
+    result = run_ga({"population_size": 10, "epochs": 3, "variables": 2})
+    assert len(result["history"]) == 3
+
+def test_stream_endpoint_ndjson_and_sse():
+    app = Flask(__name__)
+    app.register_blueprint(ga_blueprint)
+    client = app.test_client()
+    config = {"engine": "numpy", "population_size": 10, "epochs": 3, "variables": 2}
+
+    response = client.post("/api/ga/stream?format=ndjson", json=config)
+    events = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [event["event"] for event in events] == ["epoch"] * 3 + ["result"]
+
+    response = client.post("/api/ga/stream", json=config)
+    assert response.mimetype == "text/event-stream"
+    assert response.data.decode().count("event: epoch\n") == 3
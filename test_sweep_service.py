@@ -0,0 +1,59 @@
+import os
+import pytest
+from flask import Flask
+from backend.controllers.ga_controller import ga_blueprint
+from backend.services.sweep_service import expand_grid, run_sweep, summarize, resolve_processes, resolve_seeds
+
+def test_expand_grid():
+    variants = expand_grid({"epochs": 5}, grid={"tournament_size": [2, 3], "crossover_method": ["one_point", "uniform"]})
+    assert len(variants) == 4
+    assert variants[0] == ({"tournament_size": 2, "crossover_method": "one_point"},
+                           {"epochs": 5, "tournament_size": 2, "crossover_method": "one_point"})
+    assert expand_grid({"epochs": 5}, configs=[{"engine": "numpy"}])[0][1] == {"epochs": 5, "engine": "numpy"}
+
+def test_summarize():
+    statistics = summarize([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert statistics["median"] == 3.0
+    assert statistics["iqr"] == 2.0
+    assert summarize([])["median"] is None
+
+def test_run_sweep_aggregates_replicates():
+    request = {
+        "base": {"engine": "numpy", "population_size": 10, "epochs": 5, "variables": 2},
+        "grid": {"mutation_method": ["one_point", "bit_flip"]},
+        "seeds": [1, 2, 1],
+        "target": 1e12,
+        "processes": 2
+    }
+    result = run_sweep(request)
+    assert result["configurations"] == 2 and result["runs"] == 6
+    for entry in result["results"]:
+        assert entry["replicates"] == 3
+        assert entry["success_rate"] == 1.0
+        assert entry["epochs_to_target"]["median"] == 1
+        # Ten sam seed daje ten sam wynik
+        assert entry["runs"][0]["best_fitness"] == entry["runs"][2]["best_fitness"]
+
+def test_processes_are_validated_and_clamped():
+    assert resolve_processes(None) == (os.cpu_count() or 1)
+    assert resolve_processes(10_000) == (os.cpu_count() or 1)
+    for value in (0, -3, "4", 2.5):
+        with pytest.raises(ValueError):
+            resolve_processes(value)
+    app = Flask(__name__)
+    app.register_blueprint(ga_blueprint)
+    response = app.test_client().post("/api/ga/sweep", json={"base": {"epochs": 1}, "processes": 0})
+    assert response.status_code == 400
+
+def test_replicates_and_seeds_are_validated():
+    assert resolve_seeds({}) == [0, 1, 2, 3, 4]
+    assert resolve_seeds({"seeds": [7, 9]}) == [7, 9]
+    for request in ({"replicates": 0}, {"replicates": -1}, {"replicates": True}, {"seeds": []}):
+        with pytest.raises(ValueError):
+            resolve_seeds(request)
+    with pytest.raises(ValueError):
+        run_sweep({"base": {"epochs": 1}, "replicates": 0, "target": 1.0})
+    app = Flask(__name__)
+    app.register_blueprint(ga_blueprint)
+    response = app.test_client().post("/api/ga/sweep", json={"base": {"epochs": 1}, "replicates": 0, "target": 1.0})
+    assert response.status_code == 400